@@ -16,16 +16,17 @@ Functions:
     e2p_binary: Convenience function for binary analysis (empirical)
     e2p_continuous: Convenience function for continuous analysis (empirical)
     e2p_parametric_binary: Compute metrics from Cohen's d (parametric)
+    e2p_parametric_binary_batch: Vectorized e2p_parametric_binary over arrays
     e2p_parametric_continuous: Compute metrics from Pearson's r (parametric)
 """
 
 from .core import MetricWithCI, BinaryResults
 from .binary import E2PBinary, e2p_binary, e2p_binary_deattenuated
 from .continuous import E2PContinuous, e2p_continuous, e2p_continuous_deattenuated
-from .plotting import plot_binary_deattenuated, plot_continuous_deattenuated
 from .parametric import (
     ParametricResults,
     e2p_parametric_binary,
+    e2p_parametric_binary_batch,
     e2p_parametric_continuous,
     compute_roc_auc_parametric,
     compute_pr_auc_parametric,
@@ -64,6 +65,7 @@ __all__ = [
     # Parametric
     'ParametricResults',
     'e2p_parametric_binary',
+    'e2p_parametric_binary_batch',
     'e2p_parametric_continuous',
     'compute_roc_auc_parametric',
     'compute_pr_auc_parametric',
@@ -85,3 +87,16 @@ __all__ = [
 ]
 
 __version__ = '0.1.0'
+
+# Plotting helpers pull in matplotlib; resolve them on first access (PEP 562)
+# so that `import e2p` and the CLI stay fast.
+_LAZY_PLOTTING = ('plot_binary_deattenuated', 'plot_continuous_deattenuated')
+
+
+def __getattr__(name):
+    if name in _LAZY_PLOTTING:
+        from . import plotting
+        value = getattr(plotting, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
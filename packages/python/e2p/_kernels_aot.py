@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the scalar parametric kernels.
+
+Compiles the kernels from ``_numba_kernels`` into a plain extension module,
+``e2p._kernels``, that imports without Numba and without any JIT or cache
+loading at startup. Requires Numba at build time only::
+
+    python -m e2p._kernels_aot
+
+When the extension is present, ``_numba_kernels`` uses it in preference to
+the JIT versions; when it is absent, nothing changes.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from . import _numba_kernels as kernels
+
+cc = CC("_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    "threshold_from_pt", "float64(float64, float64, float64, float64, float64)"
+)(kernels._threshold_from_pt)
+cc.export(
+    "optimal_threshold", "float64(float64, float64, float64, float64, boolean)"
+)(kernels._optimal_threshold)
+cc.export(
+    "pr_auc_normal", "float64(float64, float64, float64, float64, int64)"
+)(kernels._pr_auc_normal)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,546 @@
+"""
+Optional Numba-compiled kernels.
+
+Numba is not a required dependency. When it is missing, ``NUMBA_AVAILABLE`` is
+False and callers keep using their NumPy implementations. The scalar
+parametric kernels may also come from an ahead-of-time built extension, so
+callers test those for ``None`` rather than checking ``NUMBA_AVAILABLE``.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    import ctypes
+    from numba.extending import get_cython_function_address
+
+    # C-level double ndtr(double) from scipy.special.cython_special, callable
+    # from nopython code without crossing back into the interpreter.
+    _ndtr_scalar = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double)(
+        get_cython_function_address("scipy.special.cython_special", "__pyx_fuse_1ndtr")
+    )
+else:
+    def _ndtr_scalar(x):
+        # Imported on use so that ``import e2p`` does not load scipy.special
+        from scipy.special import ndtr
+        return ndtr(x)
+
+
+# Module constants are frozen into compiled kernels at compile time
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _survival_mass(means: np.ndarray, weights: np.ndarray,
+                   thresholds: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Weighted normal survival mass ``sum_j w_j * (1 - Phi((t - m_j) / sigma))``
+    for each threshold ``t``, fused into one loop with no temporaries.
+    """
+    out = np.empty(thresholds.shape[0])
+    for i in range(thresholds.shape[0]):
+        t = thresholds[i]
+        acc = 0.0
+        for j in range(means.shape[0]):
+            acc += (1.0 - _ndtr_scalar((t - means[j]) / sigma)) * weights[j]
+        out[i] = acc
+    return out
+
+
+def _norm_sf(x: float, mean: float, std: float) -> float:
+    """Normal survival function ``1 - Phi((x - mean) / std)`` via erfc."""
+    return 0.5 * math.erfc((x - mean) / (std * _SQRT2))
+
+
+def _norm_cdf(x: float, mean: float, std: float) -> float:
+    """Normal CDF ``Phi((x - mean) / std)`` via erfc."""
+    return 0.5 * math.erfc(-(x - mean) / (std * _SQRT2))
+
+
+def _pt_from_threshold(cohens_d: float, threshold: float, base_rate: float,
+                       sigma1: float, sigma2: float) -> float:
+    """Scalar ``parametric.compute_pt_from_threshold``."""
+    inv_s1 = 1.0 / sigma1
+    inv_s2 = 1.0 / sigma2
+    z1 = threshold * inv_s1
+    z2 = (threshold - cohens_d) * inv_s2
+    pdf1 = math.exp(-0.5 * z1 * z1) * (inv_s1 * _INV_SQRT_2PI)
+    pdf2 = math.exp(-0.5 * z2 * z2) * (inv_s2 * _INV_SQRT_2PI)
+    numerator = pdf2 * base_rate
+    denominator = pdf1 * (1.0 - base_rate) + numerator
+    if denominator == 0.0:
+        return 0.5
+    return numerator / denominator
+
+
+def _odds_to_prob(pre_test_odds: float, likelihood_ratio: float) -> float:
+    """Post-test probability from pre-test odds and a likelihood ratio."""
+    if math.isinf(likelihood_ratio):
+        return 1.0
+    odds = pre_test_odds * likelihood_ratio
+    return 1.0 if math.isinf(odds) else odds / (1.0 + odds)
+
+
+def _binary_metrics(cohens_d: float, base_rate: float, threshold: float,
+                    sigma1: float, sigma2: float, pt: float) -> tuple:
+    """
+    Body of ``parametric.compute_binary_metrics`` as straight-line scalar code.
+
+    ``pt`` is the threshold probability for net benefit; pass NaN to derive
+    it from ``threshold``. Returns the metrics as a tuple in
+    ``parametric.BINARY_METRIC_KEYS`` order.
+    """
+    # FPR and TPR at threshold, as 1 - CDF to match the web simulator's
+    # rounding in the far tails
+    fpr = 1.0 - _norm_cdf(threshold, 0.0, sigma1)
+    tpr = 1.0 - _norm_cdf(threshold, cohens_d, sigma2)
+
+    sensitivity = tpr
+    specificity = 1.0 - fpr
+
+    # Confusion-matrix cell probabilities
+    tp = sensitivity * base_rate
+    tn = specificity * (1.0 - base_rate)
+    fp = (1.0 - specificity) * (1.0 - base_rate)
+    fn = (1.0 - sensitivity) * base_rate
+
+    if sensitivity == 0.0:
+        ppv = 1.0  # Convention when sensitivity is 0
+    else:
+        ppv_denom = tp + fp
+        ppv = tp / ppv_denom if ppv_denom > 0.0 else 1.0
+    npv_denom = tn + fn
+    npv = tn / npv_denom if npv_denom > 0.0 else 1.0
+
+    accuracy = tp + tn
+    balanced_accuracy = (sensitivity + specificity) / 2.0
+    f1 = 2.0 * (ppv * sensitivity) / (ppv + sensitivity) if (ppv + sensitivity) > 0.0 else 0.0
+
+    mcc_num = tp * tn - fp * fn
+    mcc_denom = math.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))
+    mcc = mcc_num / mcc_denom if mcc_denom > 0.0 else 0.0
+
+    lr_plus = sensitivity / (1.0 - specificity) if specificity < 1.0 else math.inf
+    lr_minus = (1.0 - sensitivity) / specificity if specificity > 0.0 else math.inf
+    # An infinite lr_plus propagates through the division on its own
+    dor = lr_plus / lr_minus if 0.0 < lr_minus < math.inf else math.inf
+
+    youden_j = sensitivity + specificity - 1.0
+    g_mean = math.sqrt(sensitivity * specificity)
+
+    # Cohen's kappa
+    p_yes_pred = tp + fp
+    pe_chance = base_rate * p_yes_pred + (1.0 - base_rate) * (1.0 - p_yes_pred)
+    kappa_stat = (accuracy - pe_chance) / (1.0 - pe_chance) if pe_chance < 1.0 else 0.0
+
+    # Post-test probabilities
+    pre_test_odds = base_rate / (1.0 - base_rate) if base_rate < 1.0 else math.inf
+    post_test_prob_plus = _odds_to_prob(pre_test_odds, lr_plus)
+    post_test_prob_minus = _odds_to_prob(pre_test_odds, lr_minus)
+
+    # Delta net benefit at p_t (implied by the threshold unless given); at
+    # p_t = 1 neither strategy treats anyone and the difference is 0
+    if math.isnan(pt):
+        pt = _pt_from_threshold(cohens_d, threshold, base_rate, sigma1, sigma2)
+    if pt < 1.0:
+        odds_pt = pt / (1.0 - pt)
+        delta_nb = (tp - fp * odds_pt) - max(base_rate - (1.0 - base_rate) * odds_pt, 0.0)
+    else:
+        delta_nb = 0.0
+
+    return (fpr, tpr, sensitivity, specificity, ppv, npv, accuracy,
+            balanced_accuracy, f1, mcc, lr_plus, lr_minus, dor, youden_j,
+            g_mean, kappa_stat, post_test_prob_plus, post_test_prob_minus,
+            delta_nb)
+
+
+def _closed_form_threshold(cohens_d: float, pt: float, base_rate: float,
+                           sigma1: float, sigma2: float) -> float:
+    """
+    Analytic root of ``P(positive | X = t) = pt``; NaN where it does not apply.
+
+    See ``parametric._threshold_from_pt_closed_form`` for the derivation and
+    the conditions under which the root matches the bisection result.
+    """
+    if not (0.0 < pt < 1.0 and 0.0 < base_rate < 1.0):
+        return math.nan
+    c = math.log(pt / (1.0 - pt)) - math.log(base_rate / (1.0 - base_rate))
+    left = -8.0 * max(sigma1, sigma2)
+    right = 8.0 * max(sigma1, sigma2) + cohens_d
+
+    if sigma1 == sigma2:
+        if cohens_d <= 0.0:
+            return math.nan
+        t = 0.5 * cohens_d + c * sigma1 * sigma1 / cohens_d
+        return t if left <= t <= right else math.nan
+
+    inv_v1 = 1.0 / (sigma1 * sigma1)
+    inv_v2 = 1.0 / (sigma2 * sigma2)
+    a = 0.5 * (inv_v1 - inv_v2)
+    b = cohens_d * inv_v2
+    k = -0.5 * cohens_d * cohens_d * inv_v2 - math.log(sigma2 / sigma1) - c
+
+    if left < -0.5 * b / a < right:
+        return math.nan
+    disc = b * b - 4.0 * a * k
+    if disc < 0.0:
+        return math.nan
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    if q == 0.0:
+        t = 0.0
+        return t if left <= t <= right and b > 0.0 else math.nan
+    t = q / a
+    if left <= t <= right and 2.0 * a * t + b > 0.0:
+        return t
+    t = k / q
+    if left <= t <= right and 2.0 * a * t + b > 0.0:
+        return t
+    return math.nan
+
+
+def _threshold_from_pt(cohens_d: float, pt: float, base_rate: float,
+                       sigma1: float, sigma2: float) -> float:
+    """
+    ``parametric.compute_threshold_from_pt``: the closed form where it
+    applies, otherwise bisection in one loop.
+    """
+    t = _closed_form_threshold(cohens_d, pt, base_rate, sigma1, sigma2)
+    if not math.isnan(t):
+        return t
+    left = -8.0 * max(sigma1, sigma2)
+    right = 8.0 * max(sigma1, sigma2) + cohens_d
+    epsilon = 1e-8
+    for _ in range(100):
+        mid = (left + right) / 2.0
+        pt_mid = _pt_from_threshold(cohens_d, mid, base_rate, sigma1, sigma2)
+        if abs(pt_mid - pt) < epsilon:
+            return mid
+        if pt_mid < pt:
+            left = mid
+        else:
+            right = mid
+        if right - left < epsilon:
+            break
+    return (left + right) / 2.0
+
+
+def _threshold_objective(threshold: float, cohens_d: float, base_rate: float,
+                         sigma1: float, sigma2: float, use_f1: bool) -> float:
+    """Negative F1 or Youden's J at ``threshold`` (minimization target)."""
+    sensitivity = _norm_sf(threshold, cohens_d, sigma2)
+    specificity = 1.0 - _norm_sf(threshold, 0.0, sigma1)
+    if not use_f1:
+        return -(sensitivity + specificity - 1.0)
+    if sensitivity == 0.0:
+        ppv = 1.0
+    else:
+        ppv_num = sensitivity * base_rate
+        ppv_denom = ppv_num + (1.0 - specificity) * (1.0 - base_rate)
+        ppv = ppv_num / ppv_denom if ppv_denom > 0.0 else 1.0
+    if ppv + sensitivity > 0.0:
+        return -2.0 * (ppv * sensitivity) / (ppv + sensitivity)
+    return 0.0
+
+
+def _golden_section_threshold(a: float, b: float, cohens_d: float,
+                              base_rate: float, sigma1: float, sigma2: float,
+                              use_f1: bool) -> float:
+    """Golden-section search on ``[a, b]`` minimizing ``_threshold_objective``."""
+    inv_phi = (math.sqrt(5.0) - 1.0) / 2.0
+    c = b - inv_phi * (b - a)
+    d = a + inv_phi * (b - a)
+    fc = _threshold_objective(c, cohens_d, base_rate, sigma1, sigma2, use_f1)
+    fd = _threshold_objective(d, cohens_d, base_rate, sigma1, sigma2, use_f1)
+    for _ in range(200):
+        if b - a < 1e-10:
+            break
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - inv_phi * (b - a)
+            fc = _threshold_objective(c, cohens_d, base_rate, sigma1, sigma2, use_f1)
+        else:
+            a, c, fc = c, d, fd
+            d = a + inv_phi * (b - a)
+            fd = _threshold_objective(d, cohens_d, base_rate, sigma1, sigma2, use_f1)
+    return (a + b) / 2.0
+
+
+def _optimal_threshold(cohens_d: float, base_rate: float, sigma1: float,
+                       sigma2: float, use_f1: bool) -> float:
+    """
+    Threshold maximizing F1 or Youden's J, searched like
+    ``parametric.find_optimal_threshold``: the objective is scanned on a
+    2000-point grid over the same bracket, then refined by golden section
+    over the cells either side of the best grid point. Searching the whole
+    bracket directly stalls on flat tails (e.g. F1 with sigma2 > sigma1).
+    """
+    n_grid = 2000  # parametric._THRESHOLD_GRID_SIZE
+    grid = np.linspace(-8.0 * max(sigma1, sigma2), 8.0 * max(sigma1, sigma2) + cohens_d, n_grid)
+    best = 0
+    best_value = _threshold_objective(grid[0], cohens_d, base_rate, sigma1, sigma2, use_f1)
+    for j in range(1, n_grid):
+        value = _threshold_objective(grid[j], cohens_d, base_rate, sigma1, sigma2, use_f1)
+        if value < best_value:
+            best = j
+            best_value = value
+    return _golden_section_threshold(
+        grid[max(best - 1, 0)], grid[min(best + 1, n_grid - 1)],
+        cohens_d, base_rate, sigma1, sigma2, use_f1,
+    )
+
+
+def _pr_auc_normal(cohens_d: float, base_rate: float, sigma1: float,
+                   sigma2: float, n_points: int) -> float:
+    """
+    Trapezoidal PR-AUC of ``parametric.compute_pr_auc_parametric`` with the
+    point list, sort and de-duplication replaced by flat arrays.
+    """
+    spread = 6.0 * max(sigma1, sigma2)
+    thresholds = np.linspace(max(0.0, cohens_d) + spread,
+                             min(0.0, cohens_d) - spread, n_points)
+    recalls = np.empty(n_points + 2)
+    precisions = np.empty(n_points + 2)
+    recalls[0] = 0.0
+    precisions[0] = 1.0
+    for i in range(n_points):
+        recall = _norm_sf(thresholds[i], cohens_d, sigma2)
+        fpr = _norm_sf(thresholds[i], 0.0, sigma1)
+        numerator = base_rate * recall
+        denominator = numerator + (1.0 - base_rate) * fpr
+        recalls[i + 1] = recall
+        precisions[i + 1] = 1.0 if denominator < 1e-9 else numerator / denominator
+    recalls[n_points + 1] = 1.0
+    precisions[n_points + 1] = base_rate
+
+    # Stable sort by recall, keeping the first point of each recall value
+    order = np.argsort(recalls, kind="mergesort")
+    area = 0.0
+    prev_recall = recalls[order[0]]
+    prev_precision = precisions[order[0]]
+    for k in range(1, order.shape[0]):
+        recall = recalls[order[k]]
+        if recall == prev_recall:
+            continue
+        precision = precisions[order[k]]
+        area += (recall - prev_recall) * (precision + prev_precision) / 2.0
+        prev_recall = recall
+        prev_precision = precision
+    return min(max(area, 0.0), 1.0)
+
+
+def _dca_net_benefit(g1_sorted: np.ndarray, g2_sorted: np.ndarray,
+                     prevalence: float, pt_values: np.ndarray,
+                     thresholds: np.ndarray) -> tuple:
+    """
+    Model and treat-all net benefit for ``plotting.compute_dca_curve`` in one
+    pass over the p_t values, reading sensitivity/specificity off the sorted
+    groups without intermediate arrays.
+    """
+    n1 = g1_sorted.shape[0]
+    n2 = g2_sorted.shape[0]
+    model_nb = np.empty(pt_values.shape[0])
+    treat_all_nb = np.empty(pt_values.shape[0])
+    for i in range(pt_values.shape[0]):
+        t = thresholds[i]
+        sens = (n2 - np.searchsorted(g2_sorted, t)) / n2
+        spec = np.searchsorted(g1_sorted, t) / n1
+        odds = pt_values[i] / (1 - pt_values[i])
+        model_nb[i] = sens * prevalence - (1 - spec) * (1 - prevalence) * odds
+        treat_all_nb[i] = prevalence - (1 - prevalence) * odds
+    return model_nb, treat_all_nb
+
+
+def _kde_density(t: float, data: np.ndarray, h: float) -> float:
+    """Gaussian KDE of ``data`` with scalar bandwidth ``h``, evaluated at ``t``."""
+    s = 0.0
+    for i in range(data.shape[0]):
+        z = (t - data[i]) / h
+        s += math.exp(-0.5 * z * z)
+    return s * _INV_SQRT_2PI / (h * data.shape[0])
+
+
+def _kde_posterior_minus_pt(t: float, d1: np.ndarray, h1: float, d2: np.ndarray,
+                            h2: float, base_rate: float, pt: float) -> float:
+    """P(group 2 | x = t) from the two group KDEs, minus ``pt``."""
+    numerator = _kde_density(t, d2, h2) * base_rate
+    denominator = _kde_density(t, d1, h1) * (1 - base_rate) + numerator
+    if denominator < 1e-15:
+        return 0.5 - pt
+    return numerator / denominator - pt
+
+
+def _kde_brentq(xpre: float, xcur: float, fpre: float, fcur: float,
+                d1: np.ndarray, h1: float, d2: np.ndarray, h2: float,
+                base_rate: float, pt: float) -> float:
+    """
+    Root of the KDE posterior minus ``pt`` in a sign-changing bracket, by
+    Brent's method following ``scipy.optimize.brentq`` step for step (same
+    default tolerances).
+    """
+    xtol = 2e-12
+    rtol = 4 * np.finfo(np.float64).eps
+    if fpre == 0.0:
+        return xpre
+    if fcur == 0.0:
+        return xcur
+    xblk = 0.0
+    fblk = 0.0
+    spre = 0.0
+    scur = 0.0
+    for _ in range(100):
+        if fpre != 0.0 and fcur != 0.0 and (fpre < 0) != (fcur < 0):
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (xtol + rtol * abs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0.0 or abs(sbis) < delta:
+            break
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # Secant step
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # Inverse quadratic interpolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre = scur
+                scur = stry
+            else:
+                spre = sbis
+                scur = sbis
+        else:
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+        fcur = _kde_posterior_minus_pt(xcur, d1, h1, d2, h2, base_rate, pt)
+    return xcur
+
+
+def _kde_thresholds(d1: np.ndarray, h1: float, d2: np.ndarray, h2: float,
+                    base_rate: float, pts: np.ndarray, t_min: float,
+                    t_max: float) -> np.ndarray:
+    """
+    Measurement thresholds where the KDE posterior equals each p_t, for
+    ``utils.convert_pts_to_thresholds`` (same search as its SciPy path).
+
+    The posterior is evaluated once on a 1000-point grid over
+    [t_min, t_max]. Each root is then refined with Brent's method inside the
+    first grid cell where the posterior crosses p_t; without a crossing the
+    closest grid point is used.
+    """
+    n_grid = 1000
+    t_grid = np.linspace(t_min, t_max, n_grid)
+    posterior_grid = np.empty(n_grid)
+    for j in range(n_grid):
+        posterior_grid[j] = _kde_posterior_minus_pt(t_grid[j], d1, h1, d2, h2,
+                                                    base_rate, 0.0)
+
+    out = np.empty(pts.shape[0])
+    for k in range(pts.shape[0]):
+        pt = pts[k]
+        if (posterior_grid[0] - pt) * (posterior_grid[-1] - pt) > 0:
+            best = 0
+            for j in range(1, n_grid):
+                if abs(posterior_grid[j] - pt) < abs(posterior_grid[best] - pt):
+                    best = j
+            out[k] = t_grid[best]
+            continue
+        j = 0
+        while (posterior_grid[j] - pt) * (posterior_grid[j + 1] - pt) > 0:
+            j += 1
+        fa = _kde_posterior_minus_pt(t_grid[j], d1, h1, d2, h2, base_rate, pt)
+        fb = _kde_posterior_minus_pt(t_grid[j + 1], d1, h1, d2, h2, base_rate, pt)
+        if fa * fb > 0:
+            # Grid and scalar evaluations disagree on a sign within rounding
+            if abs(posterior_grid[j] - pt) <= abs(posterior_grid[j + 1] - pt):
+                out[k] = t_grid[j]
+            else:
+                out[k] = t_grid[j + 1]
+            continue
+        out[k] = _kde_brentq(t_grid[j], t_grid[j + 1], fa, fb, d1, h1, d2, h2,
+                             base_rate, pt)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Scalar kernels carry explicit signatures so they compile eagerly at
+    # import (or load from the on-disk cache) instead of on the first call.
+    # Helpers called from other kernels are rebound to their compiled versions
+    # so nopython code resolves them as jitted functions.
+    _norm_sf = njit("float64(float64, float64, float64)", cache=True)(_norm_sf)
+    _norm_cdf = njit("float64(float64, float64, float64)", cache=True)(_norm_cdf)
+    _pt_from_threshold = njit(
+        "float64(float64, float64, float64, float64, float64)", cache=True
+    )(_pt_from_threshold)
+    _odds_to_prob = njit("float64(float64, float64)", cache=True)(_odds_to_prob)
+    _closed_form_threshold = njit(
+        "float64(float64, float64, float64, float64, float64)", cache=True
+    )(_closed_form_threshold)
+
+    # Array kernels stay lazily specialized: they accept float32 and float64.
+    # survival_mass calls the ctypes ndtr pointer, which Numba cannot cache.
+    survival_mass = njit(_survival_mass)
+    dca_net_benefit = njit(cache=True)(_dca_net_benefit)
+    _kde_density = njit(cache=True)(_kde_density)
+    _kde_posterior_minus_pt = njit(cache=True)(_kde_posterior_minus_pt)
+    _kde_brentq = njit(cache=True)(_kde_brentq)
+    kde_thresholds = njit(cache=True)(_kde_thresholds)
+    threshold_from_pt = njit(
+        "float64(float64, float64, float64, float64, float64)", cache=True
+    )(_threshold_from_pt)
+    binary_metrics = njit(cache=True)(_binary_metrics)
+    _threshold_objective = njit(
+        "float64(float64, float64, float64, float64, float64, boolean)", cache=True
+    )(_threshold_objective)
+    _golden_section_threshold = njit(
+        "float64(float64, float64, float64, float64, float64, float64, boolean)",
+        cache=True,
+    )(_golden_section_threshold)
+    optimal_threshold = njit(
+        "float64(float64, float64, float64, float64, boolean)", cache=True
+    )(_optimal_threshold)
+    pr_auc_normal = njit(
+        "float64(float64, float64, float64, float64, int64)", cache=True
+    )(_pr_auc_normal)
+else:
+    survival_mass = None
+    dca_net_benefit = None
+    kde_thresholds = None
+    binary_metrics = None
+    threshold_from_pt = None
+    optimal_threshold = None
+    pr_auc_normal = None
+
+# Ahead-of-time compiled scalar kernels (see ``_kernels_aot``) need neither
+# Numba nor JIT warm-up; prefer them whenever the extension has been built.
+try:
+    from . import _kernels as _aot
+except ImportError:
+    _aot = None
+
+if _aot is not None:  # pragma: no cover - only present in AOT builds
+    threshold_from_pt = _aot.threshold_from_pt
+    optimal_threshold = _aot.optimal_threshold
+    pr_auc_normal = _aot.pr_auc_normal
@@ -2,19 +2,87 @@
 E2PBinary class for binary outcome analysis.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import numpy as np
-from typing import Tuple, Optional
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Tuple, Optional
 
 from .core import MetricWithCI, BinaryResults
 from .utils import (
     compute_cohens_d, compute_point_biserial_r, compute_eta_squared,
-    compute_odds_ratio, compute_cohens_u3, compute_roc_auc, compute_pr_auc,
-    compute_roc_curve, compute_pr_curve, convert_pt_to_threshold,
-    compute_threshold_metrics, transform_for_target_reliability,
+    compute_odds_ratio, compute_cohens_u3,
+    compute_effect_sizes_batched, _rank_counts, _rank_curves,
+    _roc_auc_from_counts, _pr_auc_from_counts, _KDEThresholdSearch,
+    convert_pt_to_threshold, compute_threshold_metrics,
+    compute_threshold_metrics_batch, transform_for_target_reliability,
     transform_groups_for_target_kappa
 )
-from .plotting import plot_binary
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+def _resolve_workers(workers: int) -> int:
+    """Validate ``workers`` and map -1 to the number of available CPUs."""
+    if workers == -1:
+        return os.cpu_count() or 1
+    if not isinstance(workers, (int, np.integer)) or workers < 1:
+        raise ValueError("workers must be a positive integer or -1 (all CPUs)")
+    return int(workers)
+
+
+def _validate_probabilities(base_rate: float, threshold_prob: float,
+                            ci_level: Optional[float] = None) -> None:
+    """Shared range checks for the empirical calculators' settings."""
+    if not 0 < base_rate < 1:
+        raise ValueError("base_rate must be between 0 and 1 (exclusive)")
+    if not 0 < threshold_prob < 1:
+        raise ValueError("threshold_prob must be between 0 and 1 (exclusive)")
+    if ci_level is not None and not 0 < ci_level < 1:
+        raise ValueError("ci_level must be between 0 and 1 (exclusive)")
+
+
+def _index_dtype(n: int) -> type:
+    """Smallest integer dtype able to index an array of length ``n``."""
+    return np.int32 if n < 2**31 else np.int64
+
+
+def _run_bootstrap(group1: np.ndarray, group2: np.ndarray,
+                   base_rate: float, threshold_prob: float,
+                   n_bootstrap: int, keys, rng: np.random.Generator) -> dict:
+    """
+    Run ``n_bootstrap`` resamples and collect per-iteration metric values.
+
+    Returns one preallocated float array of length ``n_bootstrap`` per metric;
+    iterations that fail are left as NaN.
+    """
+    n1, n2 = len(group1), len(group2)
+    bootstrap_results = {key: np.full(n_bootstrap, np.nan) for key in keys}
+
+    # Draw every resample's indices in one call per group and gather once;
+    # row i of each matrix is the i-th bootstrap sample. int32 indices halve
+    # the index matrices' footprint whenever the group sizes allow it.
+    g1_boots = group1[rng.integers(0, n1, size=(n_bootstrap, n1), dtype=_index_dtype(n1))]
+    g2_boots = group2[rng.integers(0, n2, size=(n_bootstrap, n2), dtype=_index_dtype(n2))]
+
+    # The moment-based effect sizes of every resample come from a few
+    # whole-matrix reductions; the loop below only does the rank/KDE work
+    batched = compute_effect_sizes_batched(g1_boots, g2_boots)
+
+    for i, (g1_boot, g2_boot) in enumerate(zip(g1_boots, g2_boots)):
+        try:
+            boot_metrics = E2PBinary._compute_all_metrics(
+                g1_boot, g2_boot, base_rate, threshold_prob,
+                precomputed={key: values[i] for key, values in batched.items()}
+            )
+        except Exception:
+            continue
+        for key, value in boot_metrics.items():
+            bootstrap_results[key][i] = value
+
+    return bootstrap_results
 
 
 class E2PBinary:
@@ -40,6 +108,17 @@ class E2PBinary:
         Confidence interval level. Default: 0.95.
     random_state : int, optional
         Random seed for reproducibility.
+    workers : int, optional
+        Number of worker processes for the bootstrap. Resamples are split into
+        ``workers`` chunks, each drawing from a child generator spawned from
+        the bootstrap RNG. Results are reproducible for a fixed
+        ``(random_state, workers)`` pair. Use -1 for all CPUs. Default: 1.
+    rng : np.random.Generator, optional
+        Generator to draw bootstrap resamples from. Overrides ``random_state``
+        and is shared by every computation on this instance (so repeat calls
+        continue its stream). Without it, each bootstrap starts a fresh
+        generator seeded from ``random_state``, so repeat calls reproduce.
+        The global NumPy RNG state is never touched.
     """
     
     def __init__(
@@ -50,7 +129,9 @@ class E2PBinary:
         threshold_prob: float,
         n_bootstrap: int = 1000,
         ci_level: float = 0.95,
-        random_state: Optional[int] = None
+        random_state: Optional[int] = None,
+        workers: int = 1,
+        rng: Optional[np.random.Generator] = None,
     ):
         self.group1 = np.asarray(group1, dtype=float)
         self.group2 = np.asarray(group2, dtype=float)
@@ -59,50 +140,51 @@ class E2PBinary:
         self.n_bootstrap = n_bootstrap
         self.ci_level = ci_level
         self.random_state = random_state
+        self.workers = _resolve_workers(workers)
+        # None: every bootstrap draws a fresh stream seeded from random_state
+        self._rng = rng
+        self._threshold_search = None
         
         # Validation
         if len(self.group1) == 0 or len(self.group2) == 0:
             raise ValueError("Both groups must have at least one observation")
-        if not 0 < base_rate < 1:
-            raise ValueError("base_rate must be between 0 and 1 (exclusive)")
-        if not 0 < threshold_prob < 1:
-            raise ValueError("threshold_prob must be between 0 and 1 (exclusive)")
-        if not 0 < ci_level < 1:
-            raise ValueError("ci_level must be between 0 and 1 (exclusive)")
+        _validate_probabilities(base_rate, threshold_prob, ci_level)
         
         self.n1 = len(self.group1)
         self.n2 = len(self.group2)
-        
-        if random_state is not None:
-            np.random.seed(random_state)
     
-    def _compute_all_metrics(self, g1: np.ndarray, g2: np.ndarray,
-                             base_rate: float, pt: float) -> dict:
-        """Compute all metrics for given data."""
-        cohens_d = compute_cohens_d(g1, g2)
-        r = compute_point_biserial_r(g1, g2)
-        eta_squared = compute_eta_squared(g1, g2)
-        odds_ratio, log_or = compute_odds_ratio(g1, g2)
-        cohens_u3 = compute_cohens_u3(g1, g2)
+    @staticmethod
+    def _compute_all_metrics(g1: np.ndarray, g2: np.ndarray,
+                             base_rate: float, pt: float,
+                             precomputed: Optional[dict] = None) -> dict:
+        """
+        Compute all metrics for given data.
+
+        Effect sizes (the keys of ``compute_effect_sizes_batched``) found in
+        ``precomputed`` are used as given.
+        """
+        metrics = dict(precomputed) if precomputed else {}
+        if 'cohens_d' not in metrics:
+            odds_ratio, log_or = compute_odds_ratio(g1, g2)
+            metrics.update(
+                cohens_d=compute_cohens_d(g1, g2),
+                r=compute_point_biserial_r(g1, g2),
+                eta_squared=compute_eta_squared(g1, g2),
+                odds_ratio=odds_ratio,
+                log_odds_ratio=log_or,
+                cohens_u3=compute_cohens_u3(g1, g2),
+            )
         
-        roc_auc = compute_roc_auc(g1, g2)
-        pr_auc = compute_pr_auc(g1, g2, base_rate)
+        # ROC-AUC and PR-AUC read off one sort of the pooled sample
+        n1, n2 = len(g1), len(g2)
+        counts = _rank_counts(g1, g2)
+        metrics['roc_auc'] = _roc_auc_from_counts(*counts, n1, n2)
+        metrics['pr_auc'] = _pr_auc_from_counts(*counts, n1, n2, base_rate)
         
         threshold = convert_pt_to_threshold(g1, g2, base_rate, pt)
-        threshold_metrics = compute_threshold_metrics(g1, g2, threshold, base_rate, pt)
-        
-        return {
-            'cohens_d': cohens_d,
-            'r': r,
-            'eta_squared': eta_squared,
-            'odds_ratio': odds_ratio,
-            'log_odds_ratio': log_or,
-            'cohens_u3': cohens_u3,
-            'roc_auc': roc_auc,
-            'pr_auc': pr_auc,
-            'threshold_value': threshold,
-            **threshold_metrics
-        }
+        metrics['threshold_value'] = threshold
+        metrics.update(compute_threshold_metrics(g1, g2, threshold, base_rate, pt))
+        return metrics
     
     def compute(self) -> BinaryResults:
         """
@@ -117,40 +199,38 @@ class E2PBinary:
             self.group1, self.group2, self.base_rate, self.threshold_prob
         )
         
-        bootstrap_results = {key: [] for key in point_estimates.keys()}
-        
-        for _ in range(self.n_bootstrap):
-            g1_boot = np.random.choice(self.group1, size=self.n1, replace=True)
-            g2_boot = np.random.choice(self.group2, size=self.n2, replace=True)
-            
-            try:
-                boot_metrics = self._compute_all_metrics(
-                    g1_boot, g2_boot, self.base_rate, self.threshold_prob
-                )
-                for key, value in boot_metrics.items():
-                    bootstrap_results[key].append(value)
-            except Exception:
-                continue
+        keys = list(point_estimates.keys())
+        bootstrap_results = self._bootstrap(keys)
         
         alpha = 1 - self.ci_level
         ci_lower_pct = alpha / 2 * 100
         ci_upper_pct = (1 - alpha / 2) * 100
         
+        # (K, n_bootstrap) matrix; non-finite draws (failed iterations, inf
+        # likelihood ratios) are excluded from every metric's percentiles
+        stacked = np.vstack([bootstrap_results[key] for key in keys])
+        finite = np.isfinite(stacked)
+        has_values = finite.any(axis=1)
+        ci_bounds = np.full((2, len(keys)), np.nan)
+        if has_values.any():
+            masked = np.where(finite, stacked, np.nan)[has_values]
+            ci_bounds[:, has_values] = np.nanpercentile(
+                masked, [ci_lower_pct, ci_upper_pct], axis=1
+            )
+        key_index = {key: i for i, key in enumerate(keys)}
+        
         def make_metric_with_ci(key: str) -> MetricWithCI:
             estimate = point_estimates[key]
-            boot_values = np.array(bootstrap_results[key])
-            boot_values = boot_values[np.isfinite(boot_values)]
+            i = key_index[key]
             
-            if len(boot_values) > 0:
-                ci_lower = np.percentile(boot_values, ci_lower_pct)
-                ci_upper = np.percentile(boot_values, ci_upper_pct)
+            if has_values[i]:
+                ci_lower, ci_upper = ci_bounds[0, i], ci_bounds[1, i]
             else:
                 ci_lower = ci_upper = estimate
             
             return MetricWithCI(estimate, ci_lower, ci_upper)
         
-        roc_curve = compute_roc_curve(self.group1, self.group2)
-        pr_curve = compute_pr_curve(self.group1, self.group2, self.base_rate)
+        roc_curve, pr_curve = _rank_curves(self.group1, self.group2, self.base_rate)
         
         return BinaryResults(
             cohens_d=make_metric_with_ci('cohens_d'),
@@ -187,24 +267,77 @@ class E2PBinary:
             threshold_prob=self.threshold_prob
         )
     
+    def _bootstrap(self, keys) -> dict:
+        """Collect bootstrap metric values, split across worker processes if requested."""
+        rng = self._rng if self._rng is not None else np.random.default_rng(self.random_state)
+        n_workers = min(self.workers, self.n_bootstrap)
+        if n_workers <= 1:
+            return _run_bootstrap(
+                self.group1, self.group2, self.base_rate, self.threshold_prob,
+                self.n_bootstrap, keys, rng
+            )
+        
+        keys = list(keys)
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(self.n_bootstrap), n_workers)]
+        child_rngs = rng.spawn(n_workers)
+        
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            chunks = list(executor.map(
+                _run_bootstrap,
+                repeat(self.group1), repeat(self.group2),
+                repeat(self.base_rate), repeat(self.threshold_prob),
+                chunk_sizes, repeat(keys), child_rngs
+            ))
+        
+        return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in keys}
+    
+    def _thresholds_at(self, threshold_probs) -> np.ndarray:
+        """Measurement thresholds for p_t values, reusing one KDE search over the groups."""
+        if self._threshold_search is None:
+            self._threshold_search = _KDEThresholdSearch(self.group1, self.group2)
+        return self._threshold_search(self.base_rate, threshold_probs)
+    
     def compute_at_threshold(self, threshold_prob: float) -> dict:
         """
         Compute threshold-dependent metrics at a different threshold probability.
         """
-        threshold = convert_pt_to_threshold(
-            self.group1, self.group2, self.base_rate, threshold_prob
-        )
+        threshold = self._thresholds_at(threshold_prob)[0]
         return compute_threshold_metrics(
             self.group1, self.group2, threshold, self.base_rate, threshold_prob
         )
     
+    def compute_at_thresholds(self, threshold_probs) -> dict:
+        """
+        Compute threshold-dependent metrics for several threshold probabilities.
+        
+        Parameters
+        ----------
+        threshold_probs : array-like
+            Threshold probabilities (p_t), each between 0 and 1 (exclusive).
+        
+        Returns
+        -------
+        dict
+            Metric name -> array of shape (T,), plus ``'threshold_value'``
+            with the measurement threshold for each p_t.
+        """
+        threshold_probs = np.atleast_1d(np.asarray(threshold_probs, dtype=float))
+        if not np.all((threshold_probs > 0) & (threshold_probs < 1)):
+            raise ValueError("threshold_probs must be between 0 and 1 (exclusive)")
+        thresholds = self._thresholds_at(threshold_probs)
+        metrics = compute_threshold_metrics_batch(
+            self.group1, self.group2, thresholds, self.base_rate, threshold_probs
+        )
+        return {'threshold_value': thresholds, **metrics}
+    
     def plot(self, results: BinaryResults = None, 
              figsize: Tuple[float, float] = (10, 6),
              group1_label: str = "Group 1 (Controls)",
-             group2_label: str = "Group 2 (Cases)") -> plt.Figure:
+             group2_label: str = "Group 2 (Cases)") -> "plt.Figure":
         """
         Plot histograms of the two groups with threshold line and metrics.
         """
+        from .plotting import plot_binary
         return plot_binary(
             self.group1, self.group2, 
             self.base_rate, self.threshold_prob,
@@ -230,7 +363,7 @@ class E2PBinary:
         figsize: Tuple[float, float] = (16, 9),
         group1_label: str = "Group 1 (Controls)",
         group2_label: str = "Group 2 (Cases)",
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """
         Plot the standard binary panels after applying reliability transformation.
 
@@ -268,8 +401,11 @@ class E2PBinary:
             n_bootstrap=self.n_bootstrap,
             ci_level=self.ci_level,
             random_state=self.random_state,
+            workers=self.workers,
+            rng=self._rng,
         ).compute()
 
+        from .plotting import plot_binary
         return plot_binary(
             g1_tgt,
             g2_tgt,
@@ -335,12 +471,15 @@ class E2PBinary:
             n_bootstrap=self.n_bootstrap,
             ci_level=self.ci_level,
             random_state=self.random_state,
+            workers=self.workers,
+            rng=self._rng,
         )
         return calculator.compute()
 
 
 def e2p_binary(group1, group2, base_rate, threshold_prob=0.5, 
-               n_bootstrap=1000, ci_level=0.95, random_state=None) -> BinaryResults:
+               n_bootstrap=1000, ci_level=0.95, random_state=None,
+               workers=1) -> BinaryResults:
     """
     Convenience function to compute E2P binary metrics.
     
@@ -360,6 +499,9 @@ def e2p_binary(group1, group2, base_rate, threshold_prob=0.5,
         Confidence interval level. Default: 0.95.
     random_state : int, optional
         Random seed for reproducibility.
+    workers : int, optional
+        Number of worker processes for the bootstrap (-1 for all CPUs).
+        Default: 1.
     
     Returns
     -------
@@ -373,7 +515,8 @@ def e2p_binary(group1, group2, base_rate, threshold_prob=0.5,
         threshold_prob=threshold_prob,
         n_bootstrap=n_bootstrap,
         ci_level=ci_level,
-        random_state=random_state
+        random_state=random_state,
+        workers=workers
     )
     return calculator.compute()
 
@@ -391,6 +534,7 @@ def e2p_binary_deattenuated(
     n_bootstrap: int = 1000,
     ci_level: float = 0.95,
     random_state: Optional[int] = None,
+    workers: int = 1,
     per_group: bool = False,
     r1_current: Optional[float] = None,
     r2_current: Optional[float] = None,
@@ -409,6 +553,7 @@ def e2p_binary_deattenuated(
         n_bootstrap=n_bootstrap,
         ci_level=ci_level,
         random_state=random_state,
+        workers=workers,
     )
     return calculator.compute_at_reliability(
         r_current=r_current,
@@ -14,9 +14,11 @@ r → d conversion into the equal-variance binary normal model.
 from __future__ import annotations
 
 import numpy as np
-from scipy import stats
+from scipy.special import ndtr, ndtri
 from typing import Dict, Literal, Optional, Tuple
 
+from ._numba_kernels import NUMBA_AVAILABLE, survival_mass
+
 
 def _trapz(y, x) -> float:
     """Trapezoidal integral; works across NumPy versions."""
@@ -25,6 +27,14 @@ def _trapz(y, x) -> float:
     return float(np.trapz(y, x))
 
 
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def _norm_pdf(x):
+    """Standard normal density without the scipy.stats frozen-distribution overhead."""
+    return _INV_SQRT_2PI * np.exp(-0.5 * np.square(x))
+
+
 def _clip_r(r: float) -> float:
     return float(np.clip(r, -0.999999, 0.999999))
 
@@ -36,7 +46,7 @@ def _clip_base_rate(base_rate: float) -> float:
 def class_cutoff(base_rate: float) -> float:
     """Outcome cutoff c such that P(Y > c) = base_rate."""
     p = _clip_base_rate(base_rate)
-    return float(stats.norm.ppf(1.0 - p))
+    return float(ndtri(1.0 - p))
 
 
 def residual_sd(r: float) -> float:
@@ -49,7 +59,7 @@ def group_moments(r: float, base_rate: float) -> Dict[str, float]:
     """Moments of X | case (Y > c) and X | control (Y ≤ c)."""
     p = _clip_base_rate(base_rate)
     c = class_cutoff(p)
-    phi_c = float(stats.norm.pdf(c))
+    phi_c = float(_norm_pdf(c))
     ey1 = phi_c / p
     ey0 = -phi_c / (1.0 - p)
     vy1 = 1.0 + c * phi_c / p - ey1 * ey1
@@ -66,6 +76,15 @@ def group_moments(r: float, base_rate: float) -> Dict[str, float]:
     }
 
 
+def pooled_d(r: float, base_rate: float) -> float:
+    """Pooled-SD Cohen's d between the dichotomized BVN groups."""
+    m = group_moments(r, base_rate)
+    p = m["base_rate"]
+    pooled_var = (1.0 - p) * m["variance_control"] + p * m["variance_case"]
+    delta = m["mean_case"] - m["mean_control"]
+    return float(delta / np.sqrt(max(pooled_var, 1e-12)))
+
+
 def effect_sizes(
     r: float,
     base_rate: float,
@@ -88,7 +107,7 @@ def effect_sizes(
     d = delta / pooled_sd
     da = delta / nonpooled_sd
     glass_d = delta / np.sqrt(max(m["variance_control"], 1e-12))
-    cohens_u3 = float(stats.norm.cdf(da))
+    cohens_u3 = float(ndtr(da))
     if auc is None:
         auc = discrimination_curves(r, p, curve_points=240, y_nodes=100)["auc"]
     return {
@@ -136,8 +155,8 @@ def _class_mass_grids(r: float, base_rate: float, y_nodes: int = 160):
     n_neg = max(40, int(round(y_nodes * min(1.0, (c - y_lo) / 8.0))))
     y_pos, w_pos = _make_y_grid(c, y_hi, n_pos)
     y_neg, w_neg = _make_y_grid(y_lo, c, n_neg)
-    pos_phi_w = stats.norm.pdf(y_pos) * w_pos
-    neg_phi_w = stats.norm.pdf(y_neg) * w_neg
+    pos_phi_w = _norm_pdf(y_pos) * w_pos
+    neg_phi_w = _norm_pdf(y_neg) * w_neg
     return {
         "p": p,
         "c": c,
@@ -150,6 +169,16 @@ def _class_mass_grids(r: float, base_rate: float, y_nodes: int = 160):
     }
 
 
+def _survival_mass(means: np.ndarray, weights: np.ndarray,
+                   thresholds: np.ndarray, sigma: float) -> np.ndarray:
+    """Per-threshold sum of weights * P(score > t) over the Y mixture components."""
+    if NUMBA_AVAILABLE:
+        return survival_mass(means, weights, thresholds, sigma)
+    # Kept as 1 - Phi rather than Phi of the negated argument, which rounds
+    # differently in the far tails
+    return np.sum((1.0 - ndtr((thresholds[:, None] - means) / sigma)) * weights, axis=1)
+
+
 def sens_spec(
     r: float,
     base_rate: float,
@@ -160,8 +189,9 @@ def sens_spec(
     g = _class_mass_grids(r, base_rate, y_nodes)
     p = g["p"]
     sigma = g["sigma"]
-    mass_pos = float(np.sum((1.0 - stats.norm.cdf(threshold, loc=g["pos_mean"], scale=sigma)) * g["pos_phi_w"]))
-    mass_neg = float(np.sum((1.0 - stats.norm.cdf(threshold, loc=g["neg_mean"], scale=sigma)) * g["neg_phi_w"]))
+    t = np.array([float(threshold)])
+    mass_pos = float(_survival_mass(g["pos_mean"], g["pos_phi_w"], t, sigma)[0])
+    mass_neg = float(_survival_mass(g["neg_mean"], g["neg_phi_w"], t, sigma)[0])
     sensitivity = float(np.clip(mass_pos / p, 0.0, 1.0))
     fpr = float(np.clip(mass_neg / (1.0 - p), 0.0, 1.0))
     return {
@@ -182,7 +212,7 @@ def posterior_prob(r: float, base_rate: float, threshold: float) -> float:
     c = class_cutoff(p)
     rr = _clip_r(r)
     sigma = residual_sd(rr)
-    return float(1.0 - stats.norm.cdf((c - rr * threshold) / sigma))
+    return float(1.0 - ndtr((c - rr * threshold) / sigma))
 
 
 def threshold_from_pt(r: float, base_rate: float, pt: float) -> float:
@@ -198,7 +228,7 @@ def threshold_from_pt(r: float, base_rate: float, pt: float) -> float:
         return 0.0
     c = class_cutoff(p)
     sigma = residual_sd(rr)
-    z = float(stats.norm.ppf(1.0 - pt))
+    z = float(ndtri(1.0 - pt))
     return (c - sigma * z) / rr
 
 
@@ -302,17 +332,9 @@ def discrimination_curves(
     t_min, t_max = _threshold_range(r, p)
 
     thresholds = np.linspace(t_max, t_min, curve_points)
-    # Broadcast: for each threshold, sum survival over mixture components
-    # pos_mean shape (n_comp,), thresholds shape (n_t, 1)
-    t_col = thresholds[:, None]
-    mass_pos = np.sum(
-        (1.0 - stats.norm.cdf(t_col, loc=g["pos_mean"], scale=sigma)) * g["pos_phi_w"],
-        axis=1,
-    )
-    mass_neg = np.sum(
-        (1.0 - stats.norm.cdf(t_col, loc=g["neg_mean"], scale=sigma)) * g["neg_phi_w"],
-        axis=1,
-    )
+    # For each threshold, sum survival over mixture components
+    mass_pos = _survival_mass(g["pos_mean"], g["pos_phi_w"], thresholds, sigma)
+    mass_neg = _survival_mass(g["neg_mean"], g["neg_phi_w"], thresholds, sigma)
     tpr = np.clip(mass_pos / p, 0.0, 1.0)
     fpr = np.clip(mass_neg / (1.0 - p), 0.0, 1.0)
     prec_denom = p * tpr + (1.0 - p) * fpr
@@ -9,6 +9,7 @@ Usage:
 """
 
 import json
+import sys
 from dataclasses import asdict
 from typing import Optional
 
@@ -19,22 +20,6 @@ except ImportError:
         "typer is required for CLI. Install with: pip install e2p[cli]"
     )
 
-from e2p import (
-    e2p_parametric_binary,
-    e2p_parametric_continuous,
-    compute_roc_auc_parametric,
-    compute_pr_auc_parametric,
-    d_to_odds_ratio,
-    d_to_log_odds_ratio,
-    d_to_cohens_u3,
-    d_to_point_biserial_r,
-    r_to_d,
-    auc_to_d,
-    odds_ratio_to_d,
-    log_odds_ratio_to_d,
-    cohens_u3_to_d,
-)
-
 app = typer.Typer(
     name="e2p",
     help="Effect-to-Prediction: Compute predictive metrics from effect sizes.",
@@ -42,14 +27,46 @@ app = typer.Typer(
 )
 
 
+def _json_default(obj):
+    """Serialize NumPy arrays/scalars (anything with ``tolist``) for json."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
 def _print_json(data: dict) -> None:
-    """Print data as formatted JSON."""
-    typer.echo(json.dumps(data, indent=2))
+    """Stream data to stdout as formatted JSON."""
+    json.dump(data, sys.stdout, indent=2, default=_json_default)
+    sys.stdout.write("\n")
+
+
+def _format_value(name: str, value: float, decimals: int = 4) -> str:
+    """Format a single named value."""
+    return f"{name}: {value:.{decimals}f}"
 
 
 def _print_value(name: str, value: float, decimals: int = 4) -> None:
     """Print a single named value."""
-    typer.echo(f"{name}: {value:.{decimals}f}")
+    typer.echo(_format_value(name, value, decimals))
+
+
+def _print_summary(title: str, base_rate: float, threshold: float, sections) -> None:
+    """
+    Print a summary report with a single write.
+
+    ``sections`` is a sequence of ``(heading, [(label, value, decimals), ...])``.
+    """
+    lines = [
+        "=" * 50,
+        title,
+        "=" * 50,
+        f"\nBase rate: {base_rate:.2%}",
+        f"Threshold: {threshold:.2%}",
+    ]
+    for heading, rows in sections:
+        lines.append(f"\n--- {heading} ---")
+        lines.extend(_format_value(label, value, decimals) for label, value, decimals in rows)
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -69,6 +86,8 @@ def parametric(
     Example:
         e2p parametric --cohens-d 0.8 --base-rate 0.1 --threshold 0.5
     """
+    from e2p import e2p_parametric_binary
+
     results = e2p_parametric_binary(
         cohens_d=cohens_d,
         base_rate=base_rate,
@@ -82,27 +101,32 @@ def parametric(
     if output == "json" or output == "full":
         _print_json(asdict(results))
     else:
-        # Summary output
-        typer.echo(f"{'='*50}")
-        typer.echo(f"E2P Parametric Analysis (Cohen's d = {cohens_d})")
-        typer.echo(f"{'='*50}")
-        typer.echo(f"\nBase rate: {base_rate:.2%}")
-        typer.echo(f"Threshold: {threshold:.2%}")
-        typer.echo(f"\n--- Effect Sizes ---")
-        _print_value("Cohen's d (observed)", results.cohens_d_observed)
-        _print_value("Odds Ratio", results.odds_ratio)
-        _print_value("Cohen's U3", results.cohens_u3)
-        typer.echo(f"\n--- Discrimination ---")
-        _print_value("ROC-AUC", results.roc_auc)
-        _print_value("PR-AUC", results.pr_auc)
-        typer.echo(f"\n--- Classification (at threshold) ---")
-        _print_value("Sensitivity", results.sensitivity)
-        _print_value("Specificity", results.specificity)
-        _print_value("PPV", results.ppv)
-        _print_value("NPV", results.npv)
-        _print_value("F1", results.f1)
-        typer.echo(f"\n--- Clinical Utility ---")
-        _print_value("Delta NB", results.delta_nb, decimals=6)
+        _print_summary(
+            f"E2P Parametric Analysis (Cohen's d = {cohens_d})",
+            base_rate,
+            threshold,
+            [
+                ("Effect Sizes", [
+                    ("Cohen's d (observed)", results.cohens_d_observed, 4),
+                    ("Odds Ratio", results.odds_ratio, 4),
+                    ("Cohen's U3", results.cohens_u3, 4),
+                ]),
+                ("Discrimination", [
+                    ("ROC-AUC", results.roc_auc, 4),
+                    ("PR-AUC", results.pr_auc, 4),
+                ]),
+                ("Classification (at threshold)", [
+                    ("Sensitivity", results.sensitivity, 4),
+                    ("Specificity", results.specificity, 4),
+                    ("PPV", results.ppv, 4),
+                    ("NPV", results.npv, 4),
+                    ("F1", results.f1, 4),
+                ]),
+                ("Clinical Utility", [
+                    ("Delta NB", results.delta_nb, 6),
+                ]),
+            ],
+        )
 
 
 @app.command()
@@ -122,6 +146,8 @@ def parametric_continuous(
     Example:
         e2p parametric-continuous --pearson-r 0.4 --base-rate 0.1
     """
+    from e2p import e2p_parametric_continuous
+
     results = e2p_parametric_continuous(
         pearson_r=pearson_r,
         base_rate=base_rate,
@@ -134,22 +160,27 @@ def parametric_continuous(
     if output == "json" or output == "full":
         _print_json(asdict(results))
     else:
-        typer.echo(f"{'='*50}")
-        typer.echo(f"E2P Parametric Analysis (Pearson's r = {pearson_r})")
-        typer.echo(f"{'='*50}")
-        typer.echo(f"\nBase rate: {base_rate:.2%}")
-        typer.echo(f"Threshold: {threshold:.2%}")
-        typer.echo(f"\n--- Effect Sizes ---")
-        _print_value("Cohen's d (observed)", results.cohens_d_observed)
-        _print_value("Odds Ratio", results.odds_ratio)
-        typer.echo(f"\n--- Discrimination ---")
-        _print_value("ROC-AUC", results.roc_auc)
-        _print_value("PR-AUC", results.pr_auc)
-        typer.echo(f"\n--- Classification (at threshold) ---")
-        _print_value("Sensitivity", results.sensitivity)
-        _print_value("Specificity", results.specificity)
-        _print_value("PPV", results.ppv)
-        _print_value("NPV", results.npv)
+        _print_summary(
+            f"E2P Parametric Analysis (Pearson's r = {pearson_r})",
+            base_rate,
+            threshold,
+            [
+                ("Effect Sizes", [
+                    ("Cohen's d (observed)", results.cohens_d_observed, 4),
+                    ("Odds Ratio", results.odds_ratio, 4),
+                ]),
+                ("Discrimination", [
+                    ("ROC-AUC", results.roc_auc, 4),
+                    ("PR-AUC", results.pr_auc, 4),
+                ]),
+                ("Classification (at threshold)", [
+                    ("Sensitivity", results.sensitivity, 4),
+                    ("Specificity", results.specificity, 4),
+                    ("PPV", results.ppv, 4),
+                    ("NPV", results.npv, 4),
+                ]),
+            ],
+        )
 
 
 @app.command()
@@ -185,6 +216,8 @@ def convert(
     
     if from_type:
         # Convert TO Cohen's d
+        from e2p import auc_to_d, odds_ratio_to_d, log_odds_ratio_to_d, cohens_u3_to_d, r_to_d
+
         converters = {
             "auc": ("ROC-AUC", auc_to_d),
             "or": ("Odds Ratio", odds_ratio_to_d),
@@ -203,6 +236,11 @@ def convert(
     
     else:
         # Convert FROM Cohen's d
+        from e2p import (
+            compute_roc_auc_parametric, d_to_odds_ratio, d_to_log_odds_ratio,
+            d_to_cohens_u3, d_to_point_biserial_r,
+        )
+
         converters = {
             "auc": ("ROC-AUC", lambda d: compute_roc_auc_parametric(d)),
             "or": ("Odds Ratio", d_to_odds_ratio),
@@ -232,6 +270,8 @@ def roc_auc(
     Example:
         e2p roc-auc --cohens-d 0.8
     """
+    from e2p import compute_roc_auc_parametric
+
     auc = compute_roc_auc_parametric(cohens_d, sigma1, sigma2)
     _print_value("ROC-AUC", auc)
 
@@ -249,6 +289,8 @@ def pr_auc(
     Example:
         e2p pr-auc --cohens-d 0.8 --base-rate 0.05
     """
+    from e2p import compute_pr_auc_parametric
+
     auc = compute_pr_auc_parametric(cohens_d, base_rate, sigma1, sigma2)
     _print_value("PR-AUC", auc)
 
@@ -3,13 +3,14 @@ E2PContinuous class for continuous outcome analysis.
 """
 
 import numpy as np
-from typing import Tuple, Optional
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Tuple, Optional
 
 from .core import BinaryResults
-from .binary import E2PBinary
-from .utils import transform_for_target_reliability
-from .plotting import plot_continuous
+from .binary import E2PBinary, _resolve_workers, _validate_probabilities
+from .utils import transform_for_target_reliability, transform_for_target_reliability_batched
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 class E2PContinuous:
@@ -27,6 +28,9 @@ class E2PContinuous:
         Continuous outcome values.
     base_rate : float
         Proportion of cases (top base_rate of Y are classified as positive).
+        The Y cutoff is the observed order statistic at index
+        floor(N * (1 - base_rate)) rather than an interpolated percentile, so
+        the case count can differ by one from ``np.percentile``-based splits.
     threshold_prob : float
         Threshold probability (p_t) for computing threshold-dependent metrics.
     n_bootstrap : int, optional
@@ -35,6 +39,17 @@ class E2PContinuous:
         Confidence interval level. Default: 0.95.
     random_state : int, optional
         Random seed for reproducibility.
+    workers : int, optional
+        Number of worker processes for the bootstrap (-1 for all CPUs).
+        Default: 1.
+    cache_results : bool, optional
+        If True, memoize the results of ``compute()`` and
+        ``compute_at_reliability()`` so repeated calls with the same arguments
+        skip the bootstrap. Inputs and settings are treated as immutable after
+        construction. Default: False.
+    dtype : numpy dtype, optional
+        Floating dtype for X and Y. Default None preserves floating input
+        (e.g. float32 stays float32); non-floating input is cast to float64.
     
     Example
     -------
@@ -53,40 +68,70 @@ class E2PContinuous:
         threshold_prob: float,
         n_bootstrap: int = 1000,
         ci_level: float = 0.95,
-        random_state: Optional[int] = None
+        random_state: Optional[int] = None,
+        workers: int = 1,
+        cache_results: bool = False,
+        dtype=None,
     ):
-        self.X = np.asarray(X, dtype=float)
-        self.Y = np.asarray(Y, dtype=float)
+        self.X = self._as_float_array(X, dtype)
+        self.Y = self._as_float_array(Y, dtype)
         self.base_rate = base_rate
         self.threshold_prob = threshold_prob
         self.n_bootstrap = n_bootstrap
         self.ci_level = ci_level
         self.random_state = random_state
+        self.workers = _resolve_workers(workers)
+        self.cache_results = cache_results
+        self._result_cache: dict = {}
+        self._last_reliability = None
+        self._reliability_buffer = None
         
         # Validation
         if len(self.X) != len(self.Y):
             raise ValueError("X and Y must have the same length")
         if len(self.X) == 0:
             raise ValueError("X and Y must have at least one observation")
-        if not 0 < base_rate < 1:
-            raise ValueError("base_rate must be between 0 and 1 (exclusive)")
-        if not 0 < threshold_prob < 1:
-            raise ValueError("threshold_prob must be between 0 and 1 (exclusive)")
+        _validate_probabilities(base_rate, threshold_prob)
         
         # Dichotomize Y based on base_rate
-        # Top base_rate proportion of Y are "cases" (group2)
-        self.y_threshold = np.percentile(self.Y, 100 * (1 - base_rate))
+        # Top base_rate proportion of Y are "cases" (group2); O(N) selection
+        # of the cutoff instead of a full sort
+        n = len(self.Y)
+        k = min(int(np.floor(n * (1 - base_rate) + 1e-9)), n - 1)
+        self.y_threshold = np.partition(self.Y, k)[k]
         self.is_case = self.Y >= self.y_threshold
+        # The split is fixed after construction; keep it as index arrays so
+        # transformed copies of X can be split with a single gather each
+        self._ctrl_idx = np.flatnonzero(~self.is_case)
+        self._case_idx = np.flatnonzero(self.is_case)
+        self._group_order = np.concatenate([self._ctrl_idx, self._case_idx])
         
         # Split X into two groups based on dichotomized Y
-        self.group1 = self.X[~self.is_case]  # controls (lower Y)
-        self.group2 = self.X[self.is_case]   # cases (higher Y)
+        self.group1, self.group2 = self._split_groups(self.X)  # controls, cases
         
         if len(self.group1) == 0 or len(self.group2) == 0:
             raise ValueError("Dichotomization resulted in empty group(s)")
-        
-        if random_state is not None:
-            np.random.seed(random_state)
+    
+    def _split_groups(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split ``values`` into (controls, cases) with the fixed case/control split.
+
+        One gather writes both groups into a single buffer; the returned
+        arrays are C-contiguous views of it rather than two separate copies.
+        """
+        grouped = values.take(self._group_order)
+        n_ctrl = len(self._ctrl_idx)
+        return grouped[:n_ctrl], grouped[n_ctrl:]
+    
+    @staticmethod
+    def _as_float_array(values, dtype) -> np.ndarray:
+        """Contiguous floating array, preserving floating input dtypes unless overridden."""
+        arr = np.ascontiguousarray(values, dtype=dtype) if dtype is not None else np.ascontiguousarray(values)
+        if not np.issubdtype(arr.dtype, np.floating):
+            if dtype is not None:
+                raise ValueError("dtype must be a floating point type")
+            arr = arr.astype(float)
+        return arr
     
     def compute(self) -> BinaryResults:
         """
@@ -97,6 +142,10 @@ class E2PContinuous:
         BinaryResults
             Dataclass containing all metrics with CIs.
         """
+        key = ("compute",)
+        if self.cache_results and key in self._result_cache:
+            return self._result_cache[key]
+        
         calculator = E2PBinary(
             group1=self.group1,
             group2=self.group2,
@@ -104,9 +153,13 @@ class E2PContinuous:
             threshold_prob=self.threshold_prob,
             n_bootstrap=self.n_bootstrap,
             ci_level=self.ci_level,
-            random_state=self.random_state
+            random_state=self.random_state,
+            workers=self.workers
         )
-        return calculator.compute()
+        results = calculator.compute()
+        if self.cache_results:
+            self._result_cache[key] = results
+        return results
     
     def compute_at_threshold(self, threshold_prob: float) -> dict:
         """
@@ -122,6 +175,74 @@ class E2PContinuous:
             random_state=self.random_state
         )
         return calculator.compute_at_threshold(threshold_prob)
+    
+    def compute_at_thresholds(self, threshold_probs) -> dict:
+        """
+        Compute threshold-dependent metrics for several threshold probabilities.
+        
+        Sweeps share one KDE fit and one sort of each group; see
+        ``E2PBinary.compute_at_thresholds``. Returns a dict of arrays.
+        """
+        calculator = E2PBinary(
+            group1=self.group1,
+            group2=self.group2,
+            base_rate=self.base_rate,
+            threshold_prob=self.threshold_prob,
+            n_bootstrap=0,
+            ci_level=self.ci_level,
+            random_state=self.random_state
+        )
+        return calculator.compute_at_thresholds(threshold_probs)
+
+    def _prepare_reliability_groups(self, r_x_current, r_x_target,
+                                    r_y_current, r_y_target, center,
+                                    inplace: bool = False):
+        """
+        Validate reliability arguments and transform X (and optionally Y).
+
+        Returns ``(X_tgt, Y_tgt, group1_tgt, group2_tgt)`` using the fixed
+        case/control split. The most recent result is kept so that
+        ``plot_deattenuated`` right after ``compute_at_reliability`` with the
+        same arguments does not transform again. With ``inplace=True`` the
+        transform writes into a buffer owned by the instance instead of
+        allocating new arrays.
+        """
+        key = (r_x_current, r_x_target, r_y_current, r_y_target, center)
+        if self._last_reliability is not None and self._last_reliability[0] == key:
+            return self._last_reliability[1]
+
+        # Optional Y transform (does not affect split in this scope)
+        if (r_y_current is None) ^ (r_y_target is None):
+            raise ValueError("Provide both r_y_current and r_y_target, or neither")
+        buffer = None
+        if inplace:
+            # Same dtype as the allocating path produces (float32 stays float32)
+            if r_y_current is not None:
+                dtype = np.result_type(self.X, self.Y)
+            else:
+                dtype = self.X.dtype
+            if self._reliability_buffer is None or self._reliability_buffer.dtype != dtype:
+                self._reliability_buffer = np.empty((2, len(self.X)), dtype=dtype)
+            buffer = self._reliability_buffer
+        if r_y_current is not None and r_y_target is not None:
+            stacked = np.stack([self.X, self.Y], out=buffer)
+            X_tgt, Y_tgt = transform_for_target_reliability_batched(
+                stacked,
+                [r_x_current, r_y_current],
+                [r_x_target, r_y_target],
+                center=center,
+                out=buffer,
+            )
+        else:
+            X_tgt = transform_for_target_reliability(
+                self.X, r_x_current, r_x_target, center=center,
+                out=None if buffer is None else buffer[0],
+            )
+            Y_tgt = self.Y
+
+        prepared = (X_tgt, Y_tgt, *self._split_groups(X_tgt))
+        self._last_reliability = (key, prepared)
+        return prepared
 
     def compute_at_reliability(
         self,
@@ -131,26 +252,30 @@ class E2PContinuous:
         r_y_current: Optional[float] = None,
         r_y_target: Optional[float] = None,
         center: str = "mean",
+        inplace: bool = False,
     ) -> BinaryResults:
         """
         Compute all metrics after deterministic reliability transformation.
 
+        Set ``inplace=True`` when sweeping many reliabilities: the transformed
+        X (and Y) are written into one reusable instance buffer instead of
+        fresh arrays on every call.
+
         Notes
         -----
         - The case/control split is kept fixed (the original `is_case` mask).
         - X is always transformed. Y is optionally transformed for completeness,
           but does not currently change metrics because the split is fixed.
+        - With ``cache_results=True``, results are memoized per
+          (reliabilities, center, threshold_prob).
         """
-        X_tgt = transform_for_target_reliability(self.X, r_x_current, r_x_target, center=center)
+        key = (r_x_current, r_x_target, r_y_current, r_y_target, center, self.threshold_prob)
+        if self.cache_results and key in self._result_cache:
+            return self._result_cache[key]
 
-        # Optional Y transform (does not affect split in this scope)
-        if (r_y_current is None) ^ (r_y_target is None):
-            raise ValueError("Provide both r_y_current and r_y_target, or neither")
-        if r_y_current is not None and r_y_target is not None:
-            _ = transform_for_target_reliability(self.Y, r_y_current, r_y_target, center=center)
-
-        group1_tgt = X_tgt[~self.is_case]
-        group2_tgt = X_tgt[self.is_case]
+        _, _, group1_tgt, group2_tgt = self._prepare_reliability_groups(
+            r_x_current, r_x_target, r_y_current, r_y_target, center, inplace=inplace
+        )
 
         calculator = E2PBinary(
             group1=group1_tgt,
@@ -160,16 +285,21 @@ class E2PContinuous:
             n_bootstrap=self.n_bootstrap,
             ci_level=self.ci_level,
             random_state=self.random_state,
+            workers=self.workers,
         )
-        return calculator.compute()
+        results = calculator.compute()
+        if self.cache_results:
+            self._result_cache[key] = results
+        return results
     
     def plot(self, results: BinaryResults = None,
              figsize: Tuple[float, float] = (10, 8),
              x_label: str = "Predictor (X)",
-             y_label: str = "Outcome (Y)") -> plt.Figure:
+             y_label: str = "Outcome (Y)") -> "plt.Figure":
         """
         Plot scatterplot of X vs Y with threshold lines and metrics.
         """
+        from .plotting import plot_continuous
         return plot_continuous(
             self.X, self.Y,
             self.base_rate, self.threshold_prob,
@@ -192,35 +322,24 @@ class E2PContinuous:
         figsize: Tuple[float, float] = (16, 9),
         x_label: str = "Predictor (X)",
         y_label: str = "Outcome (Y)",
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """
         Plot the standard continuous panels after applying reliability transformation.
 
         Keeps the original case/control split fixed (based on observed Y).
         Returns a fresh matplotlib Figure (a separate window when shown).
         """
-        X_tgt = transform_for_target_reliability(self.X, r_x_current, r_x_target, center=center)
-
-        if (r_y_current is None) ^ (r_y_target is None):
-            raise ValueError("Provide both r_y_current and r_y_target, or neither")
-        Y_tgt = (
-            transform_for_target_reliability(self.Y, r_y_current, r_y_target, center=center)
-            if (r_y_current is not None and r_y_target is not None)
-            else self.Y
+        X_tgt, Y_tgt, group1_tgt, group2_tgt = self._prepare_reliability_groups(
+            r_x_current, r_x_target, r_y_current, r_y_target, center
         )
 
-        group1_tgt = X_tgt[~self.is_case]
-        group2_tgt = X_tgt[self.is_case]
-
-        results = E2PBinary(
-            group1=group1_tgt,
-            group2=group2_tgt,
-            base_rate=self.base_rate,
-            threshold_prob=self.threshold_prob,
-            n_bootstrap=self.n_bootstrap,
-            ci_level=self.ci_level,
-            random_state=self.random_state,
-        ).compute()
+        results = self.compute_at_reliability(
+            r_x_current,
+            r_x_target,
+            r_y_current=r_y_current,
+            r_y_target=r_y_target,
+            center=center,
+        )
 
         title_bits = [f"Deattenuated (X reliability: {r_x_current:.2f}→{r_x_target:.2f}"]
         if r_y_current is not None and r_y_target is not None:
@@ -228,6 +347,7 @@ class E2PContinuous:
         title_bits.append("; fixed split)")
         title = "".join(title_bits)
 
+        from .plotting import plot_continuous
         return plot_continuous(
             X_tgt,
             Y_tgt,
@@ -246,7 +366,8 @@ class E2PContinuous:
 
 
 def e2p_continuous(X, Y, base_rate, threshold_prob=0.5,
-                   n_bootstrap=1000, ci_level=0.95, random_state=None) -> BinaryResults:
+                   n_bootstrap=1000, ci_level=0.95, random_state=None,
+                   workers=1) -> BinaryResults:
     """
     Convenience function to compute E2P metrics from continuous data.
     
@@ -268,6 +389,9 @@ def e2p_continuous(X, Y, base_rate, threshold_prob=0.5,
         Confidence interval level. Default: 0.95.
     random_state : int, optional
         Random seed for reproducibility.
+    workers : int, optional
+        Number of worker processes for the bootstrap (-1 for all CPUs).
+        Default: 1.
     
     Returns
     -------
@@ -281,7 +405,8 @@ def e2p_continuous(X, Y, base_rate, threshold_prob=0.5,
         threshold_prob=threshold_prob,
         n_bootstrap=n_bootstrap,
         ci_level=ci_level,
-        random_state=random_state
+        random_state=random_state,
+        workers=workers
     )
     return calculator.compute()
 
@@ -299,6 +424,7 @@ def e2p_continuous_deattenuated(
     n_bootstrap: int = 1000,
     ci_level: float = 0.95,
     random_state: Optional[int] = None,
+    workers: int = 1,
     center: str = "mean",
 ) -> BinaryResults:
     """
@@ -314,6 +440,7 @@ def e2p_continuous_deattenuated(
         n_bootstrap=n_bootstrap,
         ci_level=ci_level,
         random_state=random_state,
+        workers=workers,
     )
     return calculator.compute_at_reliability(
         r_x_current=r_x_current,
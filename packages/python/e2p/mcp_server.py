@@ -11,11 +11,12 @@ Usage:
     e2p-mcp
 """
 
-from dataclasses import asdict
-from typing import Literal
+import functools
+from dataclasses import fields
+from typing import Literal, get_args
 
 try:
-    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp import Context, FastMCP
 except ImportError:
     raise ImportError(
         "mcp is required for the MCP server. Install with: pip install e2p[mcp]"
@@ -41,12 +42,143 @@ from e2p import (
 )
 
 EffectSizeType = Literal["d", "auc", "or", "log_or", "u3", "r"]
+_EFFECT_SIZE_TYPES = get_args(EffectSizeType)
 ResultView = Literal["true", "observed"]
 ThresholdMetric = Literal["youden", "f1"]
 
 # Create the MCP server
 mcp = FastMCP("e2p")
 
+@functools.cache
+def _field_names(cls) -> tuple:
+    """Field names of a dataclass type, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _shallow_asdict(obj) -> dict:
+    """
+    Field dict of a flat result dataclass.
+
+    ``dataclasses.asdict`` deep-copies recursively; the parametric results
+    only hold scalars, so one level of attribute access is enough.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+# Every tool is a pure function of its scalar arguments, so agents repeating a
+# call during iterative reasoning get the memoized result back.
+_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parametric_binary(cohens_d, base_rate, threshold_prob, icc1, icc2, kappa, view):
+    return e2p_parametric_binary(
+        cohens_d=cohens_d,
+        base_rate=base_rate,
+        threshold_prob=threshold_prob,
+        icc1=icc1,
+        icc2=icc2,
+        kappa=kappa,
+        view=view,
+    )
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parametric_continuous(pearson_r, base_rate, threshold_prob,
+                           reliability_x, reliability_y, view):
+    return e2p_parametric_continuous(
+        pearson_r=pearson_r,
+        base_rate=base_rate,
+        threshold_prob=threshold_prob,
+        reliability_x=reliability_x,
+        reliability_y=reliability_y,
+        view=view,
+    )
+
+
+def _identity(x):
+    return x
+
+
+# Converters to Cohen's d
+_TO_D = {
+    "d": _identity,
+    "auc": auc_to_d,
+    "or": odds_ratio_to_d,
+    "log_or": log_odds_ratio_to_d,
+    "u3": cohens_u3_to_d,
+    "r": r_to_d,
+}
+
+# Converters from Cohen's d; "r" also needs the base rate and is called with it
+_FROM_D = {
+    "d": _identity,
+    "auc": compute_roc_auc_parametric,
+    "or": d_to_odds_ratio,
+    "log_or": d_to_log_odds_ratio,
+    "u3": d_to_cohens_u3,
+    "r": d_to_point_biserial_r,
+}
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _convert_effect_size(value, from_type, to_type, base_rate):
+    """Return ``(cohens_d, converted_value)`` for a validated conversion."""
+    # One hash lookup per side; a missing entry doubles as validation
+    to_d = _TO_D.get(from_type)
+    if to_d is None:
+        raise ValueError(f"Unknown from_type: {from_type}. Use: {list(_EFFECT_SIZE_TYPES)}")
+    from_d = _FROM_D.get(to_type)
+    if from_d is None:
+        raise ValueError(f"Unknown to_type: {to_type}. Use: {list(_EFFECT_SIZE_TYPES)}")
+    
+    if from_type == to_type:
+        # No-op conversion: skip the round trip through d (and its inverse)
+        return (value if from_type == "d" else None), value
+    
+    # Convert: from_type -> d -> to_type
+    d = value if from_type == "d" else to_d(value)
+    if to_type == "r":
+        return d, from_d(d, base_rate)
+    if to_type == "d":
+        return d, d
+    return d, from_d(d)
+
+
+_compute_roc_auc = functools.lru_cache(maxsize=_CACHE_SIZE)(compute_roc_auc_parametric)
+_compute_pr_auc = functools.lru_cache(maxsize=_CACHE_SIZE)(compute_pr_auc_parametric)
+_find_threshold = functools.lru_cache(maxsize=_CACHE_SIZE)(find_optimal_threshold)
+
+
+# Agents tend to sweep ICC over a small grid for many effect sizes, so the
+# sigma inflation gets its own table independent of true_d and kappa.
+_sigma_from_icc = functools.lru_cache(maxsize=256)(compute_sigma_from_icc)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _apply_reliability_attenuation(true_d, kappa, icc):
+    observed_d = attenuate_d(true_d, kappa, icc1=icc, icc2=icc)
+    sigma = _sigma_from_icc(icc) if icc < 1.0 else 1.0
+    return observed_d, sigma
+
+
+_CACHED_TOOLS = (
+    _parametric_binary,
+    _parametric_continuous,
+    _convert_effect_size,
+    _compute_roc_auc,
+    _compute_pr_auc,
+    _find_threshold,
+    _apply_reliability_attenuation,
+    _sigma_from_icc,
+)
+
+
+def clear_caches():
+    """Drop all memoized tool results."""
+    for cached in _CACHED_TOOLS:
+        cached.cache_clear()
+
 
 @mcp.tool()
 def parametric_binary(
@@ -78,16 +210,91 @@ def parametric_binary(
         discrimination metrics (roc_auc, pr_auc), and threshold-dependent
         metrics (sensitivity, specificity, ppv, npv, f1, delta_nb, etc.)
     """
-    results = e2p_parametric_binary(
-        cohens_d=cohens_d,
-        base_rate=base_rate,
-        threshold_prob=threshold_prob,
-        icc1=icc1,
-        icc2=icc2,
-        kappa=kappa,
-        view=view,
+    results = _parametric_binary(
+        cohens_d, base_rate, threshold_prob, icc1, icc2, kappa, view
     )
-    return asdict(results)
+    return _shallow_asdict(results)
+
+
+@mcp.tool()
+def parametric_binary_batch(
+    cohens_d: list[float],
+    base_rate: float,
+    threshold_prob: float = 0.5,
+    icc1: float = 1.0,
+    icc2: float = 1.0,
+    kappa: float = 1.0,
+    view: ResultView = "observed",
+) -> list[dict]:
+    """
+    Compute predictive metrics for a grid of Cohen's d values in one call.
+    
+    Equivalent to calling parametric_binary once per entry of cohens_d with
+    the remaining arguments shared, which makes sensitivity analyses over
+    effect sizes a single tool call.
+    
+    Args:
+        cohens_d: List of Cohen's d effect sizes
+        base_rate: Prevalence of the positive class (0 to 1)
+        threshold_prob: Decision threshold probability (0 to 1, default 0.5)
+        icc1: ICC/reliability of predictor in group 1 (0 to 1, default 1.0)
+        icc2: ICC/reliability of predictor in group 2 (0 to 1, default 1.0)
+        kappa: Diagnostic/label reliability (0 to 1, default 1.0)
+        view: "true" for latent metrics or "observed" for attenuated metrics
+    
+    Returns:
+        List of dictionaries, one per cohens_d value, in input order, with
+        the same keys as parametric_binary.
+    """
+    return [
+        _shallow_asdict(_parametric_binary(
+            float(d), base_rate, threshold_prob, icc1, icc2, kappa, view
+        ))
+        for d in cohens_d
+    ]
+
+
+@mcp.tool()
+async def parametric_binary_stream(
+    cohens_d_values: list[float],
+    base_rate: float,
+    ctx: Context,
+    threshold_prob: float = 0.5,
+    icc1: float = 1.0,
+    icc2: float = 1.0,
+    kappa: float = 1.0,
+    view: ResultView = "observed",
+) -> dict:
+    """
+    Compute predictive metrics for a grid of Cohen's d values, reporting progress.
+    
+    Like parametric_binary_batch, but sends an MCP progress notification after
+    each value so clients can follow long sweeps, and returns the results in
+    columnar form (one list per metric) to keep the response compact.
+    
+    Args:
+        cohens_d_values: List of Cohen's d effect sizes
+        base_rate: Prevalence of the positive class (0 to 1)
+        threshold_prob: Decision threshold probability (0 to 1, default 0.5)
+        icc1: ICC/reliability of predictor in group 1 (0 to 1, default 1.0)
+        icc2: ICC/reliability of predictor in group 2 (0 to 1, default 1.0)
+        kappa: Diagnostic/label reliability (0 to 1, default 1.0)
+        view: "true" for latent metrics or "observed" for attenuated metrics
+    
+    Returns:
+        Dictionary mapping each parametric_binary key to a list of values,
+        one per entry of cohens_d_values, in input order.
+    """
+    total = len(cohens_d_values)
+    columns = {}
+    for i, d in enumerate(cohens_d_values):
+        row = _shallow_asdict(_parametric_binary(
+            float(d), base_rate, threshold_prob, icc1, icc2, kappa, view
+        ))
+        for key, value in row.items():
+            columns.setdefault(key, []).append(value)
+        await ctx.report_progress(i + 1, total)
+    return columns
 
 
 @mcp.tool()
@@ -116,15 +323,10 @@ def parametric_continuous(
     Returns:
         Dictionary with effect sizes and classification metrics.
     """
-    results = e2p_parametric_continuous(
-        pearson_r=pearson_r,
-        base_rate=base_rate,
-        threshold_prob=threshold_prob,
-        reliability_x=reliability_x,
-        reliability_y=reliability_y,
-        view=view,
+    results = _parametric_continuous(
+        pearson_r, base_rate, threshold_prob, reliability_x, reliability_y, view
     )
-    return asdict(results)
+    return _shallow_asdict(results)
 
 
 @mcp.tool()
@@ -147,36 +349,11 @@ def convert_effect_size(
         base_rate: Base rate, only needed for point-biserial r conversion
     
     Returns:
-        Dictionary with input value, converted value, and metadata
+        Dictionary with input value, converted value, and metadata.
+        cohens_d is null when from_type equals to_type (other than "d"),
+        since no conversion through d takes place.
     """
-    # Converters to Cohen's d
-    to_d = {
-        "d": lambda x: x,
-        "auc": auc_to_d,
-        "or": odds_ratio_to_d,
-        "log_or": log_odds_ratio_to_d,
-        "u3": cohens_u3_to_d,
-        "r": r_to_d,
-    }
-    
-    # Converters from Cohen's d
-    from_d = {
-        "d": lambda d: d,
-        "auc": compute_roc_auc_parametric,
-        "or": d_to_odds_ratio,
-        "log_or": d_to_log_odds_ratio,
-        "u3": d_to_cohens_u3,
-        "r": lambda d: d_to_point_biserial_r(d, base_rate),
-    }
-    
-    if from_type not in to_d:
-        raise ValueError(f"Unknown from_type: {from_type}. Use: {list(to_d.keys())}")
-    if to_type not in from_d:
-        raise ValueError(f"Unknown to_type: {to_type}. Use: {list(from_d.keys())}")
-    
-    # Convert: from_type -> d -> to_type
-    d = to_d[from_type](value)
-    result = from_d[to_type](d)
+    d, result = _convert_effect_size(value, from_type, to_type, base_rate)
     
     return {
         "input_value": value,
@@ -207,7 +384,7 @@ def compute_roc_auc(
     Returns:
         Dictionary with ROC-AUC value
     """
-    auc = compute_roc_auc_parametric(cohens_d, sigma1, sigma2)
+    auc = _compute_roc_auc(cohens_d, sigma1, sigma2)
     return {"cohens_d": cohens_d, "roc_auc": auc}
 
 
@@ -233,7 +410,7 @@ def compute_pr_auc(
     Returns:
         Dictionary with PR-AUC value
     """
-    auc = compute_pr_auc_parametric(cohens_d, base_rate, sigma1, sigma2)
+    auc = _compute_pr_auc(cohens_d, base_rate, sigma1, sigma2)
     return {"cohens_d": cohens_d, "base_rate": base_rate, "pr_auc": auc}
 
 
@@ -258,7 +435,7 @@ def find_threshold(
     Returns:
         Dictionary with optimal threshold value
     """
-    threshold = find_optimal_threshold(cohens_d, base_rate, sigma1, sigma2, metric)
+    threshold = _find_threshold(cohens_d, base_rate, sigma1, sigma2, metric)
     return {
         "cohens_d": cohens_d,
         "base_rate": base_rate,
@@ -287,8 +464,7 @@ def apply_reliability_attenuation(
     Returns:
         Dictionary with true d, observed d, and reliability parameters
     """
-    observed_d = attenuate_d(true_d, kappa, icc1=icc, icc2=icc)
-    sigma = compute_sigma_from_icc(icc) if icc < 1.0 else 1.0
+    observed_d, sigma = _apply_reliability_attenuation(true_d, kappa, icc)
 
     return {
         "true_d": true_d,
@@ -299,8 +475,26 @@ def apply_reliability_attenuation(
     }
 
 
+def _warmup():
+    """
+    Run every tool once with canonical arguments so the first agent request
+    does not pay one-off costs (lazy imports, JIT loading, quadrature grids).
+    """
+    try:
+        parametric_binary(cohens_d=0.5, base_rate=0.5)
+        parametric_continuous(pearson_r=0.3, base_rate=0.5)
+        convert_effect_size(0.5, "d", "r")
+        compute_roc_auc(0.5)
+        compute_pr_auc(0.5, 0.5)
+        find_threshold(0.5, 0.5)
+        apply_reliability_attenuation(0.5, icc=0.8)
+    except Exception:  # pragma: no cover - warmup must never block startup
+        pass
+
+
 def main():
     """Entry point for the MCP server."""
+    _warmup()
     mcp.run()
 
 
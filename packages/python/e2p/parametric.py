@@ -7,16 +7,36 @@ idealized normal distributions, without requiring empirical data.
 This mirrors the JavaScript simulator's functionality for programmatic/AI agent use.
 """
 
+import math
+import sys
+
 import numpy as np
-from scipy import stats
-from scipy.optimize import minimize_scalar
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, Literal
 
+from ._numba_kernels import (
+    _binary_metrics,
+    _closed_form_threshold,
+    _golden_section_threshold,
+    _pt_from_threshold,
+    binary_metrics,
+    pr_auc_normal,
+    optimal_threshold,
+    threshold_from_pt,
+)
+
+
+# __slots__ via the dataclass decorator needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ParametricResults:
-    """Results from parametric e2p computation."""
+    """
+    Results from parametric e2p computation.
+
+    Instances are immutable, so memoized results can be shared safely.
+    """
     # Input parameters
     cohens_d_true: float
     cohens_d_observed: float
@@ -57,15 +77,57 @@ class ParametricResults:
     post_test_prob_minus: float
     delta_nb: float
 
+    @classmethod
+    def from_record(cls, record) -> 'ParametricResults':
+        """Build a single result from one row of a batch result array."""
+        return cls(*(float(record[name]) for name in _RESULT_DTYPE.names))
+
+
+# Structure-of-arrays layout for batch results: one float64 column per
+# ParametricResults field, in the same order
+_RESULT_DTYPE = np.dtype([(f.name, 'f8') for f in fields(ParametricResults)])
+
+
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+# Logistic <-> normal effect-size scaling (Hasselblad & Hedges)
+_PI_OVER_SQRT3 = math.pi / math.sqrt(3.0)
+_SQRT3_OVER_PI = math.sqrt(3.0) / math.pi
+
+
+def _validate_ranges(*checks) -> None:
+    """
+    Check ``(name, value, lo, hi, hi_inclusive)`` tuples in one pass.
+
+    Each value must lie in (lo, hi), or (lo, hi] when ``hi_inclusive``.
+    Scalars use plain comparisons; arrays must satisfy the bound everywhere.
+    """
+    for name, value, lo, hi, hi_inclusive in checks:
+        if isinstance(value, np.ndarray):
+            ok = np.all((value > lo) & ((value <= hi) if hi_inclusive else (value < hi)))
+        else:
+            ok = lo < value <= hi if hi_inclusive else lo < value < hi
+        if not ok:
+            if hi_inclusive:
+                raise ValueError(f"{name} must be in ({lo}, {hi}]")
+            raise ValueError(f"{name} must be between {lo} and {hi} (exclusive)")
+
 
 def _normal_pdf(x: float, mean: float, std: float) -> float:
     """Normal probability density function."""
-    return np.exp(-0.5 * ((x - mean) / std) ** 2) / (std * np.sqrt(2 * np.pi))
+    inv_std = 1.0 / std
+    z = (x - mean) * inv_std
+    return np.exp(-0.5 * z * z) * (inv_std * _INV_SQRT_2PI)
 
 
 def _normal_cdf(x: float, mean: float = 0.0, std: float = 1.0) -> float:
     """Normal cumulative distribution function."""
-    return stats.norm.cdf(x, loc=mean, scale=std)
+    if isinstance(x, (int, float)):
+        # Scalar fast path: libm erfc, no array dispatch; erfc keeps the
+        # lower tail accurate where 1 + erf(z) would cancel
+        return 0.5 * math.erfc(-(x - mean) / (std * _SQRT2))
+    from scipy.special import ndtr
+    return ndtr((np.asarray(x) - mean) / std)
 
 
 def attenuate_mean_difference(
@@ -92,6 +154,8 @@ def attenuate_mean_difference(
     float
         Observed mean difference (not yet re-standardized by ICC).
     """
+    if isinstance(kappa, (int, float)):
+        return true_d * math.sqrt(math.sin(math.pi / 2 * kappa))
     return true_d * np.sqrt(np.sin(np.pi / 2 * kappa))
 
 
@@ -132,6 +196,9 @@ def attenuate_d(
     if not 0 < icc2 <= 1:
         raise ValueError("icc2 must be in (0, 1]")
     icc_factor = (2.0 * icc1 * icc2) / (icc1 + icc2)
+    # ICCs are scalars (the range checks above need them to be); kappa may be an array
+    if isinstance(kappa, (int, float)):
+        return true_d * math.sqrt(icc_factor * math.sin(math.pi / 2 * kappa))
     return true_d * np.sqrt(icc_factor * np.sin(np.pi / 2 * kappa))
 
 
@@ -156,7 +223,7 @@ def compute_sigma_from_icc(icc: float) -> float:
     """
     if icc <= 0 or icc > 1:
         raise ValueError("ICC must be in (0, 1]")
-    return 1.0 / np.sqrt(icc)
+    return 1.0 / math.sqrt(icc)
 
 
 def compute_roc_auc_parametric(
@@ -185,8 +252,13 @@ def compute_roc_auc_parametric(
     float
         ROC-AUC value.
     """
-    d_att = cohens_d * np.sqrt(2) / np.sqrt(sigma1**2 + sigma2**2)
-    return _normal_cdf(d_att / np.sqrt(2))
+    if isinstance(cohens_d, (int, float)) and isinstance(sigma1, (int, float)) \
+            and isinstance(sigma2, (int, float)):
+        # Phi(d / sqrt(s1^2 + s2^2)) straight from math.erfc for scalar input
+        return 0.5 * math.erfc(-cohens_d / math.sqrt(2.0 * (sigma1**2 + sigma2**2)))
+    # Array input: Phi(d / sqrt(s1^2 + s2^2)) as one ndtr ufunc call
+    from scipy.special import ndtr
+    return ndtr(np.asarray(cohens_d) / np.sqrt(np.square(sigma1) + np.square(sigma2)))
 
 
 def compute_pr_auc_parametric(
@@ -221,52 +293,45 @@ def compute_pr_auc_parametric(
         return 0.0
     if base_rate >= 1:
         return 1.0
+    if pr_auc_normal is not None:
+        return pr_auc_normal(float(cohens_d), float(base_rate), float(sigma1),
+                             float(sigma2), int(n_points))
     
     # Generate thresholds spanning the distributions
     min_thresh = min(0, cohens_d) - 6 * max(sigma1, sigma2)
     max_thresh = max(0, cohens_d) + 6 * max(sigma1, sigma2)
     thresholds = np.linspace(max_thresh, min_thresh, n_points)
     
-    recalls = []
-    precisions = []
+    from scipy.special import ndtr
+    # Sensitivity (recall) = P(X >= t | positive); FPR = P(X >= t | negative)
+    recalls = 1 - ndtr((thresholds - cohens_d) * (1.0 / sigma2))
+    fprs = 1 - ndtr(thresholds * (1.0 / sigma1))
     
-    for t in thresholds:
-        # Sensitivity (recall) = P(X >= t | positive) = 1 - CDF(t; d, sigma2)
-        recall = 1 - _normal_cdf(t, cohens_d, sigma2)
-        # FPR = P(X >= t | negative) = 1 - CDF(t; 0, sigma1)
-        fpr = 1 - _normal_cdf(t, 0, sigma1)
-        
-        # Precision = (base_rate * recall) / (base_rate * recall + (1 - base_rate) * fpr)
-        numerator = base_rate * recall
-        denominator = numerator + (1 - base_rate) * fpr
-        
-        precision = 1.0 if denominator < 1e-9 else numerator / denominator
-        
-        recalls.append(recall)
-        precisions.append(precision)
+    # Precision = (base_rate * recall) / (base_rate * recall + (1 - base_rate) * fpr)
+    numerators = base_rate * recalls
+    denominators = numerators + (1 - base_rate) * fprs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precisions = np.where(denominators < 1e-9, 1.0, numerators / denominators)
     
     # Add boundary points
-    points = [{'recall': 0, 'precision': 1.0}]
-    for r, p in zip(recalls, precisions):
-        points.append({'recall': r, 'precision': p})
-    points.append({'recall': 1.0, 'precision': base_rate})
-    
-    # Remove duplicates and sort by recall
-    unique_points = []
-    seen_recalls = set()
-    for pt in sorted(points, key=lambda x: x['recall']):
-        if pt['recall'] not in seen_recalls:
-            unique_points.append(pt)
-            seen_recalls.add(pt['recall'])
+    recalls = np.concatenate(([0.0], recalls, [1.0]))
+    precisions = np.concatenate(([1.0], precisions, [base_rate]))
+    
+    # Sort by recall, keeping the first point of each duplicated recall
+    recalls, first = np.unique(recalls, return_index=True)
+    precisions = precisions[first]
     
     # Compute area using trapezoidal rule
-    area = 0.0
-    for i in range(1, len(unique_points)):
-        delta_recall = unique_points[i]['recall'] - unique_points[i-1]['recall']
-        avg_precision = (unique_points[i]['precision'] + unique_points[i-1]['precision']) / 2
-        area += delta_recall * avg_precision
+    area = float(np.sum(np.diff(recalls) * (precisions[1:] + precisions[:-1]) / 2))
     
-    return np.clip(area, 0, 1)
+    return 0.0 if area < 0 else 1.0 if area > 1 else area
+
+
+BINARY_METRIC_KEYS = (
+    'fpr', 'tpr', 'sensitivity', 'specificity', 'ppv', 'npv', 'accuracy',
+    'balanced_accuracy', 'f1', 'mcc', 'lr_plus', 'lr_minus', 'dor', 'youden_j',
+    'g_mean', 'kappa', 'post_test_prob_plus', 'post_test_prob_minus', 'delta_nb',
+)
 
 
 def compute_binary_metrics(
@@ -275,6 +340,7 @@ def compute_binary_metrics(
     threshold: float,
     sigma1: float = 1.0,
     sigma2: float = 1.0,
+    pt: Optional[float] = None,
 ) -> dict:
     """
     Compute all threshold-dependent metrics for idealized normal distributions.
@@ -293,105 +359,20 @@ def compute_binary_metrics(
         Standard deviation of group 1 (controls). Default 1.0.
     sigma2 : float
         Standard deviation of group 2 (cases). Default 1.0.
+    pt : float, optional
+        Threshold probability for delta net benefit. Defaults to the p_t
+        implied by ``threshold``; pass it when already known to skip the
+        density evaluations.
     
     Returns
     -------
     dict
         Dictionary containing all computed metrics.
     """
-    # FPR and TPR at threshold
-    fpr = 1 - _normal_cdf(threshold, 0, sigma1)
-    tpr = 1 - _normal_cdf(threshold, cohens_d, sigma2)
-    
-    sensitivity = tpr
-    specificity = 1 - fpr
-    
-    # PPV (precision)
-    if sensitivity == 0:
-        ppv = 1.0  # Convention when sensitivity is 0
-    else:
-        ppv_num = sensitivity * base_rate
-        ppv_denom = ppv_num + (1 - specificity) * (1 - base_rate)
-        ppv = ppv_num / ppv_denom if ppv_denom > 0 else 1.0
-    
-    # NPV
-    npv_num = specificity * (1 - base_rate)
-    npv_denom = npv_num + (1 - sensitivity) * base_rate
-    npv = npv_num / npv_denom if npv_denom > 0 else 1.0
-    
-    # Accuracy metrics
-    accuracy = sensitivity * base_rate + specificity * (1 - base_rate)
-    balanced_accuracy = (sensitivity + specificity) / 2
-    
-    # F1 score
-    f1 = 2 * (ppv * sensitivity) / (ppv + sensitivity) if (ppv + sensitivity) > 0 else 0.0
-    
-    # MCC (Matthews Correlation Coefficient)
-    tp = sensitivity * base_rate
-    tn = specificity * (1 - base_rate)
-    fp = (1 - specificity) * (1 - base_rate)
-    fn = (1 - sensitivity) * base_rate
-    
-    mcc_num = tp * tn - fp * fn
-    mcc_denom = np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))
-    mcc = mcc_num / mcc_denom if mcc_denom > 0 else 0.0
-    
-    # Likelihood ratios
-    lr_plus = sensitivity / (1 - specificity) if specificity < 1 else np.inf
-    lr_minus = (1 - sensitivity) / specificity if specificity > 0 else np.inf
-    dor = lr_plus / lr_minus if (lr_minus > 0 and lr_minus != np.inf and lr_plus != np.inf) else np.inf
-    
-    # Youden's J and G-mean
-    youden_j = sensitivity + specificity - 1
-    g_mean = np.sqrt(sensitivity * specificity)
-    
-    # Cohen's kappa
-    p_yes_true = base_rate
-    p_yes_pred = tp + fp
-    p_no_true = 1 - p_yes_true
-    p_no_pred = 1 - p_yes_pred
-    po = accuracy
-    pe_chance = p_yes_true * p_yes_pred + p_no_true * p_no_pred
-    kappa_stat = (po - pe_chance) / (1 - pe_chance) if pe_chance < 1 else 0.0
-    
-    # Post-test probabilities
-    pre_test_odds = base_rate / (1 - base_rate) if base_rate < 1 else np.inf
-    post_test_odds_plus = pre_test_odds * lr_plus if lr_plus != np.inf else np.inf
-    post_test_odds_minus = pre_test_odds * lr_minus if lr_minus != np.inf else np.inf
-    
-    post_test_prob_plus = post_test_odds_plus / (1 + post_test_odds_plus) if post_test_odds_plus != np.inf else 1.0
-    post_test_prob_minus = post_test_odds_minus / (1 + post_test_odds_minus) if post_test_odds_minus != np.inf else 1.0
-    
-    # Delta Net Benefit (using threshold_prob for pt)
-    # For parametric case, we need to compute pt from threshold
-    pt = compute_pt_from_threshold(cohens_d, threshold, base_rate, sigma1, sigma2)
-    odds_pt = pt / (1 - pt) if pt < 1 else np.inf
-    nb_predictor = (sensitivity * base_rate) - ((1 - specificity) * (1 - base_rate) * odds_pt) if odds_pt != np.inf else 0.0
-    nb_treat_all = base_rate - (1 - base_rate) * odds_pt if odds_pt != np.inf else -np.inf
-    nb_treat_none = 0.0
-    delta_nb = nb_predictor - max(nb_treat_all, nb_treat_none)
-    
-    return {
-        'fpr': fpr,
-        'tpr': tpr,
-        'sensitivity': sensitivity,
-        'specificity': specificity,
-        'ppv': ppv,
-        'npv': npv,
-        'accuracy': accuracy,
-        'balanced_accuracy': balanced_accuracy,
-        'f1': f1,
-        'mcc': mcc,
-        'lr_plus': lr_plus,
-        'lr_minus': lr_minus,
-        'dor': dor,
-        'youden_j': youden_j,
-        'g_mean': g_mean,
-        'kappa': kappa_stat,
-        'post_test_prob_plus': post_test_prob_plus,
-        'post_test_prob_minus': post_test_prob_minus,
-        'delta_nb': delta_nb,
-    }
+    kernel = _binary_metrics if binary_metrics is None else binary_metrics
+    values = kernel(float(cohens_d), float(base_rate), float(threshold),
+                    float(sigma1), float(sigma2), math.nan if pt is None else float(pt))
+    return dict(zip(BINARY_METRIC_KEYS, values))
 
 
 def compute_pt_from_threshold(
@@ -425,6 +406,9 @@ def compute_pt_from_threshold(
     float
         Threshold probability p_t.
     """
+    if isinstance(threshold, (int, float)):
+        return _pt_from_threshold(float(cohens_d), threshold, float(base_rate),
+                                  float(sigma1), float(sigma2))
     pdf1 = _normal_pdf(threshold, 0, sigma1)
     pdf2 = _normal_pdf(threshold, cohens_d, sigma2)
     
@@ -437,6 +421,32 @@ def compute_pt_from_threshold(
     return numerator / denominator
 
 
+def _threshold_from_pt_closed_form(
+    cohens_d: float,
+    pt: float,
+    base_rate: float,
+    sigma1: float,
+    sigma2: float,
+) -> Optional[float]:
+    """
+    Solve P(positive | X = t) = pt analytically.
+
+    With normal class densities, log(pdf2 / pdf1) is quadratic in t and must
+    equal C = logit(pt) - logit(base_rate):
+
+        A t^2 + B t + K = 0,  A = (1/s1^2 - 1/s2^2) / 2,  B = d / s2^2,
+        K = -d^2 / (2 s2^2) - log(s2 / s1) - C
+
+    Only used where p_t is monotone over the bisection bracket of
+    :func:`compute_threshold_from_pt` (always for equal variances), so the
+    root is the one bisection converges to. Returns None otherwise, or when
+    p_t is degenerate or unattainable, and callers fall back to bisection.
+    """
+    t = _closed_form_threshold(float(cohens_d), float(pt), float(base_rate),
+                               float(sigma1), float(sigma2))
+    return None if math.isnan(t) else t
+
+
 def compute_threshold_from_pt(
     cohens_d: float,
     pt: float,
@@ -447,7 +457,9 @@ def compute_threshold_from_pt(
     """
     Find measurement threshold corresponding to a given threshold probability p_t.
     
-    Uses bisection search to find threshold t where P(positive | X = t) = pt.
+    Solves P(positive | X = t) = pt in closed form (the log density ratio is
+    quadratic in t), falling back to bisection search when no root lies on
+    the increasing branch of p_t within the search range.
     
     Parameters
     ----------
@@ -467,6 +479,14 @@ def compute_threshold_from_pt(
     float
         Measurement threshold corresponding to pt.
     """
+    if threshold_from_pt is not None:
+        # Compiled kernel tries the closed form itself before bisecting
+        return threshold_from_pt(float(cohens_d), float(pt), float(base_rate),
+                                 float(sigma1), float(sigma2))
+    threshold = _threshold_from_pt_closed_form(cohens_d, pt, base_rate, sigma1, sigma2)
+    if threshold is not None:
+        return threshold
+
     # Bisection search
     left = -8.0 * max(sigma1, sigma2)
     right = 8.0 * max(sigma1, sigma2) + cohens_d
@@ -491,6 +511,31 @@ def compute_threshold_from_pt(
     return (left + right) / 2
 
 
+_THRESHOLD_GRID_SIZE = 2000
+
+
+def _threshold_objective_grid(
+    thresholds: np.ndarray,
+    cohens_d: float,
+    base_rate: float,
+    sigma1: float,
+    sigma2: float,
+    use_f1: bool,
+) -> np.ndarray:
+    """Negative F1 or Youden's J at every threshold, with the scalar conventions."""
+    from scipy.special import ndtr
+    sensitivity = ndtr((cohens_d - thresholds) * (1.0 / sigma2))
+    specificity = ndtr(thresholds * (1.0 / sigma1))
+    if not use_f1:
+        return -(sensitivity + specificity - 1)
+    tp = sensitivity * base_rate
+    fp = (1 - specificity) * (1 - base_rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppv = np.where((sensitivity == 0) | (tp + fp <= 0), 1.0, tp / (tp + fp))
+        f1 = np.where(ppv + sensitivity > 0, 2 * ppv * sensitivity / (ppv + sensitivity), 0.0)
+    return -f1
+
+
 def find_optimal_threshold(
     cohens_d: float,
     base_rate: float,
@@ -519,29 +564,40 @@ def find_optimal_threshold(
     float
         Optimal threshold value.
     """
-    def objective(t):
-        metrics = compute_binary_metrics(cohens_d, base_rate, t, sigma1, sigma2)
-        if metric == 'f1':
-            return -metrics['f1']  # Negative for minimization
-        else:  # youden
-            return -metrics['youden_j']
-    
+    if optimal_threshold is not None:
+        # Compiled golden-section search; no Python callback per evaluation
+        return optimal_threshold(float(cohens_d), float(base_rate), float(sigma1),
+                                 float(sigma2), metric == 'f1')
+
     # Search range
     t_min = -8.0 * max(sigma1, sigma2)
     t_max = 8.0 * max(sigma1, sigma2) + cohens_d
     
-    result = minimize_scalar(objective, bounds=(t_min, t_max), method='bounded')
-    return result.x
+    # Locate the optimum on a grid in one vectorized pass, then refine with a
+    # golden-section search over the neighbouring grid cells
+    use_f1 = metric == 'f1'
+    grid = np.linspace(t_min, t_max, _THRESHOLD_GRID_SIZE)
+    best = int(np.argmin(_threshold_objective_grid(
+        grid, cohens_d, base_rate, sigma1, sigma2, use_f1
+    )))
+    lo = grid[max(best - 1, 0)]
+    hi = grid[min(best + 1, _THRESHOLD_GRID_SIZE - 1)]
+    return _golden_section_threshold(
+        float(lo), float(hi), float(cohens_d), float(base_rate),
+        float(sigma1), float(sigma2), use_f1,
+    )
 
 
 def d_to_odds_ratio(d: float) -> float:
     """Convert Cohen's d to odds ratio."""
-    return np.exp(d * np.pi / np.sqrt(3))
+    if isinstance(d, (int, float)):
+        return math.exp(d * _PI_OVER_SQRT3)
+    return np.exp(d * _PI_OVER_SQRT3)
 
 
 def d_to_log_odds_ratio(d: float) -> float:
     """Convert Cohen's d to log odds ratio."""
-    return d * np.pi / np.sqrt(3)
+    return d * _PI_OVER_SQRT3
 
 
 def d_to_point_biserial_r(d: float, base_rate: float) -> float:
@@ -552,6 +608,8 @@ def d_to_point_biserial_r(d: float, base_rate: float) -> float:
     
     When base_rate = 0.5, this reduces to d / sqrt(d^2 + 4).
     """
+    if isinstance(d, (int, float)) and isinstance(base_rate, (int, float)):
+        return d / math.sqrt(d * d + 1 / (base_rate * (1 - base_rate)))
     return d / np.sqrt(d**2 + 1 / (base_rate * (1 - base_rate)))
 
 
@@ -573,8 +631,8 @@ def r_to_d(r: float) -> float:
     by ``e2p_parametric_continuous`` (see ``e2p.bivariate.effect_sizes``).
     """
     if abs(r) >= 1:
-        return np.sign(r) * np.inf
-    return 2 * r / np.sqrt(1 - r**2)
+        return math.copysign(math.inf, r)
+    return 2 * r / math.sqrt(1 - r * r)
 
 
 def auc_to_d(auc: float) -> float:
@@ -602,7 +660,8 @@ def auc_to_d(auc: float) -> float:
         return 0.0
     if auc >= 1.0:
         return np.inf
-    return stats.norm.ppf(auc) * np.sqrt(2)
+    from scipy.special import ndtri
+    return ndtri(auc) * _SQRT2
 
 
 def odds_ratio_to_d(odds_ratio: float) -> float:
@@ -627,7 +686,7 @@ def odds_ratio_to_d(odds_ratio: float) -> float:
     """
     if odds_ratio <= 0:
         raise ValueError("odds_ratio must be > 0")
-    return np.log(odds_ratio) * np.sqrt(3) / np.pi
+    return math.log(odds_ratio) * _SQRT3_OVER_PI
 
 
 def log_odds_ratio_to_d(log_odds_ratio: float) -> float:
@@ -650,7 +709,7 @@ def log_odds_ratio_to_d(log_odds_ratio: float) -> float:
     -------
     >>> log_odds_ratio_to_d(1.45)  # approximately 0.8
     """
-    return log_odds_ratio * np.sqrt(3) / np.pi
+    return log_odds_ratio * _SQRT3_OVER_PI
 
 
 def cohens_u3_to_d(u3: float) -> float:
@@ -676,7 +735,8 @@ def cohens_u3_to_d(u3: float) -> float:
     """
     if u3 <= 0 or u3 >= 1:
         raise ValueError("u3 must be between 0 and 1 (exclusive)")
-    return stats.norm.ppf(u3)
+    from scipy.special import ndtri
+    return ndtri(u3)
 
 
 def e2p_parametric_binary(
@@ -725,17 +785,13 @@ def e2p_parametric_binary(
     >>> print(f"Sensitivity: {results.sensitivity:.3f}")
     >>> print(f"PPV: {results.ppv:.3f}")
     """
-    # Validate inputs
-    if not 0 < base_rate < 1:
-        raise ValueError("base_rate must be between 0 and 1 (exclusive)")
-    if not 0 < threshold_prob < 1:
-        raise ValueError("threshold_prob must be between 0 and 1 (exclusive)")
-    if not 0 < icc1 <= 1:
-        raise ValueError("icc1 must be in (0, 1]")
-    if not 0 < icc2 <= 1:
-        raise ValueError("icc2 must be in (0, 1]")
-    if not 0 < kappa <= 1:
-        raise ValueError("kappa must be in (0, 1]")
+    _validate_ranges(
+        ('base_rate', base_rate, 0, 1, False),
+        ('threshold_prob', threshold_prob, 0, 1, False),
+        ('icc1', icc1, 0, 1, True),
+        ('icc2', icc2, 0, 1, True),
+        ('kappa', kappa, 0, 1, True),
+    )
     
     # Standardized observed d (full ICC + kappa formula; matches web UI)
     d_observed = attenuate_d(cohens_d, kappa, icc1, icc2)
@@ -749,7 +805,8 @@ def e2p_parametric_binary(
     threshold_value = compute_threshold_from_pt(d_mean, threshold_prob, base_rate, sigma1, sigma2)
 
     # Compute all metrics
-    metrics = compute_binary_metrics(d_mean, base_rate, threshold_value, sigma1, sigma2)
+    metrics = compute_binary_metrics(d_mean, base_rate, threshold_value, sigma1, sigma2,
+                                     pt=threshold_prob)
 
     # Compute discrimination metrics
     roc_auc = compute_roc_auc_parametric(d_mean, sigma1, sigma2)
@@ -757,8 +814,8 @@ def e2p_parametric_binary(
 
     # Effect-size conversions use standardized d (full observed d in observed view)
     d_for_es = cohens_d if view == 'true' else d_observed
-    odds_ratio = d_to_odds_ratio(d_for_es)
     log_odds_ratio = d_to_log_odds_ratio(d_for_es)
+    odds_ratio = math.exp(log_odds_ratio)
     cohens_u3 = d_to_cohens_u3(d_for_es)
     pb_r = d_to_point_biserial_r(d_for_es, base_rate)
     eta_squared = pb_r ** 2
@@ -799,6 +856,320 @@ def e2p_parametric_binary(
     )
 
 
+def _binary_metrics_array(
+    cohens_d: np.ndarray,
+    base_rate: np.ndarray,
+    threshold: np.ndarray,
+    sigma1: np.ndarray,
+    sigma2: np.ndarray,
+    pt: np.ndarray,
+) -> dict:
+    """
+    Array form of :func:`compute_binary_metrics` for 1-D parameter arrays.
+
+    Applies the same conventions as the scalar kernel (PPV = 1 when
+    sensitivity is 0, infinite likelihood ratios at perfect specificity, ...)
+    elementwise via ``np.where``. ``pt`` must be given; base_rate and pt are
+    assumed validated to lie in (0, 1).
+    """
+    from scipy.special import ndtr
+
+    fpr = 1.0 - ndtr(threshold / sigma1)
+    tpr = 1.0 - ndtr((threshold - cohens_d) / sigma2)
+    sensitivity = tpr
+    specificity = 1.0 - fpr
+
+    tp = sensitivity * base_rate
+    tn = specificity * (1.0 - base_rate)
+    fp = (1.0 - specificity) * (1.0 - base_rate)
+    fn = (1.0 - sensitivity) * base_rate
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppv = np.where((sensitivity == 0.0) | ~(tp + fp > 0.0), 1.0, tp / (tp + fp))
+        npv = np.where(tn + fn > 0.0, tn / (tn + fn), 1.0)
+
+        accuracy = tp + tn
+        balanced_accuracy = (sensitivity + specificity) / 2.0
+        f1 = np.where(ppv + sensitivity > 0.0,
+                      2.0 * (ppv * sensitivity) / (ppv + sensitivity), 0.0)
+
+        mcc_denom = np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))
+        mcc = np.where(mcc_denom > 0.0, (tp * tn - fp * fn) / mcc_denom, 0.0)
+
+        lr_plus = np.where(specificity < 1.0, sensitivity / (1.0 - specificity), np.inf)
+        lr_minus = np.where(specificity > 0.0, (1.0 - sensitivity) / specificity, np.inf)
+        dor = np.where((lr_minus > 0.0) & (lr_minus != np.inf) & (lr_plus != np.inf),
+                       lr_plus / lr_minus, np.inf)
+
+        youden_j = sensitivity + specificity - 1.0
+        g_mean = np.sqrt(sensitivity * specificity)
+
+        p_yes_pred = tp + fp
+        pe_chance = base_rate * p_yes_pred + (1.0 - base_rate) * (1.0 - p_yes_pred)
+        kappa_stat = np.where(pe_chance < 1.0,
+                              (accuracy - pe_chance) / (1.0 - pe_chance), 0.0)
+
+        pre_test_odds = base_rate / (1.0 - base_rate)
+        odds_plus = pre_test_odds * lr_plus
+        odds_minus = pre_test_odds * lr_minus
+        post_test_prob_plus = np.where(odds_plus != np.inf, odds_plus / (1.0 + odds_plus), 1.0)
+        post_test_prob_minus = np.where(odds_minus != np.inf,
+                                        odds_minus / (1.0 + odds_minus), 1.0)
+
+    odds_pt = pt / (1.0 - pt)
+    nb_predictor = tp - fp * odds_pt
+    nb_treat_all = base_rate - (1.0 - base_rate) * odds_pt
+    delta_nb = nb_predictor - np.maximum(nb_treat_all, 0.0)
+
+    return {
+        'fpr': fpr, 'tpr': tpr, 'sensitivity': sensitivity,
+        'specificity': specificity, 'ppv': ppv, 'npv': npv, 'accuracy': accuracy,
+        'balanced_accuracy': balanced_accuracy, 'f1': f1, 'mcc': mcc,
+        'lr_plus': lr_plus, 'lr_minus': lr_minus, 'dor': dor, 'youden_j': youden_j,
+        'g_mean': g_mean, 'kappa': kappa_stat,
+        'post_test_prob_plus': post_test_prob_plus,
+        'post_test_prob_minus': post_test_prob_minus, 'delta_nb': delta_nb,
+    }
+
+
+def _pr_auc_parametric_array(
+    cohens_d: np.ndarray,
+    base_rate: np.ndarray,
+    sigma1: np.ndarray,
+    sigma2: np.ndarray,
+    n_points: int = 500,
+) -> np.ndarray:
+    """
+    Row-wise :func:`compute_pr_auc_parametric` for 1-D parameter arrays.
+
+    Builds one (n, n_points) threshold grid and integrates every PR curve in
+    a single pass. Duplicated recalls are collapsed onto their first point
+    as in the scalar version, by carrying the index of each run's first
+    point forward instead of calling ``np.unique`` per row.
+    """
+    from scipy.special import ndtr
+
+    spread = 6.0 * np.maximum(sigma1, sigma2)
+    min_thresh = np.minimum(0.0, cohens_d) - spread
+    max_thresh = np.maximum(0.0, cohens_d) + spread
+    steps = np.linspace(0.0, 1.0, n_points)
+    thresholds = max_thresh[:, None] + (min_thresh - max_thresh)[:, None] * steps
+
+    col = np.ones((len(cohens_d), 1))
+    br = base_rate[:, None]
+    recalls = 1 - ndtr((thresholds - cohens_d[:, None]) * (1.0 / sigma2)[:, None])
+    fprs = 1 - ndtr(thresholds * (1.0 / sigma1)[:, None])
+    numerators = br * recalls
+    denominators = numerators + (1 - br) * fprs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precisions = np.where(denominators < 1e-9, 1.0, numerators / denominators)
+
+    recalls = np.hstack((0.0 * col, recalls, col))
+    precisions = np.hstack((col, precisions, br * col))
+    order = np.argsort(recalls, axis=1, kind='stable')
+    recalls = np.take_along_axis(recalls, order, axis=1)
+    precisions = np.take_along_axis(precisions, order, axis=1)
+
+    # Segment j-1 -> j spans two runs of equal recall; its left end is the
+    # first point of the run ending at j-1, its right end is point j
+    widths = np.diff(recalls, axis=1)
+    starts = np.where(recalls[:, 1:] != recalls[:, :-1],
+                      np.arange(1, recalls.shape[1]), 0)
+    first = np.maximum.accumulate(np.hstack((0 * col.astype(np.intp), starts)), axis=1)
+    left = np.take_along_axis(precisions, first[:, :-1], axis=1)
+    area = np.sum(widths * (precisions[:, 1:] + left) / 2, axis=1)
+
+    return np.clip(area, 0, 1)
+
+
+def _threshold_from_pt_closed_form_array(
+    cohens_d: np.ndarray,
+    pt: np.ndarray,
+    base_rate: np.ndarray,
+    sigma1: np.ndarray,
+    sigma2: np.ndarray,
+) -> tuple:
+    """
+    Elementwise :func:`_threshold_from_pt_closed_form` for 1-D arrays.
+
+    Returns ``(threshold, solved)``; elements where the closed form does not
+    apply have ``solved`` False and must go through the scalar solver.
+    """
+    c = np.log(pt / (1 - pt)) - np.log(base_rate / (1 - base_rate))
+    left = -8.0 * np.maximum(sigma1, sigma2)
+    right = 8.0 * np.maximum(sigma1, sigma2) + cohens_d
+    equal = sigma1 == sigma2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Equal variances: linear in t, monotone iff d > 0
+        t_equal = 0.5 * cohens_d + c * sigma1 * sigma1 / cohens_d
+
+        inv_v1 = 1.0 / (sigma1 * sigma1)
+        inv_v2 = 1.0 / (sigma2 * sigma2)
+        a = 0.5 * (inv_v1 - inv_v2)
+        b = cohens_d * inv_v2
+        k = -0.5 * cohens_d * cohens_d * inv_v2 - np.log(sigma2 / sigma1) - c
+        vertex = -0.5 * b / a
+        disc = b * b - 4.0 * a * k
+        q = -0.5 * (b + np.copysign(np.sqrt(np.maximum(disc, 0.0)), b))
+        root1 = np.where(q != 0.0, q / a, 0.0)
+        root2 = np.where(q != 0.0, k / q, np.nan)
+
+    def usable(t):
+        with np.errstate(invalid='ignore'):
+            return (left <= t) & (t <= right) & (2.0 * a * t + b > 0.0)
+
+    quadratic = ~equal & ~((left < vertex) & (vertex < right)) & (disc >= 0.0)
+    use1 = quadratic & usable(root1)
+    use2 = quadratic & ~use1 & usable(root2)
+    use_equal = equal & (cohens_d > 0) & (left <= t_equal) & (t_equal <= right)
+
+    threshold = np.where(use_equal, t_equal, np.where(use1, root1, root2))
+    return threshold, use_equal | use1 | use2
+
+
+def _threshold_from_pt_bisect_array(
+    cohens_d: np.ndarray,
+    pt: np.ndarray,
+    base_rate: np.ndarray,
+    sigma1: np.ndarray,
+    sigma2: np.ndarray,
+) -> np.ndarray:
+    """
+    Bisection from :func:`compute_threshold_from_pt` run on all elements at
+    once; each element freezes as soon as its own stopping rule fires.
+    """
+    left = -8.0 * np.maximum(sigma1, sigma2)
+    right = 8.0 * np.maximum(sigma1, sigma2) + cohens_d
+    result = np.full_like(cohens_d, np.nan)
+    active = np.ones(cohens_d.shape, dtype=bool)
+    epsilon = 1e-8
+
+    for _ in range(100):
+        mid = (left + right) / 2
+        pdf1 = _normal_pdf(mid, 0, sigma1)
+        pdf2 = _normal_pdf(mid, cohens_d, sigma2)
+        numerator = pdf2 * base_rate
+        denominator = pdf1 * (1 - base_rate) + numerator
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pt_mid = np.where(denominator == 0, 0.5, numerator / denominator)
+
+        hit = active & (np.abs(pt_mid - pt) < epsilon)
+        result[hit] = mid[hit]
+        active &= ~hit
+        below = pt_mid < pt
+        left = np.where(active & below, mid, left)
+        right = np.where(active & ~below, mid, right)
+        active &= ~(right - left < epsilon)
+        if not active.any():
+            break
+
+    unset = np.isnan(result)
+    result[unset] = (left[unset] + right[unset]) / 2
+    return result
+
+
+def e2p_parametric_binary_batch(
+    cohens_d,
+    base_rate,
+    threshold_prob=0.5,
+    icc1=1.0,
+    icc2=1.0,
+    kappa=1.0,
+    view: Literal['true', 'observed'] = 'observed',
+) -> np.ndarray:
+    """
+    Vectorized :func:`e2p_parametric_binary` over arrays of inputs.
+
+    All numeric arguments are broadcast against each other, so a sweep over
+    d, base rate or reliability runs as a handful of array operations instead
+    of one scalar call per grid point.
+
+    Parameters
+    ----------
+    cohens_d, base_rate, threshold_prob, icc1, icc2, kappa : array_like
+        As in :func:`e2p_parametric_binary`; must be broadcastable together.
+    view : {'true', 'observed'}
+        Whether to compute metrics for 'true' (latent) or 'observed'
+        distributions. Default 'observed'.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array of the broadcast shape with one float64 field per
+        :class:`ParametricResults` attribute (``_RESULT_DTYPE``). Index a
+        column by name (``res['ppv']``), or build a single result with
+        :meth:`ParametricResults.from_record`.
+
+    Example
+    -------
+    >>> res = e2p_parametric_binary_batch(np.linspace(0.2, 2.0, 10), base_rate=0.1)
+    >>> res['ppv'].shape
+    (10,)
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (
+        cohens_d, base_rate, threshold_prob, icc1, icc2, kappa)))
+    shape = arrays[0].shape
+    d, br, pt, icc1, icc2, kappa = (np.array(a).ravel() for a in arrays)
+
+    _validate_ranges(
+        ('base_rate', br, 0, 1, False),
+        ('threshold_prob', pt, 0, 1, False),
+        ('icc1', icc1, 0, 1, True),
+        ('icc2', icc2, 0, 1, True),
+        ('kappa', kappa, 0, 1, True),
+    )
+
+    kappa_factor = np.sin(np.pi / 2 * kappa)
+    d_observed = d * np.sqrt((2.0 * icc1 * icc2) / (icc1 + icc2) * kappa_factor)
+    if view == 'true':
+        d_mean = d
+        sigma1 = sigma2 = np.ones_like(d)
+    else:
+        d_mean = d * np.sqrt(kappa_factor)
+        sigma1 = 1.0 / np.sqrt(icc1)
+        sigma2 = 1.0 / np.sqrt(icc2)
+
+    # Closed form where it applies, lock-step bisection for the rest
+    threshold, solved = _threshold_from_pt_closed_form_array(d_mean, pt, br, sigma1, sigma2)
+    rest = ~solved
+    if rest.any():
+        threshold[rest] = _threshold_from_pt_bisect_array(
+            d_mean[rest], pt[rest], br[rest], sigma1[rest], sigma2[rest]
+        )
+
+    metrics = _binary_metrics_array(d_mean, br, threshold, sigma1, sigma2, pt)
+
+    from scipy.special import ndtr
+    roc_auc = ndtr(d_mean / np.sqrt(sigma1 * sigma1 + sigma2 * sigma2))
+    pr_auc = _pr_auc_parametric_array(d_mean, br, sigma1, sigma2)
+
+    d_for_es = d if view == 'true' else d_observed
+    log_odds_ratio = d_for_es * _PI_OVER_SQRT3
+    pb_r = d_for_es / np.sqrt(d_for_es**2 + 1 / (br * (1 - br)))
+
+    out = np.empty(d.shape, dtype=_RESULT_DTYPE)
+    out['cohens_d_true'] = d
+    out['cohens_d_observed'] = d_observed
+    out['base_rate'] = br
+    out['threshold_prob'] = pt
+    out['icc1'] = icc1
+    out['icc2'] = icc2
+    out['kappa'] = kappa
+    out['odds_ratio'] = np.exp(log_odds_ratio)
+    out['log_odds_ratio'] = log_odds_ratio
+    out['cohens_u3'] = ndtr(d_for_es)
+    out['point_biserial_r'] = pb_r
+    out['eta_squared'] = pb_r ** 2
+    out['roc_auc'] = roc_auc
+    out['pr_auc'] = pr_auc
+    out['threshold_value'] = threshold
+    for key in BINARY_METRIC_KEYS:
+        if key not in ('fpr', 'tpr'):
+            out['kappa_statistic' if key == 'kappa' else key] = metrics[key]
+    return out.reshape(shape)
+
+
 def e2p_parametric_continuous(
     pearson_r: float,
     base_rate: float,
@@ -850,17 +1221,13 @@ def e2p_parametric_continuous(
     """
     from . import bivariate
 
-    # Validate inputs
-    if not -1 < pearson_r < 1:
-        raise ValueError("pearson_r must be between -1 and 1 (exclusive)")
-    if not 0 < base_rate < 1:
-        raise ValueError("base_rate must be between 0 and 1 (exclusive)")
-    if not 0 < threshold_prob < 1:
-        raise ValueError("threshold_prob must be between 0 and 1 (exclusive)")
-    if not 0 < reliability_x <= 1:
-        raise ValueError("reliability_x must be in (0, 1]")
-    if not 0 < reliability_y <= 1:
-        raise ValueError("reliability_y must be in (0, 1]")
+    _validate_ranges(
+        ('pearson_r', pearson_r, -1, 1, False),
+        ('base_rate', base_rate, 0, 1, False),
+        ('threshold_prob', threshold_prob, 0, 1, False),
+        ('reliability_x', reliability_x, 0, 1, True),
+        ('reliability_y', reliability_y, 0, 1, True),
+    )
 
     # Observed r attenuated by classical test-theory reliabilities
     r_observed = pearson_r * np.sqrt(reliability_x * reliability_y)
@@ -868,8 +1235,15 @@ def e2p_parametric_continuous(
 
     curves = bivariate.discrimination_curves(r_eff, base_rate)
     es_eff = bivariate.effect_sizes(r_eff, base_rate, auc=curves["auc"])
-    es_true = bivariate.effect_sizes(pearson_r, base_rate)
-    es_obs = bivariate.effect_sizes(r_observed, base_rate)
+
+    # Only the pooled d is reported for the other view; reuse es_eff for the
+    # view already computed rather than re-running the quadrature
+    if view == 'true':
+        d_true = es_eff["d"]
+        d_observed = d_true if r_observed == pearson_r else bivariate.pooled_d(r_observed, base_rate)
+    else:
+        d_observed = es_eff["d"]
+        d_true = d_observed if r_observed == pearson_r else bivariate.pooled_d(pearson_r, base_rate)
 
     # Match web continuous UI: OR / U3 / point-biserial from nonpooled d_a
     da = es_eff["da"]
@@ -888,8 +1262,8 @@ def e2p_parametric_continuous(
     )
 
     return ParametricResults(
-        cohens_d_true=es_true["d"],
-        cohens_d_observed=es_obs["d"],
+        cohens_d_true=d_true,
+        cohens_d_observed=d_observed,
         base_rate=base_rate,
         threshold_prob=threshold_prob,
         icc1=reliability_x,
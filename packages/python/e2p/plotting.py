@@ -8,6 +8,73 @@ from scipy import stats
 from typing import Tuple
 
 from .core import BinaryResults
+from .binary import E2PBinary
+from .continuous import E2PContinuous
+from .utils import (
+    _KDEThresholdSearch, _rank_curves, compute_cohens_d, compute_pr_auc,
+    compute_pr_curve, compute_roc_auc, compute_threshold_metrics,
+    transform_for_target_reliability,
+    transform_groups_for_target_kappa
+)
+from ._numba_kernels import dca_net_benefit
+
+
+def _subsample(arr: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Return ``arr``, or a random subset of ``k`` of its values if it is larger."""
+    if k is None or len(arr) <= k:
+        return arr
+    return arr[rng.choice(len(arr), k, replace=False)]
+
+
+# Groups up to this size get an exact direct-sum KDE; larger ones are binned
+_DIRECT_KDE_MAX = 500
+
+
+def _kde_1d(samples: np.ndarray, x_grid: np.ndarray,
+            bandwidth: float = None) -> np.ndarray:
+    """
+    Gaussian KDE of ``samples`` evaluated on ``x_grid``.
+
+    The bandwidth is a scalar (Scott's rule by default, as in
+    ``scipy.stats.gaussian_kde``), so none of scipy's covariance set-up is
+    needed. Small samples are summed directly, which is exact; larger ones
+    are binned onto a regular grid and convolved with the Gaussian kernel in
+    Fourier space, which costs O(N + M log M) instead of O(N * len(x_grid))
+    and matches the direct evaluation to plotting accuracy. The curve is for
+    display only, so it is returned as float32.
+    """
+    samples = np.asarray(samples, dtype=float)
+    n = len(samples)
+    if bandwidth is None:
+        bandwidth = np.std(samples, ddof=1) * n ** (-1 / 5) if n > 1 else 0.0
+    if not bandwidth > 0 or not np.isfinite(bandwidth):
+        # Degenerate input: defer to scipy (which raises as before)
+        return stats.gaussian_kde(samples)(x_grid)
+    
+    if n <= _DIRECT_KDE_MAX:
+        z = (x_grid[:, None] - samples[None, :]) / bandwidth
+        density = np.exp(-0.5 * z * z).sum(axis=1) / (n * bandwidth * np.sqrt(2 * np.pi))
+        return density.astype(np.float32)
+    
+    lo = min(samples.min(), x_grid.min()) - 4 * bandwidth
+    hi = max(samples.max(), x_grid.max()) + 4 * bandwidth
+    # At least 4 bins per bandwidth, rounded up to a power of two
+    n_bins = 1024
+    while n_bins < 2 ** 16 and (hi - lo) / n_bins > bandwidth / 4:
+        n_bins *= 2
+    counts, edges = np.histogram(samples, bins=n_bins, range=(lo, hi))
+    dx = edges[1] - edges[0]
+    centers = edges[:-1] + dx / 2
+    
+    # Kernel laid out circularly on a zero-padded grid so the convolution
+    # does not wrap around
+    size = 2 * n_bins
+    offsets = np.arange(size) * dx
+    offsets[n_bins:] -= size * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    smoothed = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel), size)[:n_bins]
+    density = np.maximum(smoothed, 0.0) / n
+    return np.interp(x_grid, centers, density).astype(np.float32)
 
 
 def compute_dca_curve(group1: np.ndarray, group2: np.ndarray, 
@@ -17,42 +84,187 @@ def compute_dca_curve(group1: np.ndarray, group2: np.ndarray,
     
     Returns threshold probabilities, model net benefit, and treat-all net benefit.
     """
+    return _dca_curve(group1, group2, prevalence)
+
+
+def _dca_curve(group1: np.ndarray, group2: np.ndarray, prevalence: float,
+               search: _KDEThresholdSearch | None = None
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """:func:`compute_dca_curve`, optionally reusing a KDE search over the same groups."""
     # Threshold probabilities to evaluate
     pt_values = np.linspace(0.01, 0.99, 100)
     
-    model_nb = []
-    treat_all_nb = []
-    
-    for pt in pt_values:
-        # Compute sensitivity and specificity at this threshold
-        # Need to find the measurement threshold corresponding to this pt
-        from .utils import convert_pt_to_threshold
-        
-        try:
-            thresh = convert_pt_to_threshold(group1, group2, prevalence, pt)
-            sens = np.mean(group2 >= thresh)
-            spec = np.mean(group1 < thresh)
-        except:
-            sens = 0
-            spec = 1
-        
-        # Net benefit for model
-        # NB = sens * prevalence - (1 - spec) * (1 - prevalence) * (pt / (1 - pt))
-        if pt < 1:
-            nb = sens * prevalence - (1 - spec) * (1 - prevalence) * (pt / (1 - pt))
-        else:
-            nb = 0
-        model_nb.append(nb)
-        
-        # Net benefit for treat all
-        # NB_all = prevalence - (1 - prevalence) * (pt / (1 - pt))
-        if pt < 1:
-            nb_all = prevalence - (1 - prevalence) * (pt / (1 - pt))
-        else:
-            nb_all = 0
-        treat_all_nb.append(nb_all)
-    
-    return pt_values, np.array(model_nb), np.array(treat_all_nb)
+    # Map every pt to a measurement threshold with one pair of KDEs, then read
+    # sensitivity/specificity off the sorted groups instead of rescanning them.
+    # The KDEs need at least two finite values per group; otherwise the model
+    # is treated as flagging no one (sens 0, spec 1).
+    if (len(group1) > 1 and len(group2) > 1
+            and np.isfinite(group1).all() and np.isfinite(group2).all()):
+        if search is None:
+            search = _KDEThresholdSearch(group1, group2)
+        thresholds = search(prevalence, pt_values)
+        g1_sorted = np.sort(group1)
+        g2_sorted = np.sort(group2)
+    else:
+        thresholds = None
+    
+    if thresholds is not None and dca_net_benefit is not None:
+        model_nb, treat_all_nb = dca_net_benefit(
+            g1_sorted, g2_sorted, float(prevalence), pt_values, thresholds
+        )
+        return pt_values, model_nb, treat_all_nb
+    
+    if thresholds is not None:
+        n1, n2 = len(g1_sorted), len(g2_sorted)
+        # g2 >= t  <=>  not (g2 < t);  g1 < t counted by the left insertion point
+        sens_values = (n2 - np.searchsorted(g2_sorted, thresholds, side='left')) / n2
+        spec_values = np.searchsorted(g1_sorted, thresholds, side='left') / n1
+    else:
+        sens_values = np.zeros_like(pt_values)
+        spec_values = np.ones_like(pt_values)
+    
+    # Net benefit for model and for treat-all at every pt (all pt < 1 here)
+    # NB = sens * prevalence - (1 - spec) * (1 - prevalence) * (pt / (1 - pt))
+    # NB_all = prevalence - (1 - prevalence) * (pt / (1 - pt))
+    odds = pt_values / (1 - pt_values)
+    model_nb = sens_values * prevalence - (1 - spec_values) * (1 - prevalence) * odds
+    treat_all_nb = prevalence - (1 - prevalence) * odds
+    
+    return pt_values, model_nb, treat_all_nb
+
+
+def _curves(group1: np.ndarray, group2: np.ndarray, base_rate: float,
+            results: BinaryResults = None) -> Tuple[np.ndarray, ...]:
+    """
+    ROC and PR curve points for the plots as (fprs, tprs, precisions, recalls).
+
+    ``E2PBinary.compute()`` already stores both curves on its results, so
+    they are only recomputed when no results are given, or when the results
+    were computed for a different base rate than the one being plotted.
+    Without results, both curves come from one shared sort.
+    """
+    if results is None:
+        (fprs, tprs, _), (precisions, recalls, _) = _rank_curves(group1, group2, base_rate)
+        return fprs, tprs, precisions, recalls
+    fprs, tprs, _ = results.roc_curve
+    if results.base_rate == base_rate:
+        precisions, recalls, _ = results.pr_curve
+    else:
+        precisions, recalls, _ = compute_pr_curve(group1, group2, base_rate)
+    return fprs, tprs, precisions, recalls
+
+
+# Shared styling for the annotation boxes drawn on the panels
+_TEXT_BOX = dict(boxstyle='round', facecolor='white', alpha=0.9)
+
+_METRICS_TEMPLATE = (
+    "{label} prev = {prev:.1%}\n"
+    "─────────────\n"
+    "Cohen's d = {d:.3f}\n"
+    "─────────────\n"
+    "At threshold:\n"
+    "  Sens = {sens:.3f}\n"
+    "  Spec = {spec:.3f}\n"
+    "  PPV = {ppv:.3f}\n"
+    "  NPV = {npv:.3f}"
+)
+
+
+def _draw_metrics_box(ax, **values) -> None:
+    """Threshold-metrics text box in the top-right corner of ``ax``."""
+    ax.text(0.98, 0.98, _METRICS_TEMPLATE.format_map(values), transform=ax.transAxes,
+            fontsize=9, verticalalignment='top', horizontalalignment='right',
+            bbox=_TEXT_BOX, family='monospace')
+
+
+def _draw_roc(ax, fprs, tprs, fpr_point: float, tpr_point: float, auc: float) -> None:
+    """ROC curve with the chance diagonal and the operating point."""
+    ax.plot(fprs, tprs, color='#404040', linewidth=2)
+    ax.plot([0, 1], [0, 1], 'k--', linewidth=1, alpha=0.5)
+    ax.scatter([fpr_point], [tpr_point], color='red', s=50, zorder=5)
+    
+    ax.set_xlabel('False Positive Rate (1 - Specificity)', fontsize=11)
+    ax.set_ylabel('True Positive Rate (Sensitivity)', fontsize=11)
+    ax.set_title(f'ROC Curve (AUC = {auc:.3f})', fontsize=12)
+    ax.set_xlim(-0.02, 1.02)
+    ax.set_ylim(-0.02, 1.02)
+
+
+def _draw_pr(ax, recalls, precisions, base_rate: float, sens: float, ppv: float,
+             pr_auc: float) -> None:
+    """PR curve with the base-rate baseline and the operating point."""
+    ax.plot(recalls, precisions, color='#404040', linewidth=2)
+    ax.axhline(y=base_rate, color='k', linestyle='--', linewidth=1, alpha=0.5)
+    ax.scatter([sens], [ppv], color='red', s=50, zorder=5)
+    
+    ax.set_xlabel('Recall (Sensitivity)', fontsize=11)
+    ax.set_ylabel('Precision (PPV)', fontsize=11)
+    ax.set_title(f'PR Curve (AUC = {pr_auc:.3f})', fontsize=12)
+    ax.set_xlim(-0.02, 1.02)
+    ax.set_ylim(-0.02, 1.02)
+
+
+def _draw_dca(ax, pt_values, model_nb, treat_all_nb, prevalence: float,
+              threshold_prob: float, delta_nb: float, title: str) -> None:
+    """Decision curve with treat-all/treat-none references and the ΔNB box."""
+    ax.plot(pt_values, model_nb, color='#404040', linewidth=2, label='Model')
+    ax.plot(pt_values, treat_all_nb, color='gray', linewidth=2, linestyle='--', label='Treat All')
+    ax.axhline(y=0, color='black', linewidth=1, linestyle=':', label='Treat None')
+    
+    # Mark operating point: model NB = ΔNB + max(treat all, treat none)
+    nb_treat_all = prevalence - (1 - prevalence) * (threshold_prob / (1 - threshold_prob))
+    ax.scatter([threshold_prob], [delta_nb + max(0, nb_treat_all)],
+               color='red', s=50, zorder=5, label=f'p_t={threshold_prob:.2f}')
+    
+    ax.set_xlabel('Threshold Probability', fontsize=11)
+    ax.set_ylabel('Net Benefit', fontsize=11)
+    ax.set_title(title, fontsize=12)
+    ax.set_xlim(0, 1)
+    # Set y limits: bottom just below 0, top with a margin above the largest
+    # possible NB (sens * prevalence <= prevalence, so no scan of model_nb)
+    ax.set_ylim(bottom=-0.05, top=prevalence * 1.1)
+    ax.legend(loc='upper right', fontsize=9)
+    
+    ax.text(0.02, 0.98, f"ΔNB = {delta_nb:.4f}", transform=ax.transAxes, fontsize=10,
+            verticalalignment='top', horizontalalignment='left', bbox=_TEXT_BOX,
+            family='monospace')
+
+
+def _draw_scaled_density(ax, x_range, density1, density2, base_rate: float,
+                         threshold: float, label1: str, label2: str,
+                         x_label: str, title: str) -> None:
+    """Group densities weighted by the base rate, with the threshold line."""
+    density1_scaled = density1 * (1 - base_rate)
+    density2_scaled = density2 * base_rate
+    
+    ax.fill_between(x_range, density1_scaled, alpha=0.4, color='gray', label=label1)
+    ax.fill_between(x_range, density2_scaled, alpha=0.4, color='teal', label=label2)
+    ax.plot(x_range, density1_scaled, color='gray', linewidth=2)
+    ax.plot(x_range, density2_scaled, color='teal', linewidth=2)
+    
+    ax.axvline(x=threshold, color='red', linestyle='-', linewidth=2, label='Threshold')
+    
+    ax.set_xlabel(x_label, fontsize=11)
+    ax.set_ylabel('Density (scaled)', fontsize=11)
+    ax.set_title(title, fontsize=12)
+    ax.set_ylim(bottom=0)
+
+
+def _panel_axes(fig: plt.Figure | None,
+                figsize: Tuple[float, float]) -> Tuple[plt.Figure, np.ndarray]:
+    """
+    The 2x3 panel grid: a new figure, or ``fig`` with its axes cleared for
+    reuse (recreated if it does not hold six of them).
+    """
+    if fig is None:
+        return plt.subplots(2, 3, figsize=figsize)
+    if len(fig.axes) == 6:
+        for ax in fig.axes:
+            ax.clear()
+        fig.suptitle("")
+        return fig, np.array(fig.axes).reshape(2, 3)
+    fig.clear()
+    return fig, fig.subplots(2, 3)
 
 
 def plot_binary(group1: np.ndarray, group2: np.ndarray, 
@@ -62,7 +274,9 @@ def plot_binary(group1: np.ndarray, group2: np.ndarray,
                 figsize: Tuple[float, float] = (16, 9),
                 group1_label: str = "Group 1 (Controls)",
                 group2_label: str = "Group 2 (Cases)",
-                figure_title_prefix: str | None = None) -> plt.Figure:
+                figure_title_prefix: str | None = None,
+                max_kde_samples: int | None = 5000,
+                fig: plt.Figure | None = None) -> plt.Figure:
     """
     Plot 3x2 panel figure for binary classification:
     - Row 1: Empirical distributions, ROC curve
@@ -89,22 +303,33 @@ def plot_binary(group1: np.ndarray, group2: np.ndarray,
         Label for group 1.
     group2_label : str
         Label for group 2.
+    max_kde_samples : int or None
+        Largest number of values per group drawn into the histograms and
+        KDE curves; larger groups are randomly subsampled (reproducibly) for
+        display only. Metrics and curves always use all data. None disables
+        subsampling. Default 5000.
+    fig : matplotlib.figure.Figure, optional
+        A figure from an earlier call to redraw into (e.g. when sweeping
+        parameters interactively); its panels are cleared and reused instead
+        of building a new figure. ``figsize`` is ignored when given.
     
     Returns
     -------
     matplotlib.figure.Figure
     """
-    from .utils import (compute_cohens_d, compute_roc_auc, compute_pr_auc,
-                       compute_threshold_metrics, convert_pt_to_threshold,
-                       compute_roc_curve, compute_pr_curve)
-    
     # Compute empirical base rate from data
     empirical_base_rate = len(group2) / (len(group1) + len(group2))
     
+    # One KDE search serves both thresholds and both DCA curves
+    search = _KDEThresholdSearch(group1, group2)
+    
     # Compute TWO thresholds - one for each base rate
     # p_t maps to different x values depending on prevalence
-    threshold_rw = convert_pt_to_threshold(group1, group2, base_rate, threshold_prob)
-    threshold_emp = convert_pt_to_threshold(group1, group2, empirical_base_rate, threshold_prob)
+    if results is not None:
+        threshold_rw = results.threshold_value
+    else:
+        threshold_rw = search(base_rate, threshold_prob)[0]
+    threshold_emp = search(empirical_base_rate, threshold_prob)[0]
     
     if results is not None:
         # Use pre-computed metrics for real-world
@@ -129,18 +354,17 @@ def plot_binary(group1: np.ndarray, group2: np.ndarray,
         d = compute_cohens_d(group1, group2)
     
     # Compute metrics with empirical base rate at EMPIRICAL threshold
+    # (only the threshold metrics are displayed for the empirical prevalence)
     emp_metrics = compute_threshold_metrics(group1, group2, threshold_emp, empirical_base_rate, threshold_prob)
-    emp_pr_auc = compute_pr_auc(group1, group2, empirical_base_rate)
     
-    # Compute curves
-    fprs, tprs, _ = compute_roc_curve(group1, group2)
-    precisions, recalls, _ = compute_pr_curve(group1, group2, base_rate)
+    # Compute curves (reusing the ones already stored on the results)
+    fprs, tprs, precisions, recalls = _curves(group1, group2, base_rate, results)
     
     # Compute DCA curves
-    dca_pt_emp, dca_nb_emp, dca_all_emp = compute_dca_curve(group1, group2, empirical_base_rate)
-    dca_pt_rw, dca_nb_rw, dca_all_rw = compute_dca_curve(group1, group2, base_rate)
+    dca_pt_emp, dca_nb_emp, dca_all_emp = _dca_curve(group1, group2, empirical_base_rate, search)
+    dca_pt_rw, dca_nb_rw, dca_all_rw = _dca_curve(group1, group2, base_rate, search)
     
-    fig, axes = plt.subplots(2, 3, figsize=figsize)
+    fig, axes = _panel_axes(fig, figsize)
     ax1, ax2, ax3 = axes[0]  # Row 1: Empirical distributions, ROC, Empirical DCA
     ax4, ax5, ax6 = axes[1]  # Row 2: Scaled distributions, PR, Real-world DCA
 
@@ -148,21 +372,27 @@ def plot_binary(group1: np.ndarray, group2: np.ndarray,
         fig.suptitle(str(figure_title_prefix), fontsize=14, fontweight="bold")
     
     # Determine bin edges and compute KDE for smooth curves
-    all_data = np.concatenate([group1, group2])
-    x_range = np.linspace(np.min(all_data) - 0.5, np.max(all_data) + 0.5, 200)
-    bins = np.linspace(np.min(all_data), np.max(all_data), 40)
+    lo = min(np.min(group1), np.min(group2))
+    hi = max(np.max(group1), np.max(group2))
+    x_range = np.linspace(lo - 0.5, hi + 0.5, 200)
+    bins = np.linspace(lo, hi, 40)
+    
+    # Display-only subsamples for the histograms and KDEs
+    rng = np.random.default_rng(0)
+    g1_plot = _subsample(group1, max_kde_samples, rng)
+    g2_plot = _subsample(group2, max_kde_samples, rng)
     
     # Compute KDEs
-    kde1 = stats.gaussian_kde(group1)
-    kde2 = stats.gaussian_kde(group2)
-    density1 = kde1(x_range)
-    density2 = kde2(x_range)
+    density1 = _kde_1d(g1_plot, x_range)
+    density2 = _kde_1d(g2_plot, x_range)
     
     # =========================================================================
     # Row 1, Left: Empirical densities
     # =========================================================================
-    ax1.hist(group1, bins=bins, alpha=0.3, color='gray', density=True)
-    ax1.hist(group2, bins=bins, alpha=0.3, color='teal', density=True)
+    # One filled step path per group rather than a Rectangle per bar
+    for values, color in ((g1_plot, 'gray'), (g2_plot, 'teal')):
+        heights, _ = np.histogram(values, bins=bins, density=True)
+        ax1.stairs(heights, bins, fill=True, alpha=0.3, color=color)
     ax1.plot(x_range, density1, color='gray', linewidth=2, label=group1_label)
     ax1.plot(x_range, density2, color='teal', linewidth=2, label=group2_label)
     
@@ -176,140 +406,43 @@ def plot_binary(group1: np.ndarray, group2: np.ndarray,
     ax1.legend(loc='upper left', fontsize=9)
     
     # Add empirical metrics text box
-    emp_metrics_text = (
-        f"Empirical prev = {empirical_base_rate:.1%}\n"
-        f"─────────────\n"
-        f"Cohen's d = {d:.3f}\n"
-        f"─────────────\n"
-        f"At threshold:\n"
-        f"  Sens = {emp_metrics['sensitivity']:.3f}\n"
-        f"  Spec = {emp_metrics['specificity']:.3f}\n"
-        f"  PPV = {emp_metrics['ppv']:.3f}\n"
-        f"  NPV = {emp_metrics['npv']:.3f}"
-    )
-    
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax1.text(0.98, 0.98, emp_metrics_text, transform=ax1.transAxes, fontsize=9,
-             verticalalignment='top', horizontalalignment='right', 
-             bbox=props, family='monospace')
+    _draw_metrics_box(ax1, label="Empirical", prev=empirical_base_rate, d=d,
+                      sens=emp_metrics['sensitivity'], spec=emp_metrics['specificity'],
+                      ppv=emp_metrics['ppv'], npv=emp_metrics['npv'])
     
     # =========================================================================
     # Row 1, Middle: ROC curve (operating point at empirical threshold)
     # =========================================================================
-    ax2.plot(fprs, tprs, color='#404040', linewidth=2)
-    ax2.plot([0, 1], [0, 1], 'k--', linewidth=1, alpha=0.5)
-    
-    # Mark operating point at empirical threshold
-    ax2.scatter([1 - emp_metrics['specificity']], [emp_metrics['sensitivity']], 
-                color='red', s=50, zorder=5)
-    
-    ax2.set_xlabel('False Positive Rate (1 - Specificity)', fontsize=11)
-    ax2.set_ylabel('True Positive Rate (Sensitivity)', fontsize=11)
-    ax2.set_title(f'ROC Curve (AUC = {auc:.3f})', fontsize=12)
-    ax2.set_xlim(-0.02, 1.02)
-    ax2.set_ylim(-0.02, 1.02)
+    _draw_roc(ax2, fprs, tprs, 1 - emp_metrics['specificity'], emp_metrics['sensitivity'], auc)
     
     # =========================================================================
     # Row 1, Right: Empirical DCA
     # =========================================================================
-    ax3.plot(dca_pt_emp, dca_nb_emp, color='#404040', linewidth=2, label='Model')
-    ax3.plot(dca_pt_emp, dca_all_emp, color='gray', linewidth=2, linestyle='--', label='Treat All')
-    ax3.axhline(y=0, color='black', linewidth=1, linestyle=':', label='Treat None')
-    
-    # Mark operating point
-    ax3.scatter([threshold_prob], [emp_metrics['delta_nb'] + max(0, empirical_base_rate - (1 - empirical_base_rate) * (threshold_prob / (1 - threshold_prob)))], 
-                color='red', s=50, zorder=5, label=f'p_t={threshold_prob:.2f}')
-    
-    ax3.set_xlabel('Threshold Probability', fontsize=11)
-    ax3.set_ylabel('Net Benefit', fontsize=11)
-    ax3.set_title(f'Decision Curve (Empirical, prev={empirical_base_rate:.1%})', fontsize=12)
-    ax3.set_xlim(0, 1)
-    # Set y limits: bottom just below 0, top based on max NB with margin
-    y_max_emp = max(np.max(dca_nb_emp), empirical_base_rate) * 1.1
-    ax3.set_ylim(bottom=-0.05, top=y_max_emp)
-    ax3.legend(loc='upper right', fontsize=9)
-    
-    # Add Delta NB annotation
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax3.text(0.02, 0.98, f"ΔNB = {emp_metrics['delta_nb']:.4f}", transform=ax3.transAxes, fontsize=10,
-             verticalalignment='top', horizontalalignment='left', bbox=props, family='monospace')
+    _draw_dca(ax3, dca_pt_emp, dca_nb_emp, dca_all_emp, empirical_base_rate,
+              threshold_prob, emp_metrics['delta_nb'],
+              f'Decision Curve (Empirical, prev={empirical_base_rate:.1%})')
     
     # =========================================================================
     # Row 2, Left: Densities scaled to base rate
     # =========================================================================
-    density1_scaled = density1 * (1 - base_rate)
-    density2_scaled = density2 * base_rate
-    
-    ax4.fill_between(x_range, density1_scaled, alpha=0.4, color='gray', label=group1_label)
-    ax4.fill_between(x_range, density2_scaled, alpha=0.4, color='teal', label=group2_label)
-    ax4.plot(x_range, density1_scaled, color='gray', linewidth=2)
-    ax4.plot(x_range, density2_scaled, color='teal', linewidth=2)
-    
-    ax4.axvline(x=threshold_rw, color='red', linestyle='-', linewidth=2,
-                label=f'Threshold')
-    
-    ax4.set_xlabel('Measurement Value', fontsize=11)
-    ax4.set_ylabel('Density (scaled)', fontsize=11)
-    ax4.set_title(f'Scaled to Real-World Base Rate = {base_rate:.1%}', fontsize=12)
-    ax4.set_ylim(bottom=0)
+    _draw_scaled_density(ax4, x_range, density1, density2, base_rate, threshold_rw,
+                         group1_label, group2_label, 'Measurement Value',
+                         f'Scaled to Real-World Base Rate = {base_rate:.1%}')
     
     # Add real-world metrics text box
-    metrics_text = (
-        f"Real-world prev = {base_rate:.1%}\n"
-        f"─────────────\n"
-        f"Cohen's d = {d:.3f}\n"
-        f"─────────────\n"
-        f"At threshold:\n"
-        f"  Sens = {sens:.3f}\n"
-        f"  Spec = {spec:.3f}\n"
-        f"  PPV = {ppv:.3f}\n"
-        f"  NPV = {npv:.3f}"
-    )
-    
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax4.text(0.98, 0.98, metrics_text, transform=ax4.transAxes, fontsize=9,
-             verticalalignment='top', horizontalalignment='right', 
-             bbox=props, family='monospace')
+    _draw_metrics_box(ax4, label="Real-world", prev=base_rate, d=d,
+                      sens=sens, spec=spec, ppv=ppv, npv=npv)
     
     # =========================================================================
     # Row 2, Middle: PR curve (Real-World)
     # =========================================================================
-    ax5.plot(recalls, precisions, color='#404040', linewidth=2)
-    ax5.axhline(y=base_rate, color='k', linestyle='--', linewidth=1, alpha=0.5)
-    
-    # Mark operating point
-    ax5.scatter([sens], [ppv], color='red', s=50, zorder=5)
-    
-    ax5.set_xlabel('Recall (Sensitivity)', fontsize=11)
-    ax5.set_ylabel('Precision (PPV)', fontsize=11)
-    ax5.set_title(f'PR Curve (AUC = {pr_auc:.3f})', fontsize=12)
-    ax5.set_xlim(-0.02, 1.02)
-    ax5.set_ylim(-0.02, 1.02)
+    _draw_pr(ax5, recalls, precisions, base_rate, sens, ppv, pr_auc)
     
     # =========================================================================
     # Row 2, Right: Real-world DCA
     # =========================================================================
-    ax6.plot(dca_pt_rw, dca_nb_rw, color='#404040', linewidth=2, label='Model')
-    ax6.plot(dca_pt_rw, dca_all_rw, color='gray', linewidth=2, linestyle='--', label='Treat All')
-    ax6.axhline(y=0, color='black', linewidth=1, linestyle=':', label='Treat None')
-    
-    # Mark operating point
-    ax6.scatter([threshold_prob], [delta_nb + max(0, base_rate - (1 - base_rate) * (threshold_prob / (1 - threshold_prob)))], 
-                color='red', s=50, zorder=5, label=f'p_t={threshold_prob:.2f}')
-    
-    ax6.set_xlabel('Threshold Probability', fontsize=11)
-    ax6.set_ylabel('Net Benefit', fontsize=11)
-    ax6.set_title(f'Decision Curve (Real-World, prev={base_rate:.1%})', fontsize=12)
-    ax6.set_xlim(0, 1)
-    # Set y limits: bottom just below 0, top based on max NB with margin
-    y_max_rw = max(np.max(dca_nb_rw), base_rate) * 1.1
-    ax6.set_ylim(bottom=-0.05, top=y_max_rw)
-    ax6.legend(loc='upper right', fontsize=9)
-    
-    # Add Delta NB annotation
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax6.text(0.02, 0.98, f"ΔNB = {delta_nb:.4f}", transform=ax6.transAxes, fontsize=10,
-             verticalalignment='top', horizontalalignment='left', bbox=props, family='monospace')
+    _draw_dca(ax6, dca_pt_rw, dca_nb_rw, dca_all_rw, base_rate, threshold_prob, delta_nb,
+              f'Decision Curve (Real-World, prev={base_rate:.1%})')
     
     if figure_title_prefix:
         fig.tight_layout(rect=[0, 0, 1, 0.95])
@@ -326,7 +459,9 @@ def plot_continuous(X: np.ndarray, Y: np.ndarray,
                     figsize: Tuple[float, float] = (16, 9),
                     x_label: str = "Predictor (X)",
                     y_label: str = "Outcome (Y)",
-                    figure_title_prefix: str | None = None) -> plt.Figure:
+                    figure_title_prefix: str | None = None,
+                    max_kde_samples: int | None = 5000,
+                    fig: plt.Figure | None = None) -> plt.Figure:
     """
     Plot 2x3 panel figure for continuous prediction:
     - Row 1: Scatterplot, ROC curve, DCA
@@ -358,15 +493,20 @@ def plot_continuous(X: np.ndarray, Y: np.ndarray,
         X axis label.
     y_label : str
         Y axis label.
+    max_kde_samples : int or None
+        Largest number of values per group drawn into the KDE curves; larger
+        groups are randomly subsampled (reproducibly) for display only.
+        None disables subsampling. Default 5000.
+    fig : matplotlib.figure.Figure, optional
+        A figure from an earlier call to redraw into (e.g. when sweeping
+        parameters interactively); its panels are cleared and reused instead
+        of building a new figure. ``figsize`` is ignored when given.
     
     Returns
     -------
     matplotlib.figure.Figure
     """
-    from .utils import (compute_cohens_d, compute_roc_auc, compute_pr_auc,
-                       compute_threshold_metrics, convert_pt_to_threshold,
-                       compute_roc_curve, compute_pr_curve)
-    
+    search = None
     if results is not None:
         x_threshold = results.threshold_value
         sens = results.sensitivity.estimate
@@ -378,7 +518,8 @@ def plot_continuous(X: np.ndarray, Y: np.ndarray,
         d = results.cohens_d.estimate
         delta_nb = results.delta_nb.estimate
     else:
-        x_threshold = convert_pt_to_threshold(group1, group2, base_rate, threshold_prob)
+        search = _KDEThresholdSearch(group1, group2)
+        x_threshold = search(base_rate, threshold_prob)[0]
         metrics = compute_threshold_metrics(group1, group2, x_threshold, base_rate, threshold_prob)
         sens = metrics['sensitivity']
         spec = metrics['specificity']
@@ -389,14 +530,13 @@ def plot_continuous(X: np.ndarray, Y: np.ndarray,
         pr_auc = compute_pr_auc(group1, group2, base_rate)
         d = compute_cohens_d(group1, group2)
     
-    # Compute curves
-    fprs, tprs, _ = compute_roc_curve(group1, group2)
-    precisions, recalls, _ = compute_pr_curve(group1, group2, base_rate)
+    # Compute curves (reusing the ones already stored on the results)
+    fprs, tprs, precisions, recalls = _curves(group1, group2, base_rate, results)
     
-    # Compute DCA curve
-    dca_pt, dca_nb, dca_all = compute_dca_curve(group1, group2, base_rate)
+    # Compute DCA curve (reusing the threshold search above, if any)
+    dca_pt, dca_nb, dca_all = _dca_curve(group1, group2, base_rate, search)
     
-    fig, axes = plt.subplots(2, 3, figsize=figsize)
+    fig, axes = _panel_axes(fig, figsize)
     ax1, ax2, ax3 = axes[0]  # Row 1: Scatterplot, ROC, DCA
     ax4, ax5, ax6 = axes[1]  # Row 2: Distributions, PR, Metrics
 
@@ -433,111 +573,43 @@ def plot_continuous(X: np.ndarray, Y: np.ndarray,
         f"R² = {r_squared:.3f}"
     )
     
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
     ax1.text(0.02, 0.98, corr_text, transform=ax1.transAxes, fontsize=10,
              verticalalignment='top', horizontalalignment='left', 
-             bbox=props, family='monospace')
+             bbox=_TEXT_BOX, family='monospace')
     
     # =========================================================================
     # Row 1, Right: ROC curve
     # =========================================================================
-    ax2.plot(fprs, tprs, color='#404040', linewidth=2)
-    ax2.plot([0, 1], [0, 1], 'k--', linewidth=1, alpha=0.5)
-    
-    # Mark operating point
-    ax2.scatter([1 - spec], [sens], color='red', s=50, zorder=5)
-    
-    ax2.set_xlabel('False Positive Rate (1 - Specificity)', fontsize=11)
-    ax2.set_ylabel('True Positive Rate (Sensitivity)', fontsize=11)
-    ax2.set_title(f'ROC Curve (AUC = {auc:.3f})', fontsize=12)
-    ax2.set_xlim(-0.02, 1.02)
-    ax2.set_ylim(-0.02, 1.02)
+    _draw_roc(ax2, fprs, tprs, 1 - spec, sens, auc)
     
     # =========================================================================
     # Row 1, Right: DCA curve
     # =========================================================================
-    ax3.plot(dca_pt, dca_nb, color='#404040', linewidth=2, label='Model')
-    ax3.plot(dca_pt, dca_all, color='gray', linewidth=2, linestyle='--', label='Treat All')
-    ax3.axhline(y=0, color='black', linewidth=1, linestyle=':', label='Treat None')
-    
-    # Mark operating point
-    ax3.scatter([threshold_prob], [delta_nb + max(0, base_rate - (1 - base_rate) * (threshold_prob / (1 - threshold_prob)))], 
-                color='red', s=50, zorder=5, label=f'p_t={threshold_prob:.2f}')
-    
-    ax3.set_xlabel('Threshold Probability', fontsize=11)
-    ax3.set_ylabel('Net Benefit', fontsize=11)
-    ax3.set_title(f'Decision Curve (Base Rate = {base_rate:.1%})', fontsize=12)
-    ax3.set_xlim(0, 1)
-    # Set y limits: bottom just below 0, top based on max NB with margin
-    y_max = max(np.max(dca_nb), base_rate) * 1.1
-    ax3.set_ylim(bottom=-0.05, top=y_max)
-    ax3.legend(loc='upper right', fontsize=9)
-    
-    # Add Delta NB annotation
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax3.text(0.02, 0.98, f"ΔNB = {delta_nb:.4f}", transform=ax3.transAxes, fontsize=10,
-             verticalalignment='top', horizontalalignment='left', bbox=props, family='monospace')
+    _draw_dca(ax3, dca_pt, dca_nb, dca_all, base_rate, threshold_prob, delta_nb,
+              f'Decision Curve (Base Rate = {base_rate:.1%})')
     
     # =========================================================================
     # Row 2, Left: Density distributions of X
     # =========================================================================
     x_range_density = np.linspace(np.min(X) - 0.5, np.max(X) + 0.5, 200)
     
-    # Compute KDEs
-    kde1 = stats.gaussian_kde(group1)
-    kde2 = stats.gaussian_kde(group2)
-    density1 = kde1(x_range_density)
-    density2 = kde2(x_range_density)
-    
-    # Rescale to base rate
-    density1_scaled = density1 * (1 - base_rate)
-    density2_scaled = density2 * base_rate
+    # Compute KDEs (on display-only subsamples for large groups)
+    rng = np.random.default_rng(0)
+    density1 = _kde_1d(_subsample(group1, max_kde_samples, rng), x_range_density)
+    density2 = _kde_1d(_subsample(group2, max_kde_samples, rng), x_range_density)
     
-    ax4.fill_between(x_range_density, density1_scaled, alpha=0.4, color='gray', label='Controls')
-    ax4.fill_between(x_range_density, density2_scaled, alpha=0.4, color='teal', label='Cases')
-    ax4.plot(x_range_density, density1_scaled, color='gray', linewidth=2)
-    ax4.plot(x_range_density, density2_scaled, color='teal', linewidth=2)
-    
-    ax4.axvline(x=x_threshold, color='red', linestyle='-', linewidth=2,
-                label=f'Threshold')
-    
-    ax4.set_xlabel(x_label, fontsize=11)
-    ax4.set_ylabel('Density (scaled)', fontsize=11)
-    ax4.set_title(f'Predictor Distributions (Base Rate = {base_rate:.1%})', fontsize=12)
-    ax4.set_ylim(bottom=0)
+    _draw_scaled_density(ax4, x_range_density, density1, density2, base_rate, x_threshold,
+                         'Controls', 'Cases', x_label,
+                         f'Predictor Distributions (Base Rate = {base_rate:.1%})')
     
     # Add metrics text box to distributions panel
-    metrics_text = (
-        f"Real-world prev = {base_rate:.1%}\n"
-        f"─────────────\n"
-        f"Cohen's d = {d:.3f}\n"
-        f"─────────────\n"
-        f"At threshold:\n"
-        f"  Sens = {sens:.3f}\n"
-        f"  Spec = {spec:.3f}\n"
-        f"  PPV = {ppv:.3f}\n"
-        f"  NPV = {npv:.3f}"
-    )
-    
-    props = dict(boxstyle='round', facecolor='white', alpha=0.9)
-    ax4.text(0.98, 0.98, metrics_text, transform=ax4.transAxes, fontsize=9,
-             verticalalignment='top', horizontalalignment='right', 
-             bbox=props, family='monospace')
+    _draw_metrics_box(ax4, label="Real-world", prev=base_rate, d=d,
+                      sens=sens, spec=spec, ppv=ppv, npv=npv)
     
     # =========================================================================
     # Row 2, Middle: PR curve
     # =========================================================================
-    ax5.plot(recalls, precisions, color='#404040', linewidth=2)
-    ax5.axhline(y=base_rate, color='k', linestyle='--', linewidth=1, alpha=0.5)
-    
-    # Mark operating point
-    ax5.scatter([sens], [ppv], color='red', s=50, zorder=5)
-    
-    ax5.set_xlabel('Recall (Sensitivity)', fontsize=11)
-    ax5.set_ylabel('Precision (PPV)', fontsize=11)
-    ax5.set_title(f'PR Curve (AUC = {pr_auc:.3f})', fontsize=12)
-    ax5.set_xlim(-0.02, 1.02)
-    ax5.set_ylim(-0.02, 1.02)
+    _draw_pr(ax5, recalls, precisions, base_rate, sens, ppv, pr_auc)
     
     # =========================================================================
     # Row 2, Right: Correlation info
@@ -589,15 +661,14 @@ def plot_binary_deattenuated(
     figsize: Tuple[float, float] = (16, 9),
     group1_label: str = "Group 1 (Controls)",
     group2_label: str = "Group 2 (Cases)",
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot the same binary panels after applying a reliability transformation.
 
-    Returns a fresh matplotlib Figure (i.e., a separate window when shown).
+    Returns a fresh matplotlib Figure (i.e., a separate window when shown),
+    or redraws into ``fig`` when one is given.
     """
-    from .binary import E2PBinary
-    from .utils import transform_for_target_reliability, transform_groups_for_target_kappa
-
     g1 = np.asarray(group1, dtype=float)
     g2 = np.asarray(group2, dtype=float)
 
@@ -645,6 +716,7 @@ def plot_binary_deattenuated(
         group1_label=group1_label,
         group2_label=group2_label,
         figure_title_prefix=title,
+        fig=fig,
     )
 
 
@@ -665,17 +737,15 @@ def plot_continuous_deattenuated(
     figsize: Tuple[float, float] = (16, 9),
     x_label: str = "Predictor (X)",
     y_label: str = "Outcome (Y)",
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot the same continuous panels after applying reliability transformation.
 
     Keeps the original case/control split fixed (based on observed Y).
-    Returns a fresh matplotlib Figure (i.e., a separate window when shown).
+    Returns a fresh matplotlib Figure (i.e., a separate window when shown),
+    or redraws into ``fig`` when one is given.
     """
-    from .continuous import E2PContinuous
-    from .binary import E2PBinary
-    from .utils import transform_for_target_reliability
-
     X = np.asarray(X, dtype=float)
     Y = np.asarray(Y, dtype=float)
 
@@ -699,8 +769,7 @@ def plot_continuous_deattenuated(
         random_state=random_state,
     )
     # fixed split from observed Y
-    group1_tgt = X_tgt[~calc.is_case]
-    group2_tgt = X_tgt[calc.is_case]
+    group1_tgt, group2_tgt = calc._split_groups(X_tgt)
 
     results = E2PBinary(
         group1=group1_tgt,
@@ -732,4 +801,5 @@ def plot_continuous_deattenuated(
         x_label=x_label,
         y_label=y_label,
         figure_title_prefix=title,
+        fig=fig,
     )
@@ -3,11 +3,14 @@ Shared statistical utility functions for e2p.
 """
 
 import numpy as np
-from scipy import stats
-from scipy.optimize import brentq
-from typing import Tuple
+from typing import Optional, Tuple
 import warnings
 
+from ._numba_kernels import kde_thresholds
+from .parametric import (
+    compute_pr_auc_parametric, compute_roc_auc_parametric, compute_threshold_from_pt,
+)
+
 
 def transform_for_target_reliability(
     x: np.ndarray,
@@ -15,6 +18,7 @@ def transform_for_target_reliability(
     r_target: float,
     *,
     center: str = "mean",
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Deterministically transform measurements to reflect a target reliability.
@@ -46,31 +50,116 @@ def transform_for_target_reliability(
         Observed measurements.
     r_current : float
         Current reliability in (0, 1].
-    r_target : float
-        Target reliability in (0, 1].
+    r_target : float or 1-D array-like
+        Target reliability in (0, 1]. An array of K targets sweeps them all
+        at once: the center is computed once and the result has shape
+        (K, N), one transformed copy of ``x`` (1-D, length N) per target.
     center : {"mean","median"}
         Location parameter c used for centering before rescaling.
+    out : np.ndarray, optional
+        Preallocated float array (same shape as the result) to write the
+        result into; may be ``x`` itself for a scalar ``r_target``.
 
     Returns
     -------
     np.ndarray
-        Transformed measurements.
+        Transformed measurements (``out`` if given). Floating input keeps
+        its dtype; other input is converted to float64.
     """
-    x = np.asarray(x, dtype=float)
+    x = np.asarray(x)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(float)
 
     if not np.all(np.isfinite(x)):
         raise ValueError("x must contain only finite values")
     if not (0 < r_current <= 1):
         raise ValueError("r_current must be in (0, 1]")
-    if not (0 < r_target <= 1):
+    if np.ndim(r_target) > 0:
+        r_target = np.asarray(r_target, dtype=float)
+        if r_target.ndim != 1 or x.ndim != 1:
+            raise ValueError("an array of r_target values needs 1-D r_target and x")
+        if not np.all((r_target > 0) & (r_target <= 1)):
+            raise ValueError("r_target must be in (0, 1]")
+    elif not (0 < r_target <= 1):
         raise ValueError("r_target must be in (0, 1]")
 
     if center not in {"mean", "median"}:
         raise ValueError("center must be 'mean' or 'median'")
 
     c = float(np.mean(x)) if center == "mean" else float(np.median(x))
+    if np.ndim(r_target) > 0:
+        scales = np.sqrt(r_current / r_target)[:, None]
+        out = np.multiply(scales, x - c, out=out)
+        np.add(out, c, out=out)
+        return out
     scale = float(np.sqrt(r_current / r_target))
-    return c + scale * (x - c)
+    out = np.subtract(x, c, out=out)
+    np.multiply(out, scale, out=out)
+    np.add(out, c, out=out)
+    return out
+
+
+def transform_for_target_reliability_batched(
+    x: np.ndarray,
+    r_current,
+    r_target,
+    *,
+    center: str = "mean",
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Row-wise version of :func:`transform_for_target_reliability`.
+
+    Each row ``x[i]`` is rescaled around its own location with its own
+    ``r_current[i]`` / ``r_target[i]``. Centers and scale factors are computed
+    for all rows at once and applied in a single broadcast pass, so stacking
+    e.g. X and Y into a ``(2, N)`` array costs one sweep over memory instead
+    of two.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        2-D array of shape (K, N); one measurement vector per row.
+    r_current, r_target : array-like
+        Current and target reliabilities in (0, 1], one per row.
+    center : {"mean","median"}
+        Location parameter used for centering before rescaling.
+    out : np.ndarray, optional
+        Preallocated float array of shape (K, N) for the result; may be ``x``.
+
+    Returns
+    -------
+    np.ndarray
+        Transformed measurements with the same shape and floating dtype as
+        ``x`` (``out`` if given).
+    """
+    x = np.asarray(x)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(float)
+    r_current = np.asarray(r_current, dtype=float)
+    r_target = np.asarray(r_target, dtype=float)
+
+    if x.ndim != 2:
+        raise ValueError("x must be a 2-D array of shape (K, N)")
+    if r_current.shape != (x.shape[0],) or r_target.shape != (x.shape[0],):
+        raise ValueError("r_current and r_target must provide one value per row of x")
+    if not np.all(np.isfinite(x)):
+        raise ValueError("x must contain only finite values")
+    if not np.all((r_current > 0) & (r_current <= 1)):
+        raise ValueError("r_current must be in (0, 1]")
+    if not np.all((r_target > 0) & (r_target <= 1)):
+        raise ValueError("r_target must be in (0, 1]")
+
+    if center not in {"mean", "median"}:
+        raise ValueError("center must be 'mean' or 'median'")
+
+    c = np.mean(x, axis=1) if center == "mean" else np.median(x, axis=1)
+    c = c[:, None]
+    scale = np.sqrt(r_current / r_target)[:, None]
+    out = np.subtract(x, c, out=out)
+    np.multiply(out, scale, out=out)
+    np.add(out, c, out=out)
+    return out
 
 
 def transform_groups_for_target_kappa(
@@ -142,14 +231,40 @@ def transform_groups_for_target_kappa(
     return (g1 - shift), (g2 + shift)
 
 
+def _mean_and_ss(x: np.ndarray) -> Tuple[float, float]:
+    """Mean and sum of squared deviations, without a squared temporary."""
+    mean = np.mean(x)
+    dev = x - mean
+    return mean, np.dot(dev, dev)
+
+
+def _normal_fit(g1: np.ndarray, g2: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Normal fit of both groups for the ``assume_gaussian`` fast paths.
+
+    Returns ``(mean1, mean2 - mean1, sd1, sd2)``: group 1 shifted to zero, as
+    the parametric functions place it, with sample SDs (ddof=1) on the raw
+    scale. The parametric metrics are location and scale invariant, so no
+    further standardization is needed.
+    """
+    n1, n2 = len(g1), len(g2)
+    if n1 < 2 or n2 < 2:
+        raise ValueError("assume_gaussian needs at least two values per group")
+    mean1, ss1 = _mean_and_ss(g1)
+    mean2, ss2 = _mean_and_ss(g2)
+    if ss1 == 0 or ss2 == 0:
+        raise ValueError("assume_gaussian needs non-zero variance in both groups")
+    return mean1, mean2 - mean1, np.sqrt(ss1 / (n1 - 1)), np.sqrt(ss2 / (n2 - 1))
+
+
 def compute_cohens_d(g1: np.ndarray, g2: np.ndarray) -> float:
     """Compute Cohen's d: standardized mean difference with pooled SD."""
     n1, n2 = len(g1), len(g2)
-    mean1, mean2 = np.mean(g1), np.mean(g2)
-    var1, var2 = np.var(g1, ddof=1), np.var(g2, ddof=1)
+    mean1, ss1 = _mean_and_ss(g1)
+    mean2, ss2 = _mean_and_ss(g2)
     
     # Pooled standard deviation
-    pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+    pooled_var = (ss1 + ss2) / (n1 + n2 - 2)
     pooled_sd = np.sqrt(pooled_var)
     
     if pooled_sd == 0:
@@ -159,21 +274,40 @@ def compute_cohens_d(g1: np.ndarray, g2: np.ndarray) -> float:
 
 
 def compute_point_biserial_r(g1: np.ndarray, g2: np.ndarray) -> float:
-    """Compute point-biserial correlation directly."""
-    values = np.concatenate([g1, g2])
-    labels = np.concatenate([np.zeros(len(g1)), np.ones(len(g2))])
-    r, _ = stats.pearsonr(labels, values)
-    return r
+    """
+    Compute point-biserial correlation directly.
+
+    Closed form of Pearson's r between group membership and the values:
+    r = (m2 - m1) * sqrt(n1 * n2 / N) / sqrt(SS_total). NaN when all values
+    are equal, as with ``scipy.stats.pearsonr``.
+    """
+    n1, n2 = len(g1), len(g2)
+    mean1, ss1 = _mean_and_ss(g1)
+    mean2, ss2 = _mean_and_ss(g2)
+    
+    weight = n1 * n2 / (n1 + n2)
+    ss_total = ss1 + ss2 + weight * (mean2 - mean1)**2
+    if ss_total == 0:
+        return np.nan
+    
+    r = (mean2 - mean1) * np.sqrt(weight / ss_total)
+    return np.clip(r, -1.0, 1.0)
 
 
 def compute_eta_squared(g1: np.ndarray, g2: np.ndarray) -> float:
-    """Compute eta-squared from one-way ANOVA decomposition."""
-    all_values = np.concatenate([g1, g2])
-    grand_mean = np.mean(all_values)
+    """
+    Compute eta-squared from one-way ANOVA decomposition.
+
+    Built from the per-group means and sums of squares
+    (SS_total = SS_within + SS_between), so the pooled sample is never
+    materialized or traversed again.
+    """
+    n1, n2 = len(g1), len(g2)
+    mean1, ss1 = _mean_and_ss(g1)
+    mean2, ss2 = _mean_and_ss(g2)
     
-    ss_between = len(g1) * (np.mean(g1) - grand_mean)**2 + \
-                 len(g2) * (np.mean(g2) - grand_mean)**2
-    ss_total = np.sum((all_values - grand_mean)**2)
+    ss_between = n1 * n2 / (n1 + n2) * (mean2 - mean1)**2
+    ss_total = ss1 + ss2 + ss_between
     
     if ss_total == 0:
         return 0.0
@@ -199,158 +333,421 @@ def compute_cohens_u3(g1: np.ndarray, g2: np.ndarray) -> float:
     return np.mean(g2 > median_g1)
 
 
-def compute_roc_auc(g1: np.ndarray, g2: np.ndarray) -> float:
-    """Compute ROC-AUC using Mann-Whitney U statistic."""
+def compute_roc_auc(g1: np.ndarray, g2: np.ndarray, *,
+                    assume_gaussian: bool = False) -> float:
+    """
+    Compute ROC-AUC using Mann-Whitney U statistic.
+
+    U comes from the rank sum of g2 in the pooled sample, so this is a single
+    O(N log N) sort. Ties get mid-ranks, which counts tied pairs as one half:
+    AUC = P(g2 > g1) + 0.5 * P(g2 == g1).
+
+    With ``assume_gaussian=True`` each group is instead summarized by its mean
+    and SD and the binormal AUC ``Phi((m2 - m1) / sqrt(s1^2 + s2^2))`` is
+    returned (:func:`~e2p.parametric.compute_roc_auc_parametric`), skipping
+    the sort.
+    """
+    if assume_gaussian:
+        _, delta, sd1, sd2 = _normal_fit(g1, g2)
+        return compute_roc_auc_parametric(delta, sd1, sd2)
+    from scipy.stats import rankdata
     n1, n2 = len(g1), len(g2)
     
-    count = 0
-    for x2 in g2:
-        count += np.sum(g1 < x2) + 0.5 * np.sum(g1 == x2)
-    
-    return count / (n1 * n2)
+    ranks = rankdata(np.concatenate([g1, g2]))
+    u = ranks[n1:].sum() - n2 * (n2 + 1) / 2
+    return u / (n1 * n2)
 
 
-def compute_pr_auc(g1: np.ndarray, g2: np.ndarray, base_rate: float) -> float:
-    """Compute PR-AUC using base_rate for precision calculation."""
-    all_values = np.concatenate([g1, g2])
-    thresholds = np.unique(all_values)
-    thresholds = np.sort(thresholds)[::-1]
-    
-    precisions = []
-    recalls = []
-    
-    for t in thresholds:
-        sens = np.mean(g2 >= t)
-        spec = np.mean(g1 < t)
-        
-        numerator = sens * base_rate
-        denominator = numerator + (1 - spec) * (1 - base_rate)
-        
-        if denominator > 0:
-            precision = numerator / denominator
+def compute_roc_auc_batched(g1_rows, g2_rows, xp=np):
+    """
+    ROC-AUC for each row of two (B, n1) / (B, n2) resample matrices.
+
+    Uses only array-API operations, so ``xp`` may be NumPy or CuPy. Each row
+    is stably sorted twice, once with group 1 before group 2 inside ties and
+    once the other way round. For every group 2 value this counts the group 1
+    values ``<= x`` and ``< x``; their average gives the same
+    ``P(g2 > g1) + 0.5 * P(g2 == g1)`` as :func:`compute_roc_auc`.
+
+    Returns
+    -------
+    array of shape (B,), on the same device as the inputs.
+    """
+    n_rows, n1 = g1_rows.shape
+    n2 = g2_rows.shape[1]
+    total = xp.zeros(n_rows)
+    for first, second, first_is_g1 in ((g1_rows, g2_rows, True), (g2_rows, g1_rows, False)):
+        values = xp.concatenate([first, second], axis=1)
+        is_g1 = xp.zeros(values.shape, dtype=bool)
+        if first_is_g1:
+            is_g1[:, :n1] = True
         else:
-            precision = 1.0
-        
-        precisions.append(precision)
-        recalls.append(sens)
+            is_g1[:, n2:] = True
+        order = xp.argsort(values, axis=1, kind='stable')
+        is_g1 = xp.take_along_axis(is_g1, order, axis=1)
+        g1_before = xp.cumsum(is_g1, axis=1) - is_g1
+        total += xp.sum(xp.where(is_g1, 0, g1_before), axis=1)
+    return 0.5 * total / (n1 * n2)
+
+
+def compute_effect_sizes_batched(g1_rows: np.ndarray, g2_rows: np.ndarray) -> dict:
+    """
+    Effect sizes for each row of two (B, n1) / (B, n2) resample matrices.
+
+    Row-wise counterparts of :func:`compute_cohens_d`,
+    :func:`compute_point_biserial_r`, :func:`compute_eta_squared`,
+    :func:`compute_odds_ratio` and :func:`compute_cohens_u3`, built from one
+    mean and sum-of-squares reduction per group matrix.
+
+    Returns
+    -------
+    dict
+        Arrays of shape (B,) under the keys 'cohens_d', 'r', 'eta_squared',
+        'odds_ratio', 'log_odds_ratio' and 'cohens_u3'.
+    """
+    n1, n2 = g1_rows.shape[1], g2_rows.shape[1]
+    mean1 = g1_rows.mean(axis=1)
+    mean2 = g2_rows.mean(axis=1)
+    dev1 = g1_rows - mean1[:, None]
+    dev2 = g2_rows - mean2[:, None]
+    ss1 = np.einsum('ij,ij->i', dev1, dev1)
+    ss2 = np.einsum('ij,ij->i', dev2, dev2)
+    
+    diff = mean2 - mean1
+    pooled_sd = np.sqrt((ss1 + ss2) / (n1 + n2 - 2))
+    weight = n1 * n2 / (n1 + n2)
+    ss_between = weight * diff**2
+    ss_total = ss1 + ss2 + ss_between
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cohens_d = np.where(pooled_sd == 0, 0.0, diff / pooled_sd)
+        eta_squared = np.where(ss_total == 0, 0.0, ss_between / ss_total)
+        r = np.where(ss_total == 0, np.nan,
+                     np.clip(diff * np.sqrt(weight / ss_total), -1.0, 1.0))
+    log_or = cohens_d * np.pi / np.sqrt(3)
+    
+    medians = np.median(g1_rows, axis=1)
+    cohens_u3 = np.mean(g2_rows > medians[:, None], axis=1)
     
-    precisions = [1.0] + precisions + [base_rate]
-    recalls = [0.0] + recalls + [1.0]
+    return {
+        'cohens_d': cohens_d,
+        'r': r,
+        'eta_squared': eta_squared,
+        'odds_ratio': np.exp(log_or),
+        'log_odds_ratio': log_or,
+        'cohens_u3': cohens_u3,
+    }
+
+
+def compute_pr_auc(g1: np.ndarray, g2: np.ndarray, base_rate: float, *,
+                   assume_gaussian: bool = False) -> float:
+    """
+    Compute PR-AUC using base_rate for precision calculation.
+
+    With ``assume_gaussian=True`` the PR curve of the fitted normals is
+    integrated instead (:func:`~e2p.parametric.compute_pr_auc_parametric`).
+    """
+    if assume_gaussian:
+        _, delta, sd1, sd2 = _normal_fit(g1, g2)
+        return compute_pr_auc_parametric(delta, base_rate, sd1, sd2)
+    return _pr_auc_from_counts(*_rank_counts(g1, g2), len(g1), len(g2), base_rate)
+
+
+def _pr_auc_from_counts(thresholds, g1_below, g2_below, n1, n2, base_rate) -> float:
+    """Trapezoidal PR-AUC (see :func:`compute_pr_auc`) from :func:`_rank_counts` output."""
+    precisions, recalls, _ = _pr_from_counts(thresholds, g1_below, g2_below, n1, n2, base_rate)
+    
+    precisions = np.concatenate([[1.0], precisions, [base_rate]])
+    recalls = np.concatenate([[0.0], recalls, [1.0]])
     
     sorted_indices = np.argsort(recalls)
-    recalls = np.array(recalls)[sorted_indices]
-    precisions = np.array(precisions)[sorted_indices]
+    recalls = recalls[sorted_indices]
+    precisions = precisions[sorted_indices]
     
     pr_auc = np.trapezoid(precisions, recalls)
     return np.clip(pr_auc, 0, 1)
 
 
-def compute_roc_curve(g1: np.ndarray, g2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Compute ROC curve data."""
+def _rank_counts(g1: np.ndarray, g2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unique values of g1 and g2 (ascending), with the number of g1 and of g2
+    values strictly below each one, from a single sort of the pooled values.
+    """
+    n1 = len(g1)
     all_values = np.concatenate([g1, g2])
-    thresholds = np.unique(all_values)
-    thresholds = np.sort(thresholds)
-    
-    fprs = []
-    tprs = []
+    order = np.argsort(all_values, kind='stable')
+    sorted_values = all_values[order]
+    is_g2 = order >= n1
     
-    for t in thresholds:
-        tpr = np.mean(g2 >= t)
-        fpr = np.mean(g1 >= t)
-        tprs.append(tpr)
-        fprs.append(fpr)
-    
-    fprs = [1.0] + fprs + [0.0]
-    tprs = [1.0] + tprs + [0.0]
+    first = np.flatnonzero(np.concatenate([[True], sorted_values[1:] != sorted_values[:-1]]))
+    g2_below = (np.cumsum(is_g2) - is_g2)[first]
+    g1_below = first - g2_below
+    return sorted_values[first], g1_below, g2_below
+
+
+def _roc_auc_from_counts(thresholds, g1_below, g2_below, n1, n2) -> float:
+    """
+    Mann-Whitney ROC-AUC (see :func:`compute_roc_auc`) from
+    :func:`_rank_counts` output: each g2 value beats the g1 values below it
+    and ties with those equal to it, which count one half.
+    """
+    g1_at = np.diff(g1_below, append=n1)
+    g2_at = np.diff(g2_below, append=n2)
+    u = np.dot(g2_at, g1_below) + 0.5 * np.dot(g2_at, g1_at)
+    return u / (n1 * n2)
+
+
+def _roc_from_counts(thresholds, g1_below, g2_below, n1, n2):
+    """ROC curve (fprs, tprs, thresholds) from :func:`_rank_counts` output."""
+    tprs = np.concatenate([[1.0], (n2 - g2_below) / n2, [0.0]])
+    fprs = np.concatenate([[1.0], (n1 - g1_below) / n1, [0.0]])
     thresholds = np.concatenate([[thresholds[0] - 1], thresholds, [thresholds[-1] + 1]])
+    return fprs, tprs, thresholds
+
+
+def _pr_from_counts(thresholds, g1_below, g2_below, n1, n2, base_rate):
+    """PR curve (precisions, recalls, thresholds) from :func:`_rank_counts` output."""
+    # Walk thresholds from high to low, as the PR curve is traced
+    sens = ((n2 - g2_below) / n2)[::-1]
+    spec = (g1_below / n1)[::-1]
     
-    return np.array(fprs), np.array(tprs), thresholds
+    numerator = sens * base_rate
+    denominator = numerator + (1 - spec) * (1 - base_rate)
+    precisions = np.ones_like(sens)
+    np.divide(numerator, denominator, out=precisions, where=denominator > 0)
+    return precisions, sens, thresholds[::-1]
+
+
+def _rank_curves(g1: np.ndarray, g2: np.ndarray, base_rate: float):
+    """
+    ROC and PR curves sharing one sort: returns ``(roc_curve, pr_curve)`` in
+    the formats of :func:`compute_roc_curve` and :func:`compute_pr_curve`.
+    """
+    n1, n2 = len(g1), len(g2)
+    counts = _rank_counts(g1, g2)
+    return _roc_from_counts(*counts, n1, n2), _pr_from_counts(*counts, n1, n2, base_rate)
+
+
+def compute_average_precision(g1: np.ndarray, g2: np.ndarray, base_rate: float) -> float:
+    """
+    Average precision: step-wise area under the PR curve using base_rate.
+
+    Sums ``(R_k - R_{k-1}) * P_k`` over thresholds from high to low, as in
+    scikit-learn's ``average_precision_score``, with precision taken at
+    ``base_rate`` rather than at the sample prevalence. Unlike the
+    trapezoidal :func:`compute_pr_auc`, it does not interpolate linearly
+    between operating points, which overstates the area where precision
+    drops sharply.
+    """
+    precisions, recalls, _ = compute_pr_curve(g1, g2, base_rate)
+    return float(np.sum(np.diff(recalls, prepend=0.0) * precisions))
+
+
+def compute_roc_curve(g1: np.ndarray, g2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute ROC curve data."""
+    return _roc_from_counts(*_rank_counts(g1, g2), len(g1), len(g2))
 
 
 def compute_pr_curve(g1: np.ndarray, g2: np.ndarray, base_rate: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Compute PR curve data using base_rate."""
-    all_values = np.concatenate([g1, g2])
-    thresholds = np.unique(all_values)
-    thresholds = np.sort(thresholds)[::-1]
-    
-    precisions = []
-    recalls = []
-    
-    for t in thresholds:
-        sens = np.mean(g2 >= t)
-        spec = np.mean(g1 < t)
-        
-        numerator = sens * base_rate
-        denominator = numerator + (1 - spec) * (1 - base_rate)
-        
-        if denominator > 0:
-            precision = numerator / denominator
-        else:
-            precision = 1.0
-        
-        precisions.append(precision)
-        recalls.append(sens)
-    
-    return np.array(precisions), np.array(recalls), thresholds
+    return _pr_from_counts(*_rank_counts(g1, g2), len(g1), len(g2), base_rate)
 
 
 def convert_pt_to_threshold(g1: np.ndarray, g2: np.ndarray, 
-                            base_rate: float, pt: float) -> float:
+                            base_rate: float, pt: float, *,
+                            assume_gaussian: bool = False) -> float:
     """
     Convert threshold probability (p_t) to measurement threshold.
     Uses KDE to estimate PDFs and finds threshold t where:
     P(group2 | measurement = t) = pt
+
+    With ``assume_gaussian=True`` the PDFs are the fitted normals and t is
+    solved in closed form (:func:`~e2p.parametric.compute_threshold_from_pt`).
+    """
+    if assume_gaussian:
+        mean1, delta, sd1, sd2 = _normal_fit(g1, g2)
+        return mean1 + compute_threshold_from_pt(delta, pt, base_rate, sd1, sd2)
+    return convert_pts_to_thresholds(g1, g2, base_rate, [pt])[0]
+
+
+class _KDEThresholdSearch:
+    """
+    Group KDEs, root-search bracket and density grid for one pair of samples.
+
+    Calling an instance maps p_t values to thresholds at any base rate (see
+    :func:`convert_pts_to_thresholds`). Callers that search the same samples
+    repeatedly (DCA sweeps, plots, ``E2PBinary.compute_at_thresholds``) keep
+    one instance so the KDEs and grid are built only once.
     """
-    try:
-        kde1 = stats.gaussian_kde(g1)
-        kde2 = stats.gaussian_kde(g2)
-    except np.linalg.LinAlgError:
-        warnings.warn("KDE failed, using quantile-based threshold")
-        return np.percentile(np.concatenate([g1, g2]), 100 * (1 - pt))
-    
-    all_values = np.concatenate([g1, g2])
-    t_min = np.min(all_values) - 2 * np.std(all_values)
-    t_max = np.max(all_values) + 2 * np.std(all_values)
     
-    def posterior_minus_pt(t):
-        f1 = kde1(t)[0]
-        f2 = kde2(t)[0]
+    def __init__(self, g1: np.ndarray, g2: np.ndarray):
+        from scipy import stats
         
-        numerator = f2 * base_rate
-        denominator = f1 * (1 - base_rate) + f2 * base_rate
+        self.g1 = g1
+        self.g2 = g2
+        self._grid = None
+        try:
+            self.kde1 = stats.gaussian_kde(g1)
+            self.kde2 = stats.gaussian_kde(g2)
+        except np.linalg.LinAlgError:
+            self.kde1 = self.kde2 = None
+            return
         
-        if denominator < 1e-15:
-            return 0.5 - pt
+        # Bracket: pooled range widened by two pooled SDs, from per-group
+        # passes (no concatenated copy, SD computed once)
+        n1, n2 = len(g1), len(g2)
+        mean1, ss1 = _mean_and_ss(g1)
+        mean2, ss2 = _mean_and_ss(g2)
+        ss_all = ss1 + ss2 + (mean1 - mean2) ** 2 * n1 * n2 / (n1 + n2)
+        margin = 2 * np.sqrt(ss_all / (n1 + n2))
+        self.t_min = min(np.min(g1), np.min(g2)) - margin
+        self.t_max = max(np.max(g1), np.max(g2)) + margin
+    
+    def _density_grid(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Both group KDEs on a 1000-point grid over the bracket (built on first use)."""
+        if self._grid is None:
+            t_grid = np.linspace(self.t_min, self.t_max, 1000)
+            self._grid = (t_grid, self.kde1(t_grid), self.kde2(t_grid))
+        return self._grid
+    
+    def __call__(self, base_rate: float, pts) -> np.ndarray:
+        from scipy.optimize import brentq
         
-        posterior = numerator / denominator
-        return posterior - pt
-    
-    try:
-        threshold = brentq(posterior_minus_pt, t_min, t_max)
-    except ValueError:
-        t_grid = np.linspace(t_min, t_max, 1000)
-        posteriors = np.array([posterior_minus_pt(t) + pt for t in t_grid])
-        idx = np.argmin(np.abs(posteriors - pt))
-        threshold = t_grid[idx]
-    
-    return threshold
+        pts = np.atleast_1d(np.asarray(pts, dtype=float))
+        if self.kde1 is None:
+            warnings.warn("KDE failed, using quantile-based threshold")
+            return np.percentile(np.concatenate([self.g1, self.g2]), 100 * (1 - pts))
+        kde1, kde2 = self.kde1, self.kde2
+        
+        if kde_thresholds is not None:
+            # Same root search compiled, summing the 1-D kernels directly
+            return kde_thresholds(
+                kde1.dataset[0], np.sqrt(kde1.covariance[0, 0]),
+                kde2.dataset[0], np.sqrt(kde2.covariance[0, 0]),
+                float(base_rate), pts, float(self.t_min), float(self.t_max)
+            )
+        
+        def posterior_minus_pt(t, pt):
+            f1 = kde1(t)[0]
+            f2 = kde2(t)[0]
+            
+            numerator = f2 * base_rate
+            denominator = f1 * (1 - base_rate) + f2 * base_rate
+            
+            if denominator < 1e-15:
+                return 0.5 - pt
+            
+            posterior = numerator / denominator
+            return posterior - pt
+        
+        # The grid narrows each root bracket to one cell (so brentq needs only
+        # a few scalar KDE calls) and serves the closest-point fallback when
+        # there is no root.
+        t_grid, f1_grid, f2_grid = self._density_grid()
+        numerator = f2_grid * base_rate
+        denominator = f1_grid * (1 - base_rate) + numerator
+        posterior_grid = np.full_like(t_grid, 0.5)
+        np.divide(numerator, denominator, out=posterior_grid, where=denominator >= 1e-15)
+        
+        thresholds = np.empty(len(pts))
+        for i, pt in enumerate(pts):
+            diff = posterior_grid - pt
+            if diff[0] * diff[-1] > 0:
+                # No sign change over the whole bracket
+                thresholds[i] = t_grid[np.argmin(np.abs(diff))]
+                continue
+            j = np.flatnonzero(diff[:-1] * diff[1:] <= 0)[0]
+            try:
+                thresholds[i] = brentq(posterior_minus_pt, t_grid[j], t_grid[j + 1], args=(pt,))
+            except ValueError:
+                # Scalar and grid evaluations disagree on a sign within rounding
+                thresholds[i] = t_grid[j] if abs(diff[j]) <= abs(diff[j + 1]) else t_grid[j + 1]
+        
+        return thresholds
+
+
+def convert_pts_to_thresholds(g1: np.ndarray, g2: np.ndarray,
+                              base_rate: float, pts) -> np.ndarray:
+    """
+    Vectorized :func:`convert_pt_to_threshold` over several p_t values.
+
+    The group KDEs, the search bracket and a 1000-point grid of the posterior
+    are built once and shared by the root search for every p_t. Where the
+    posterior crosses p_t more than once, the lowest crossing is returned.
+    """
+    return _KDEThresholdSearch(g1, g2)(base_rate, pts)
 
 
 def compute_threshold_metrics(g1: np.ndarray, g2: np.ndarray,
                               threshold: float, base_rate: float, 
                               pt: float) -> dict:
-    """Compute all threshold-dependent metrics."""
+    """
+    Compute all threshold-dependent metrics.
+
+    ``threshold`` (and ``pt``) may also be arrays, in which case this is
+    :func:`compute_threshold_metrics_batch` and every value in the returned
+    dict is an array with one entry per threshold.
+    """
+    if np.ndim(threshold) > 0:
+        return compute_threshold_metrics_batch(g1, g2, threshold, base_rate, pt)
     sens = np.mean(g2 >= threshold)
     spec = np.mean(g1 < threshold)
+    return metrics_from_rates(sens, spec, base_rate, pt)
+
+
+def compute_threshold_metrics_batch(g1: np.ndarray, g2: np.ndarray,
+                                    thresholds, base_rate: float,
+                                    pts) -> dict:
+    """
+    Threshold-dependent metrics for T (threshold, p_t) pairs at once.
+
+    Each group is sorted once and sensitivity/specificity for every threshold
+    are read off with ``np.searchsorted``, i.e. O(N log N + T log N) instead
+    of a full pass over the data per threshold.
+
+    Returns
+    -------
+    dict
+        Same keys as :func:`compute_threshold_metrics`, each an array of
+        shape (T,).
+    """
+    thresholds = np.atleast_1d(np.asarray(thresholds, dtype=float))
+    pts = np.broadcast_to(np.asarray(pts, dtype=float), thresholds.shape)
+    g1_sorted = np.sort(g1)
+    g2_sorted = np.sort(g2)
+    # g2 >= t  <=>  not (g2 < t);  g1 < t counted by the left insertion point
+    sens = 1.0 - np.searchsorted(g2_sorted, thresholds, side='left') / len(g2_sorted)
+    spec = np.searchsorted(g1_sorted, thresholds, side='left') / len(g1_sorted)
+    
+    return metrics_from_rates(sens, spec, base_rate, pts)
+
+
+def _divide_or(num, den, fallback, where):
+    """``num / den`` where ``where`` holds, ``fallback`` elsewhere (no warnings)."""
+    out = np.full(np.broadcast(num, den).shape, fallback, dtype=float)
+    return np.divide(num, den, out=out, where=where)
+
+
+def metrics_from_rates(sens: float, spec: float, base_rate: float,
+                       pt: float) -> dict:
+    """
+    Threshold-dependent metrics from sensitivity and specificity.
+
+    Every metric is a branch-free array expression, so ``sens``, ``spec`` and
+    ``pt`` may be scalars or broadcastable arrays; the values in the returned
+    dict have their broadcast shape (NumPy scalars for scalar input).
+    """
+    scalar = np.ndim(sens) == 0 and np.ndim(spec) == 0 and np.ndim(pt) == 0
+    sens = np.asarray(sens, dtype=float)
+    spec = np.asarray(spec, dtype=float)
+    pt = np.asarray(pt, dtype=float)
     
     # PPV and NPV using base_rate
     ppv_num = sens * base_rate
     ppv_denom = ppv_num + (1 - spec) * (1 - base_rate)
-    ppv = ppv_num / ppv_denom if ppv_denom > 0 else 1.0
+    ppv = _divide_or(ppv_num, ppv_denom, 1.0, ppv_denom > 0)
     
     npv_num = spec * (1 - base_rate)
     npv_denom = npv_num + (1 - sens) * base_rate
-    npv = npv_num / npv_denom if npv_denom > 0 else 1.0
+    npv = _divide_or(npv_num, npv_denom, 1.0, npv_denom > 0)
     
     # Accuracy (using base_rate)
     accuracy = sens * base_rate + spec * (1 - base_rate)
@@ -359,7 +756,7 @@ def compute_threshold_metrics(g1: np.ndarray, g2: np.ndarray,
     balanced_accuracy = (sens + spec) / 2
     
     # F1 score
-    f1 = 2 * (ppv * sens) / (ppv + sens) if (ppv + sens) > 0 else 0.0
+    f1 = _divide_or(2 * (ppv * sens), ppv + sens, 0.0, (ppv + sens) > 0)
     
     # MCC
     tp_rate = sens * base_rate
@@ -370,12 +767,12 @@ def compute_threshold_metrics(g1: np.ndarray, g2: np.ndarray,
     mcc_num = (tp_rate * tn_rate) - (fp_rate * fn_rate)
     mcc_denom = np.sqrt((tp_rate + fp_rate) * (tp_rate + fn_rate) * 
                        (tn_rate + fp_rate) * (tn_rate + fn_rate))
-    mcc = mcc_num / mcc_denom if mcc_denom > 0 else 0.0
+    mcc = _divide_or(mcc_num, mcc_denom, 0.0, mcc_denom > 0)
     
     # Likelihood ratios
-    lr_plus = sens / (1 - spec) if spec < 1 else np.inf
-    lr_minus = (1 - sens) / spec if spec > 0 else np.inf
-    dor = lr_plus / lr_minus if (lr_minus > 0 and lr_minus != np.inf) else np.inf
+    lr_plus = _divide_or(sens, 1 - spec, np.inf, spec < 1)
+    lr_minus = _divide_or(1 - sens, spec, np.inf, spec > 0)
+    dor = _divide_or(lr_plus, lr_minus, np.inf, (lr_minus > 0) & (lr_minus != np.inf))
     
     # Youden's J and G-mean
     youden_j = sens + spec - 1
@@ -384,24 +781,26 @@ def compute_threshold_metrics(g1: np.ndarray, g2: np.ndarray,
     # Cohen's kappa
     po = accuracy
     pe = base_rate * (tp_rate + fp_rate) + (1 - base_rate) * (tn_rate + fn_rate)
-    kappa = (po - pe) / (1 - pe) if pe < 1 else 0.0
+    kappa = _divide_or(po - pe, 1 - pe, 0.0, pe < 1)
     
-    # Post-test probabilities
+    # Post-test probabilities (infinite odds mean certainty)
     pre_odds = base_rate / (1 - base_rate)
-    post_odds_plus = pre_odds * lr_plus if lr_plus != np.inf else np.inf
-    post_odds_minus = pre_odds * lr_minus if lr_minus != np.inf else np.inf
+    post_odds_plus = np.where(lr_plus != np.inf, pre_odds * lr_plus, np.inf)
+    post_odds_minus = np.where(lr_minus != np.inf, pre_odds * lr_minus, np.inf)
     
-    post_prob_plus = post_odds_plus / (1 + post_odds_plus) if post_odds_plus != np.inf else 1.0
-    post_prob_minus = post_odds_minus / (1 + post_odds_minus) if post_odds_minus != np.inf else 1.0
+    post_prob_plus = _divide_or(post_odds_plus, 1 + post_odds_plus, 1.0,
+                                post_odds_plus != np.inf)
+    post_prob_minus = _divide_or(post_odds_minus, 1 + post_odds_minus, 1.0,
+                                 post_odds_minus != np.inf)
     
     # Delta NB
     odds = pt / (1 - pt)
     nb_predictor = (sens * base_rate) - ((1 - spec) * (1 - base_rate) * odds)
     nb_treat_all = base_rate - (1 - base_rate) * odds
     nb_treat_none = 0.0
-    delta_nb = nb_predictor - max(nb_treat_all, nb_treat_none)
+    delta_nb = nb_predictor - np.maximum(nb_treat_all, nb_treat_none)
     
-    return {
+    metrics = {
         'sensitivity': sens,
         'specificity': spec,
         'ppv': ppv,
@@ -420,3 +819,6 @@ def compute_threshold_metrics(g1: np.ndarray, g2: np.ndarray,
         'post_test_prob_minus': post_prob_minus,
         'delta_nb': delta_nb
     }
+    if scalar:
+        return {key: value[()] for key, value in metrics.items()}
+    return metrics
@@ -32,6 +32,8 @@ if not _SHOW_PLOTS:
 
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import stats
+from scipy.optimize import brentq
 from e2p import (
     E2PBinary,
     E2PContinuous,
@@ -40,7 +42,10 @@ from e2p import (
     e2p_continuous,
     e2p_continuous_deattenuated,
 )
-from e2p.utils import transform_for_target_reliability
+from e2p.utils import (transform_for_target_reliability, compute_roc_auc, compute_roc_auc_batched,
+                       compute_average_precision, convert_pts_to_thresholds, _KDEThresholdSearch,
+                       compute_pr_auc, convert_pt_to_threshold)
+from e2p._numba_kernels import _dca_net_benefit, _kde_thresholds
 
 # Set seed for reproducibility
 np.random.seed(42)
@@ -64,6 +69,92 @@ print(f"Variance ratio expected:  {expected_ratio:.4f}")
 assert np.isclose(var_ratio, expected_ratio, rtol=0.05), "Variance scaling check failed"
 print("✓ Transform variance scaling check passed")
 
+# Sweeping several targets at once matches transforming for each one
+r_sweep = [0.6, 0.75, 0.9]
+x_sweep = transform_for_target_reliability(x, r_cur, r_sweep, center="mean")
+assert x_sweep.shape == (len(r_sweep), len(x))
+for row, r_t in zip(x_sweep, r_sweep):
+    assert np.allclose(row, transform_for_target_reliability(x, r_cur, r_t, center="mean"))
+print("✓ Transform target sweep check passed")
+
+# Rank-sum and batched ROC-AUC match the pairwise definition, including ties
+_rng_auc = np.random.default_rng(0)
+g1_auc = np.round(_rng_auc.normal(0, 1, 60), 1)
+g2_auc = np.round(_rng_auc.normal(0.8, 1, 40), 1)
+assert np.allclose(
+    compute_roc_auc_batched(np.vstack([g1_auc, g1_auc[::-1]]), np.vstack([g2_auc, g2_auc[::-1]])),
+    compute_roc_auc(g1_auc, g2_auc), atol=1e-12
+)
+_pairwise_auc = np.mean(g2_auc[:, None] > g1_auc) + 0.5 * np.mean(g2_auc[:, None] == g1_auc)
+assert np.isclose(compute_roc_auc(g1_auc, g2_auc), _pairwise_auc, atol=1e-12)
+print("✓ Rank-sum ROC-AUC check passed")
+
+# Average precision at the sample prevalence equals the mean precision at each
+# case's score (ties included)
+_scores = np.concatenate([g1_auc, g2_auc])
+_labels = np.concatenate([np.zeros(len(g1_auc)), np.ones(len(g2_auc))])
+_ap_ref = np.mean([_labels[_scores >= s].mean() for s in g2_auc])
+_prev = len(g2_auc) / len(_scores)
+assert np.isclose(compute_average_precision(g1_auc, g2_auc, _prev), _ap_ref, atol=1e-12)
+print("✓ Average precision check passed")
+
+# One reusable threshold search gives the same thresholds as fresh searches at
+# every base rate
+_search = _KDEThresholdSearch(g1_auc, g2_auc)
+for _br in (0.1, 0.4):
+    assert np.array_equal(_search(_br, [0.1, 0.3]), convert_pts_to_thresholds(g1_auc, g2_auc, _br, [0.1, 0.3]))
+print("✓ KDE reuse check passed")
+
+# Compiled KDE root search body (pure-Python body of the Numba kernel) agrees
+# with gaussian_kde + brentq
+_rng_kde = np.random.default_rng(5)
+_g1_kde = _rng_kde.normal(0, 1, 60)
+_g2_kde = _rng_kde.normal(1, 1, 30)
+_kde1, _kde2 = stats.gaussian_kde(_g1_kde), stats.gaussian_kde(_g2_kde)
+_t_lo, _t_hi = -1.5, 2.0
+_pts_kde = np.array([0.05, 0.2, 0.4, 0.5])
+_got = _kde_thresholds(_kde1.dataset[0], np.sqrt(_kde1.covariance[0, 0]),
+                       _kde2.dataset[0], np.sqrt(_kde2.covariance[0, 0]),
+                       0.2, _pts_kde, _t_lo, _t_hi)
+
+
+def _posterior_minus_pt(t, pt):
+    f1, f2 = _kde1(t)[0], _kde2(t)[0]
+    denominator = f1 * 0.8 + f2 * 0.2
+    return 0.5 - pt if denominator < 1e-15 else f2 * 0.2 / denominator - pt
+
+
+_expected = [brentq(_posterior_minus_pt, _t_lo, _t_hi, args=(pt,)) for pt in _pts_kde]
+assert np.allclose(_got, _expected, rtol=0, atol=1e-9)
+print("✓ KDE threshold kernel check passed")
+
+# Gaussian fast paths agree with the rank/KDE estimates on large normal samples
+_rng_g = np.random.default_rng(3)
+_g1_norm = _rng_g.normal(3, 2, 20000)
+_g2_norm = _rng_g.normal(5, 2.5, 8000)
+assert np.isclose(compute_roc_auc(_g1_norm, _g2_norm, assume_gaussian=True),
+                  compute_roc_auc(_g1_norm, _g2_norm), atol=0.01)
+assert np.isclose(compute_pr_auc(_g1_norm, _g2_norm, 0.1, assume_gaussian=True),
+                  compute_pr_auc(_g1_norm, _g2_norm, 0.1), atol=0.02)
+assert np.isclose(convert_pt_to_threshold(_g1_norm, _g2_norm, 0.1, 0.2, assume_gaussian=True),
+                  convert_pt_to_threshold(_g1_norm, _g2_norm, 0.1, 0.2), atol=0.2)
+print("✓ Gaussian fast path check passed")
+
+# Fused DCA kernel body (pure-Python body of the Numba kernel) reproduces the
+# per-threshold net benefit
+_rng_dca = np.random.default_rng(3)
+_g1_dca = np.sort(np.round(_rng_dca.normal(0, 1, 200), 1))
+_g2_dca = np.sort(np.round(_rng_dca.normal(1, 1, 80), 1))
+_pts_dca = np.linspace(0.01, 0.99, 100)
+_t_dca = np.linspace(-2, 3, 100)
+_model_nb, _treat_all_nb = _dca_net_benefit(_g1_dca, _g2_dca, 0.2, _pts_dca, _t_dca)
+_odds = _pts_dca / (1 - _pts_dca)
+_sens = np.array([np.mean(_g2_dca >= t) for t in _t_dca])
+_spec = np.array([np.mean(_g1_dca < t) for t in _t_dca])
+assert np.allclose(_model_nb, _sens * 0.2 - (1 - _spec) * 0.8 * _odds, rtol=0, atol=1e-12)
+assert np.allclose(_treat_all_nb, 0.2 - 0.8 * _odds, rtol=0, atol=1e-12)
+print("✓ DCA net benefit kernel check passed")
+
 # Generate simulated data
 # Group 1 (controls): mean=0, sd=1
 # Group 2 (cases): mean=1.5, sd=1 (Cohen's d ≈ 1.5)
@@ -241,6 +332,17 @@ print(f"Delta NB:         {results_cont.delta_nb}")
 
 print("\n✓ Continuous test completed!")
 
+# Parallel bootstrap: reproducible for a fixed (random_state, workers) pair
+print("\nChecking parallel bootstrap (workers=2)...")
+results_par_a = e2p_continuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20,
+                               n_bootstrap=40, random_state=7, workers=2)
+results_par_b = e2p_continuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20,
+                               n_bootstrap=40, random_state=7, workers=2)
+assert results_par_a.cohens_d.estimate == results_cont.cohens_d.estimate, "workers must not change point estimates"
+assert results_par_a.roc_auc.ci_lower == results_par_b.roc_auc.ci_lower, "parallel bootstrap must be reproducible"
+assert results_par_a.roc_auc.ci_lower <= results_par_a.roc_auc.estimate <= results_par_a.roc_auc.ci_upper
+print("✓ Parallel bootstrap checks passed")
+
 # Create continuous plot
 e2p_cont_obj = E2PContinuous(
     X=X,
@@ -282,6 +384,81 @@ assert fig_cont_deatt is not fig_cont
 assert fig_cont_deatt._suptitle is not None and "Deattenuated" in fig_cont_deatt._suptitle.get_text()
 print("✓ Continuous deattenuation checks passed")
 
+# Result caching: repeat reliability queries reuse the stored results
+e2p_cont_cached = E2PContinuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20,
+                                n_bootstrap=0, cache_results=True)
+res_cached = e2p_cont_cached.compute_at_reliability(0.60, r_y_current=0.70, r_y_target=1.0)
+assert e2p_cont_cached.compute_at_reliability(0.60, r_y_current=0.70, r_y_target=1.0) is res_cached
+assert e2p_cont_cached.compute_at_reliability(0.80) is not res_cached
+prepared = e2p_cont_cached._prepare_reliability_groups(0.80, 1.0, None, None, "mean")
+assert e2p_cont_cached._prepare_reliability_groups(0.80, 1.0, None, None, "mean") is prepared
+print("✓ Result caching checks passed")
+
+# float32 inputs are kept as float32 unless a dtype is requested
+e2p_cont_f32 = E2PContinuous(X=X.astype(np.float32), Y=Y.astype(np.float32),
+                             base_rate=0.10, threshold_prob=0.20, n_bootstrap=0)
+assert e2p_cont_f32.X.dtype == np.float32 and e2p_cont_f32.Y.dtype == np.float32
+assert E2PContinuous(X=X.astype(np.float32), Y=Y, base_rate=0.10, threshold_prob=0.20,
+                     n_bootstrap=0, dtype=np.float64).X.dtype == np.float64
+assert E2PContinuous(X=[1, 2, 3, 4], Y=[1, 2, 3, 4], base_rate=0.5, threshold_prob=0.5,
+                     n_bootstrap=0).X.dtype == np.float64
+assert abs(e2p_cont_f32.compute().roc_auc.estimate - results_cont.roc_auc.estimate) < 1e-3
+for _r_y in ((None, None), (0.8, 1.0)):
+    _prep_alloc = e2p_cont_f32._prepare_reliability_groups(0.6, 0.9, *_r_y, "mean")
+    e2p_cont_f32._last_reliability = None
+    _prep_inplace = e2p_cont_f32._prepare_reliability_groups(0.6, 0.9, *_r_y, "mean", inplace=True)
+    e2p_cont_f32._last_reliability = None
+    for _a, _b in zip(_prep_alloc, _prep_inplace):
+        assert _a.dtype == _b.dtype == np.float32
+        assert np.array_equal(_a, _b)
+print("✓ float32 input checks passed")
+
+# Batched threshold sweep agrees with one-at-a-time compute_at_threshold
+e2p_cont_sweep = E2PContinuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20, n_bootstrap=0)
+sweep_pts = [0.10, 0.20, 0.40]
+sweep = e2p_cont_sweep.compute_at_thresholds(sweep_pts)
+assert sweep['sensitivity'].shape == (len(sweep_pts),)
+for i, pt in enumerate(sweep_pts):
+    single = e2p_cont_sweep.compute_at_threshold(pt)
+    for key, value in single.items():
+        assert np.isclose(sweep[key][i], value), f"compute_at_thresholds mismatch for {key} at p_t={pt}"
+print("✓ Batched threshold sweep checks passed")
+
+# Bootstrap draws come from a per-instance Generator; the global RNG is untouched
+global_state = np.random.get_state()
+res_rng_a = e2p_continuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20, n_bootstrap=20, random_state=3)
+assert np.array_equal(np.random.get_state()[1], global_state[1]), "random_state must not reseed np.random"
+res_rng_b = e2p_continuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20, n_bootstrap=20, random_state=3)
+assert res_rng_a.roc_auc.ci_lower == res_rng_b.roc_auc.ci_lower
+
+# Repeat calls on one seeded object reproduce, whatever ran in between
+e2p_cont_repeat = E2PContinuous(X=X, Y=Y, base_rate=0.20, threshold_prob=0.30,
+                                n_bootstrap=30, random_state=1)
+res_repeat_a = e2p_cont_repeat.compute()
+e2p_cont_repeat.compute_at_reliability(0.80)
+res_repeat_b = e2p_cont_repeat.compute()
+assert res_repeat_a.cohens_d.ci_lower == res_repeat_b.cohens_d.ci_lower
+assert res_repeat_a.cohens_d.ci_upper == res_repeat_b.cohens_d.ci_upper
+e2p_bin_repeat = E2PBinary(controls, cases, base_rate=0.10, threshold_prob=0.20,
+                           n_bootstrap=30, random_state=1)
+res_rel_a = e2p_bin_repeat.compute_at_reliability(0.70)
+e2p_bin_repeat.compute()
+res_rel_b = e2p_bin_repeat.compute_at_reliability(0.70)
+assert res_rel_a.roc_auc.ci_lower == res_rel_b.roc_auc.ci_lower
+print("✓ Generator-based RNG checks passed")
+
+# In-place reliability transform reuses one buffer and matches the allocating path
+e2p_cont_inplace = E2PContinuous(X=X, Y=Y, base_rate=0.10, threshold_prob=0.20, n_bootstrap=0)
+for r_target in (0.6, 0.9):
+    res_inplace = e2p_cont_inplace.compute_at_reliability(0.5, r_target, r_y_current=0.8, r_y_target=1.0, inplace=True)
+    res_alloc = e2p_cont_sweep.compute_at_reliability(0.5, r_target, r_y_current=0.8, r_y_target=1.0)
+    assert np.isclose(res_inplace.roc_auc.estimate, res_alloc.roc_auc.estimate)
+    assert np.isclose(res_inplace.cohens_d.estimate, res_alloc.cohens_d.estimate)
+out_buf = np.empty_like(X)
+assert transform_for_target_reliability(X, 0.5, 0.9, out=out_buf) is out_buf
+assert np.allclose(out_buf, transform_for_target_reliability(X, 0.5, 0.9))
+print("✓ In-place reliability transform checks passed")
+
 print("\n" + "=" * 60)
 print("All tests passed!")
 print("=" * 60)
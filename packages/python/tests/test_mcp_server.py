@@ -2,6 +2,10 @@
 
 import asyncio
 
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+
+from e2p import mcp_server
 from e2p.mcp_server import mcp
 
 
@@ -21,6 +25,8 @@ def _parameter_enum(tool, parameter):
 def test_mcp_exposes_the_documented_tools():
     assert set(_tools_by_name()) == {
         "parametric_binary",
+        "parametric_binary_batch",
+        "parametric_binary_stream",
         "parametric_continuous",
         "convert_effect_size",
         "compute_roc_auc",
@@ -39,6 +45,10 @@ def test_mcp_schema_exposes_valid_choice_parameters():
         tools["parametric_binary"],
         "view",
     ) == views
+    assert _parameter_enum(
+        tools["parametric_binary_batch"],
+        "view",
+    ) == views
     assert _parameter_enum(
         tools["parametric_continuous"],
         "view",
@@ -55,3 +65,64 @@ def test_mcp_schema_exposes_valid_choice_parameters():
         tools["find_threshold"],
         "metric",
     ) == {"youden", "f1"}
+
+
+def test_mcp_tool_results_are_memoized():
+    mcp_server.clear_caches()
+    first = mcp_server.parametric_binary(cohens_d=0.8, base_rate=0.1)
+    second = mcp_server.parametric_binary(cohens_d=0.8, base_rate=0.1)
+    assert first == second
+    assert first is not second
+    assert mcp_server._parametric_binary.cache_info().hits == 1
+
+    converted = mcp_server.convert_effect_size(0.7, "auc", "r", base_rate=0.2)
+    assert converted == mcp_server.convert_effect_size(0.7, "auc", "r", base_rate=0.2)
+    assert mcp_server._convert_effect_size.cache_info().hits == 1
+
+    mcp_server.clear_caches()
+    assert mcp_server._parametric_binary.cache_info().currsize == 0
+
+
+def test_parametric_binary_batch_matches_scalar_tool():
+    grid = [0.2, 0.5, 0.8, 0.5]
+    batch = mcp_server.parametric_binary_batch(cohens_d=grid, base_rate=0.1, icc1=0.8)
+    assert len(batch) == len(grid)
+    for d, row in zip(grid, batch):
+        assert row == mcp_server.parametric_binary(cohens_d=d, base_rate=0.1, icc1=0.8)
+
+
+def test_convert_effect_size_identity_skips_conversion():
+    assert mcp_server.convert_effect_size(0.7, "auc", "auc") == {
+        "input_value": 0.7,
+        "input_type": "auc",
+        "output_value": 0.7,
+        "output_type": "auc",
+        "cohens_d": None,
+    }
+    assert mcp_server.convert_effect_size(0.4, "d", "d")["cohens_d"] == 0.4
+
+
+def test_mcp_rejects_invalid_choices_before_calling_the_tool():
+    with pytest.raises(ToolError, match="literal_error"):
+        asyncio.run(mcp.call_tool("convert_effect_size", {"value": 0.5, "from_type": "bogus"}))
+    with pytest.raises(ToolError, match="literal_error"):
+        asyncio.run(mcp.call_tool("find_threshold", {"cohens_d": 0.5, "base_rate": 0.1, "metric": "mcc"}))
+
+
+def test_parametric_binary_stream_returns_columns():
+    class _ProgressRecorder:
+        def __init__(self):
+            self.reports = []
+
+        async def report_progress(self, progress, total=None, message=None):
+            self.reports.append((progress, total))
+
+    grid = [0.2, 0.5, 0.8]
+    ctx = _ProgressRecorder()
+    columns = asyncio.run(mcp_server.parametric_binary_stream(
+        cohens_d_values=grid, base_rate=0.1, ctx=ctx
+    ))
+    assert ctx.reports == [(1, 3), (2, 3), (3, 3)]
+    assert columns["cohens_d_true"] == grid
+    batch = mcp_server.parametric_binary_batch(cohens_d=grid, base_rate=0.1)
+    assert columns["roc_auc"] == [row["roc_auc"] for row in batch]
@@ -21,7 +21,9 @@ import pytest
 from scipy import stats
 
 from e2p import (
+    ParametricResults,
     e2p_parametric_binary,
+    e2p_parametric_binary_batch,
     e2p_parametric_continuous,
     compute_roc_auc_parametric,
     compute_pr_auc_parametric,
@@ -284,6 +286,13 @@ class TestAttenuation:
 
         # Perfect reliability should not attenuate
         assert np.isclose(attenuate_d(true_d, 1.0, 1.0, 1.0), true_d, rtol=1e-10)
+
+    def test_attenuate_d_array_kappa(self):
+        """An array of kappa values attenuates element-wise."""
+        kappas = np.array([0.5, 0.9])
+        expected = 0.8 * np.sqrt(np.sin(np.pi / 2 * kappas))
+        assert np.allclose(attenuate_d(0.8, kappas), expected, rtol=1e-10)
+        assert np.allclose(attenuate_d(0.8, kappas), [0.6727, 0.7951], atol=1e-4)
     
     def test_compute_sigma_from_icc(self):
         """Test sigma computation from ICC."""
@@ -341,6 +350,13 @@ class TestROCAUC:
         expected_auc = stats.norm.cdf(d_att / np.sqrt(2))
         computed_auc = compute_roc_auc_parametric(d, sigma1, sigma2)
         assert np.isclose(computed_auc, expected_auc, rtol=1e-10)
+    
+    def test_roc_auc_scalar_matches_array_path(self):
+        """Scalar math.erfc fast path agrees with the array path."""
+        d_values = np.array([-2.0, 0.0, 0.3, 0.8, 3.5])
+        array_aucs = compute_roc_auc_parametric(d_values, 1.0, 1.5)
+        scalar_aucs = [compute_roc_auc_parametric(float(d), 1.0, 1.5) for d in d_values]
+        np.testing.assert_allclose(scalar_aucs, array_aucs, rtol=1e-12)
 
 
 # =============================================================================
@@ -482,6 +498,32 @@ class TestParametricBinary:
         with pytest.raises(ValueError):
             e2p_parametric_binary(0.8, base_rate=0.1, icc1=0)  # icc must be > 0
 
+    @pytest.mark.parametrize('view', ['observed', 'true'])
+    def test_batch_matches_scalar(self, view):
+        """Vectorized batch results match the scalar entry point elementwise."""
+        d = np.array([-0.5, 0.0, 0.3, 0.8, 2.5])[:, None]
+        base_rate = np.array([0.02, 0.1, 0.5])[:, None, None]
+        icc1, icc2, kappa = 0.6, np.array([0.6, 0.9]), 0.8
+        batch = e2p_parametric_binary_batch(d, base_rate, 0.3, icc1, icc2, kappa, view=view)
+        assert batch['ppv'].shape == (3, 5, 2)
+
+        for idx in np.ndindex(batch['ppv'].shape):
+            i, j, k = idx
+            scalar = e2p_parametric_binary(
+                float(d[j, 0]), float(base_rate[i, 0, 0]), 0.3, icc1,
+                float(icc2[k]), kappa, view=view,
+            )
+            row = ParametricResults.from_record(batch[idx])
+            for name in batch.dtype.names:
+                assert getattr(row, name) == pytest.approx(getattr(scalar, name), rel=1e-7, abs=1e-9), name
+
+    def test_batch_input_validation(self):
+        """Batch entry point rejects any out-of-range element."""
+        with pytest.raises(ValueError):
+            e2p_parametric_binary_batch([0.5, 0.8], base_rate=[0.1, 1.0])
+        with pytest.raises(ValueError):
+            e2p_parametric_binary_batch(0.8, base_rate=0.1, icc1=[0.5, 0.0])
+
 
 class TestParametricContinuous:
     """Test e2p_parametric_continuous function (bivariate-normal model)."""
@@ -537,7 +579,136 @@ class TestParametricContinuous:
         
         # Perfect reliability should have better or equal performance
         assert perfect_results.roc_auc >= imperfect_results.roc_auc - 0.01
+    
+    def test_special_functions_match_scipy_stats(self):
+        """ndtr/ndtri-based BVN helpers agree with the scipy.stats.norm formulas."""
+        from e2p import bivariate
+        r, p, t = 0.5, 0.1, 1.3
+        c = stats.norm.ppf(1 - p)
+        sigma = np.sqrt(1 - r * r)
+        assert bivariate.class_cutoff(p) == pytest.approx(c, abs=1e-12)
+        assert bivariate.posterior_prob(r, p, t) == pytest.approx(
+            1 - stats.norm.cdf((c - r * t) / sigma), abs=1e-12
+        )
+        assert bivariate.threshold_from_pt(r, p, 0.3) == pytest.approx(
+            (c - sigma * stats.norm.ppf(0.7)) / r, abs=1e-12
+        )
+        y = np.linspace(-8, 8, 101)
+        np.testing.assert_allclose(bivariate._norm_pdf(y), stats.norm.pdf(y), rtol=0, atol=1e-12)
+        g = bivariate._class_mass_grids(r, p)
+        expected_pos = np.sum((1 - stats.norm.cdf(t, loc=g["pos_mean"], scale=sigma)) * g["pos_phi_w"])
+        assert bivariate.sens_spec(r, p, t)["sensitivity"] == pytest.approx(expected_pos / p, abs=1e-12)
+
+    def test_survival_tails_match_one_minus_cdf(self):
+        """Far-tail survival masses round like 1 - CDF (not CDF of the negated argument)."""
+        from e2p import bivariate
+        from e2p._numba_kernels import _survival_mass
+        r, p = 0.5, 0.1
+        c = stats.norm.ppf(1 - p)
+        sigma = np.sqrt(1 - r * r)
+        for t in (-20.0, -8.0, 8.0, 20.0):
+            assert bivariate.posterior_prob(r, p, t) == 1 - stats.norm.cdf((c - r * t) / sigma)
+        g = bivariate._class_mass_grids(r, p)
+        thresholds = np.array([-12.0, 6.0, 12.0])
+        expected = np.sum(
+            (1 - stats.norm.cdf(thresholds[:, None], loc=g["neg_mean"], scale=sigma)) * g["neg_phi_w"],
+            axis=1,
+        )
+        for mass in (bivariate._survival_mass(g["neg_mean"], g["neg_phi_w"], thresholds, sigma),
+                     _survival_mass(g["neg_mean"], g["neg_phi_w"], thresholds, sigma)):
+            np.testing.assert_allclose(mass, expected, rtol=1e-12, atol=0)
+    
+    def test_survival_mass_kernel_matches_numpy(self):
+        """Fused survival-mass kernel body agrees with the broadcast NumPy path."""
+        from e2p import bivariate
+        from e2p._numba_kernels import _survival_mass
+        g = bivariate._class_mass_grids(0.4, 0.2)
+        thresholds = np.linspace(-3, 3, 7)
+        expected = np.sum(
+            (1 - stats.norm.cdf(thresholds[:, None], loc=g["pos_mean"], scale=g["sigma"])) * g["pos_phi_w"],
+            axis=1,
+        )
+        np.testing.assert_allclose(
+            _survival_mass(g["pos_mean"], g["pos_phi_w"], thresholds, g["sigma"]),
+            expected, rtol=0, atol=1e-12,
+        )
 
+    def test_scalar_parametric_kernels_match_reference(self):
+        """Numba kernel bodies reproduce the pure-Python parametric routines."""
+        from e2p import _numba_kernels as kernels
+        from e2p.parametric import (
+            compute_binary_metrics, compute_pt_from_threshold, compute_threshold_from_pt,
+        )
+        for d, p, s1, s2 in [(0.8, 0.1, 1.0, 1.0), (1.5, 0.3, 1.2, 1.1), (-0.4, 0.6, 1.0, 1.4)]:
+            assert kernels._pt_from_threshold(d, 0.7, p, s1, s2) == pytest.approx(
+                compute_pt_from_threshold(d, 0.7, p, s1, s2), abs=1e-12
+            )
+            # Bisection stops at |p_t error| < 1e-8; the closed form is exact
+            assert kernels._threshold_from_pt(d, 0.25, p, s1, s2) == pytest.approx(
+                compute_threshold_from_pt(d, 0.25, p, s1, s2), abs=1e-5
+            )
+            metrics = compute_binary_metrics(d, p, 0.3, s1, s2)
+            assert kernels._threshold_objective(0.3, d, p, s1, s2, True) == pytest.approx(-metrics['f1'], abs=1e-12)
+            assert kernels._threshold_objective(0.3, d, p, s1, s2, False) == pytest.approx(-metrics['youden_j'], abs=1e-12)
+
+        # Reference: the original list/dict PR-AUC integration
+        d, p, s1, s2, n = 0.9, 0.15, 1.0, 1.3, 500
+        thresholds = np.linspace(max(0, d) + 6 * max(s1, s2), min(0, d) - 6 * max(s1, s2), n)
+        recall = 1 - stats.norm.cdf(thresholds, d, s2)
+        fpr = 1 - stats.norm.cdf(thresholds, 0, s1)
+        precision = p * recall / (p * recall + (1 - p) * fpr)
+        recall = np.concatenate([[0.0], recall, [1.0]])
+        precision = np.concatenate([[1.0], precision, [p]])
+        order = np.argsort(recall, kind="mergesort")
+        recall, keep = np.unique(recall[order], return_index=True)
+        precision = precision[order][keep]
+        expected = np.sum(np.diff(recall) * (precision[1:] + precision[:-1]) / 2)
+        assert kernels._pr_auc_normal(d, p, s1, s2, n) == pytest.approx(expected, abs=1e-9)
+
+    def test_closed_form_threshold_from_pt(self):
+        """The analytic p_t inversion recovers p_t exactly where it applies."""
+        from e2p import _numba_kernels as kernels
+        from e2p.parametric import (
+            _threshold_from_pt_closed_form, compute_pt_from_threshold, compute_threshold_from_pt,
+        )
+        for d, p, s1, s2 in [(0.8, 0.1, 1.0, 1.0), (1.5, 0.3, 1.0, 1.05), (0.4, 0.6, 1.2, 1.2)]:
+            for pt in (0.3, 0.5, 0.8):
+                t = _threshold_from_pt_closed_form(d, pt, p, s1, s2)
+                assert t is not None
+                assert compute_pt_from_threshold(d, t, p, s1, s2) == pytest.approx(pt, abs=1e-12)
+                assert compute_threshold_from_pt(d, pt, p, s1, s2) == t
+                assert kernels._threshold_from_pt(d, pt, p, s1, s2) == t
+        # d = 0 with equal variances: p_t is constant, left to bisection
+        assert _threshold_from_pt_closed_form(0.0, 0.3, 0.1, 1.0, 1.0) is None
+
+    def test_optimal_threshold_matches_dense_grid(self):
+        """Optimal thresholds reach the maximum of F1/Youden on a dense scipy.stats grid."""
+        from e2p import _numba_kernels as kernels
+        from e2p.parametric import find_optimal_threshold
+        cases = [
+            (0.8, 0.1, 1.0, 1.0), (1.5, 0.3, 1.0, 1.2), (0.3, 0.5, 1.1, 1.0),
+            # Unequal SDs: F1 has a flat left tail that stalls an unseeded search
+            (0.0, 0.1, 1.0, 3.0), (2.0, 0.1, 0.3, 2.0), (0.5, 0.01, 1.0, 3.0),
+        ]
+        for d, p, s1, s2 in cases:
+            grid = np.linspace(-8.0 * max(s1, s2), 8.0 * max(s1, s2) + d, 400001)
+            sens = stats.norm.sf(grid, d, s2)
+            spec = stats.norm.cdf(grid, 0, s1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ppv = sens * p / (sens * p + (1 - spec) * (1 - p))
+                f1 = 2 * ppv * sens / (ppv + sens)
+            for metric, objective in (('youden', sens + spec - 1), ('f1', f1)):
+                use_f1 = metric == 'f1'
+                kernel_t = kernels._optimal_threshold(d, p, s1, s2, use_f1)
+                numpy_t = find_optimal_threshold(d, p, s1, s2, metric)
+                assert kernel_t == pytest.approx(numpy_t, abs=1e-6)
+                best = np.nanmax(objective)
+                for t in (kernel_t, numpy_t):
+                    achieved = -kernels._threshold_objective(t, d, p, s1, s2, use_f1)
+                    assert achieved == pytest.approx(best, abs=1e-8)
+                if s1 == s2 or not use_f1:
+                    expected = grid[np.nanargmax(objective)]
+                    assert numpy_t == pytest.approx(expected, abs=1e-4)
 
 # =============================================================================
 # Cross-validation with empirical module